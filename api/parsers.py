@@ -1,45 +1,24 @@
 # api/parsers.py
 
-import pdfplumber # <-- The new, smart PDF module
-import openpyxl
-import docx
+from authentication.services.extraction_cache import file_digest, get_extracted_text, remember_extracted_text
+from authentication.services.extractors import extract_document_text
 import re # <-- Import regular expressions
 
-# --- FUNCTION 1: Read text from files (SMARTER PDF VERSION) ---
+# --- FUNCTION 1: Read text from files (PDF, DOCX, XLSX, TXT) ---
 def get_keywords_from_file(file_path):
     text = ""
     try:
-        if file_path.endswith('.pdf'):
-            # Use pdfplumber to read the PDF
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    # extract_text() is smarter and respects layout
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        
-        elif file_path.endswith('.xlsx'):
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            for sheet in wb.worksheets:
-                for row in sheet.iter_rows():
-                    row_text = ""
-                    for cell in row:
-                        if cell.value:
-                            row_text += str(cell.value) + " "
-                    text += row_text.strip() + "\n"
-                            
-        elif file_path.endswith('.docx'):
-            doc = docx.Document(file_path)
-            # 1. Read from paragraphs
-            for para in doc.paragraphs:
-                text += para.text + "\n" # Use newline
-            # 2. Read from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    row_text = ""
-                    for cell in row.cells:
-                        row_text += cell.text + " "
-                    text += row_text.strip() + "\n"
+        # Same bytes, same text: re-uploads are served from the extraction cache
+        digest = file_digest(file_path)
+        cached = get_extracted_text('keywords', digest)
+        if cached is not None:
+            print(f"Extracted {len(cached['text'])} chars from file (cached).")
+            return cached['text']
+
+        # PDF, DOCX, XLSX and text files all go through the shared extractor registry
+        text = extract_document_text(file_path) + "\n"
+
+        remember_extracted_text('keywords', digest, text)
                         
     except Exception as e:
         print(f"Error parsing file {file_path}: {e}")
@@ -9,6 +9,8 @@ from rest_framework.permissions import IsAdminUser  # <-- Use IsAdminUser
 from .models import SearchRequest
 from .serializers import SearchUploadSerializer
 from .tasks import extract_tags_from_request, process_tag_batch
+from authentication.listing import list_response
+from authentication.uploads import spooled_uploads
 
 class AdminUploadView(APIView):
     """
@@ -18,6 +20,7 @@ class AdminUploadView(APIView):
     parser_classes = (MultiPartParser, FormParser)
     #permission_classes = [IsAdminUser] # Only admins can access
 
+    @spooled_uploads()
     def post(self, request, *args, **kwargs):
         
         # 1. Validate the file upload
@@ -98,8 +101,8 @@ class VideoListView(APIView):
         # Order by created date (newest first)
         videos = videos.order_by('-id')
         
-        serializer = VideoResultSerializer(videos, many=True)
-        return Response(serializer.data)
+        # ?stream=json|ndjson writes rows as they are read, for large exports
+        return list_response(request, videos, VideoResultSerializer, streamable=True)
 
 
 class VideoDetailView(APIView):
@@ -1,6 +1,19 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def _ensure_search_index(sender, **kwargs):
+    from .services.search import ensure_search_index
+
+    ensure_search_index()
 
 
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authentication'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        # Table rebuilds during migrations drop the FTS triggers; recreate them.
+        post_migrate.connect(_ensure_search_index, sender=self)
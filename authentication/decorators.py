@@ -0,0 +1,39 @@
+import hashlib
+from functools import wraps
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .services.content_cache import version_timestamp
+
+
+def content_etag(request, version):
+    """Strong ETag for one representation of a resource at a content version."""
+    representation = f"{version}|{request.get_full_path()}|{request.META.get('HTTP_ACCEPT', '')}"
+    return quote_etag(hashlib.md5(representation.encode()).hexdigest())
+
+
+def conditional_on_content_version(get_version):
+    """
+    Answer If-None-Match / If-Modified-Since for an APIView ``get`` method.
+
+    ``get_version`` receives the view's URL kwargs and returns the content version
+    of the resource, so unchanged resources get a 304 without being serialized.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            version = get_version(**kwargs)
+            etag = content_etag(request, version)
+            last_modified = version_timestamp(version)
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = view_method(self, request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,39 @@
+from rest_framework.response import Response
+
+from .pagination import KeysetPagination
+from .serializers import SparseFieldsetMixin
+from .streaming import requested_stream_format, streaming_list_response
+
+
+def list_response(request, queryset, serializer_class, fieldset=None, streamable=False, limit=None):
+    """
+    Shared body of the listing endpoints, so they all project, stream and
+    paginate the same way:
+
+    * ``?fields=`` / ``?exclude=`` pick the serialized fields (and deferred
+      columns) for serializers with ``SparseFieldsetMixin``; pass ``fieldset``
+      when the view has already parsed it;
+    * ``?stream=json|ndjson`` streams every row when ``streamable``;
+    * ``?cursor=`` / ``?page_size=`` return a keyset-paginated page;
+    * otherwise the whole list is returned, capped at ``limit`` rows if given.
+    """
+    if issubclass(serializer_class, SparseFieldsetMixin):
+        if fieldset is None:
+            fieldset = serializer_class.fieldset_from_request(request)
+        queryset = serializer_class.project_queryset(queryset, **fieldset)
+    else:
+        fieldset = {}
+
+    if streamable:
+        stream_format = requested_stream_format(request)
+        if stream_format:
+            return streaming_list_response(queryset, serializer_class, stream_format, **fieldset)
+
+    paginator = KeysetPagination()
+    if paginator.is_requested(request):
+        page = paginator.paginate_queryset(queryset, request)
+        return paginator.get_paginated_response(serializer_class(page, many=True, **fieldset).data)
+
+    if limit is not None:
+        queryset = queryset[:limit]
+    return Response(serializer_class(queryset, many=True, **fieldset).data)
@@ -0,0 +1,18 @@
+"""
+Django management command to (re)build the content full-text search index.
+Run: python manage.py rebuild_search_index
+"""
+from django.core.management.base import BaseCommand
+
+from authentication.services.search import ensure_search_index
+
+
+class Command(BaseCommand):
+    help = 'Create the content search index if missing and repopulate it from the content tables'
+
+    def handle(self, *args, **options):
+        backend = ensure_search_index(rebuild=True)
+        if backend == 'like':
+            self.stdout.write(self.style.WARNING('No full-text backend available; search uses LIKE queries.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Search index rebuilt ({backend}).'))
@@ -0,0 +1,19 @@
+"""
+Django management command to rebuild the denormalized content counters.
+Run: python manage.py recount_content_counters [--course ID ...]
+"""
+from django.core.management.base import BaseCommand
+
+from authentication.services.counters import recount_content_counters
+
+
+class Command(BaseCommand):
+    help = 'Recount visible subjects/chapters/topics and approved videos on courses, subjects, syllabi and chapters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--course', type=int, action='append', dest='course_ids',
+                            help='Only recount this course (repeatable)')
+
+    def handle(self, *args, **options):
+        updated = recount_content_counters(options['course_ids'])
+        self.stdout.write(self.style.SUCCESS(f'Recounted content counters on {updated} rows.'))
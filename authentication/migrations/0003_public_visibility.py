@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:22
+
+from django.db import migrations, models
+
+
+def populate_public_visibility(apps, schema_editor):
+    visible = {'is_active': True, 'status': 'PUBLISHED'}
+    Subject = apps.get_model('authentication', 'Subject')
+    Syllabus = apps.get_model('authentication', 'Syllabus')
+    Chapter = apps.get_model('authentication', 'Chapter')
+    Topic = apps.get_model('authentication', 'Topic')
+
+    # Top-down, so each level can read the flag its parent just received.
+    Subject.objects.filter(course__is_active=True, course__status='PUBLISHED', **visible).update(is_publicly_visible=True)
+    Syllabus.objects.filter(subject__is_publicly_visible=True, **visible).update(is_publicly_visible=True)
+    Chapter.objects.filter(syllabus__is_publicly_visible=True, **visible).update(is_publicly_visible=True)
+    Topic.objects.filter(chapter__is_publicly_visible=True, **visible).update(is_publicly_visible=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_chapter_slug_course_slug_subject_slug_syllabus_slug_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chapter',
+            name='is_publicly_visible',
+            field=models.BooleanField(default=False, editable=False, help_text='Active and published here and at every ancestor level (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='is_publicly_visible',
+            field=models.BooleanField(default=False, editable=False, help_text='Active and published here and at every ancestor level (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='syllabus',
+            name='is_publicly_visible',
+            field=models.BooleanField(default=False, editable=False, help_text='Active and published here and at every ancestor level (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='topic',
+            name='is_publicly_visible',
+            field=models.BooleanField(default=False, editable=False, help_text='Active and published here and at every ancestor level (maintained automatically)'),
+        ),
+        migrations.AddIndex(
+            model_name='chapter',
+            index=models.Index(fields=['syllabus', 'is_publicly_visible', 'chapter_number'], name='authenticat_syllabu_e6e827_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='subject',
+            index=models.Index(fields=['course', 'is_publicly_visible', 'order'], name='authenticat_course__567ba2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='syllabus',
+            index=models.Index(fields=['subject', 'is_publicly_visible'], name='authenticat_subject_2a0a42_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='topic',
+            index=models.Index(fields=['chapter', 'is_publicly_visible', 'order'], name='authenticat_chapter_ebe62c_idx'),
+        ),
+        migrations.RunPython(populate_public_visibility, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0003_public_visibility'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='videoresult',
+            index=models.Index(fields=['-created_at', '-id'], name='authenticat_created_9c28e0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='videoresult',
+            index=models.Index(fields=['approval_status', '-created_at', '-id'], name='authenticat_approva_934542_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0004_videoresult_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyllabusArtifact',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField()),
+                ('payload', models.BinaryField()),
+                ('content_hash', models.CharField(help_text='SHA-256 of the uncompressed JSON', max_length=64)),
+                ('chapter_count', models.PositiveIntegerField(default=0)),
+                ('topic_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('published_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('syllabus', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='artifacts', to='authentication.syllabus')),
+            ],
+            options={
+                'ordering': ['syllabus', '-version'],
+                'constraints': [models.UniqueConstraint(fields=('syllabus', 'version'), name='uniq_syllabus_artifact_version')],
+            },
+        ),
+    ]
@@ -0,0 +1,108 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:44
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_content_counters(apps, schema_editor):
+    Course = apps.get_model('authentication', 'Course')
+    Subject = apps.get_model('authentication', 'Subject')
+    Syllabus = apps.get_model('authentication', 'Syllabus')
+    Chapter = apps.get_model('authentication', 'Chapter')
+    Topic = apps.get_model('authentication', 'Topic')
+    VideoResult = apps.get_model('authentication', 'VideoResult')
+
+    def count(model, path, **filters):
+        rows = (
+            model.objects.filter(**{path: OuterRef('pk')}, **filters)
+            .order_by().values(path).annotate(total=Count('pk')).values('total')
+        )
+        return Coalesce(Subquery(rows, output_field=IntegerField()), Value(0))
+
+    visible = {'is_publicly_visible': True}
+    approved = {'approval_status': 'APPROVED', 'topic__is_publicly_visible': True}
+    Chapter.objects.update(
+        topic_count=count(Topic, 'chapter', **visible),
+        approved_video_count=count(VideoResult, 'topic__chapter', **approved),
+    )
+    for model, path in ((Syllabus, 'syllabus'), (Subject, 'syllabus__subject'), (Course, 'syllabus__subject__course')):
+        fields = {
+            'chapter_count': count(Chapter, path, **visible),
+            'topic_count': count(Topic, f'chapter__{path}', **visible),
+            'approved_video_count': count(VideoResult, f'topic__chapter__{path}', **approved),
+        }
+        if model is Course:
+            fields['subject_count'] = count(Subject, 'course', **visible)
+        model.objects.update(**fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0005_syllabus_artifact'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chapter',
+            name='approved_video_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Approved videos on publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='chapter',
+            name='topic_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='approved_video_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Approved videos on publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='chapter_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible chapters below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='subject_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible subjects (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='topic_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='approved_video_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Approved videos on publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='chapter_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible chapters below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='subject',
+            name='topic_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='syllabus',
+            name='approved_video_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Approved videos on publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='syllabus',
+            name='chapter_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible chapters below this node (maintained automatically)'),
+        ),
+        migrations.AddField(
+            model_name='syllabus',
+            name='topic_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Publicly visible topics below this node (maintained automatically)'),
+        ),
+        migrations.RunPython(populate_content_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:51
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0006_content_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SyllabusImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file_name', models.CharField(max_length=255)),
+                ('source', models.BinaryField(blank=True, null=True)),
+                ('options', models.JSONField(blank=True, default=dict, help_text='Syllabus fields: title, academic_year, description, status, is_active')),
+                ('status', models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed')], default='QUEUED', max_length=20)),
+                ('phase', models.CharField(choices=[('QUEUED', 'Waiting for a worker'), ('EXTRACTING', 'Extracting text'), ('PARSING', 'Parsing chapters and topics'), ('IMPORTING', 'Creating syllabus rows'), ('DONE', 'Done')], default='QUEUED', max_length=20)),
+                ('pages_total', models.PositiveIntegerField(blank=True, null=True)),
+                ('pages_processed', models.PositiveIntegerField(default=0)),
+                ('chapters_created', models.PositiveIntegerField(default=0)),
+                ('topics_created', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('task_id', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('subject', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='import_jobs', to='authentication.subject')),
+                ('syllabus', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='authentication.syllabus')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0007_syllabus_import_job'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='syllabusimportjob',
+            name='source',
+        ),
+        migrations.AddField(
+            model_name='syllabusimportjob',
+            name='upload',
+            field=models.FileField(blank=True, upload_to='syllabus_imports/'),
+        ),
+    ]
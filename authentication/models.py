@@ -11,17 +11,95 @@ from . import enums
 from .managers import CustomUserManager
 
 
+def _base_slug(instance, source_value):
+    return slugify(source_value) or f'{instance.__class__.__name__.lower()}-{instance.pk or "item"}'
+
+
+SLUG_PREFIX_BATCH_SIZE = 50
+
+
+def allocate_unique_slugs(model_cls, items, slug_field_name='slug'):
+    """
+    Reserve unique slugs for a batch of ``(instance, source_value)`` pairs.
+
+    Existing slugs are read with ``slug__startswith`` prefix queries (distinct
+    bases OR-ed together, up to ``SLUG_PREFIX_BATCH_SIZE`` per query), and
+    suffixes (``base-2``, ``base-3``, ...) are picked in memory, so the number
+    of queries does not depend on how many slugs collide. Each instance gets
+    its slug assigned; the slugs are also returned in order.
+    """
+    bases = [_base_slug(instance, source_value) for instance, source_value in items]
+    own_pks = [instance.pk for instance, _ in items if instance.pk is not None]
+
+    # One shared set, so a suffixed slug for one base never equals another base.
+    taken = set()
+    distinct_bases = list(dict.fromkeys(bases))
+    for start in range(0, len(distinct_bases), SLUG_PREFIX_BATCH_SIZE):
+        prefixes = models.Q()
+        for base in distinct_bases[start:start + SLUG_PREFIX_BATCH_SIZE]:
+            prefixes |= models.Q(**{f'{slug_field_name}__startswith': base})
+        existing = model_cls.objects.filter(prefixes)
+        if own_pks:
+            existing = existing.exclude(pk__in=own_pks)
+        taken.update(existing.values_list(slug_field_name, flat=True))
+
+    slugs = []
+    next_counter = {}
+    for (instance, _), base in zip(items, bases):
+        counter = next_counter.get(base, 1)
+        slug_candidate = base if counter == 1 else f'{base}-{counter}'
+        while slug_candidate in taken:
+            counter += 1
+            slug_candidate = f'{base}-{counter}'
+        taken.add(slug_candidate)
+        next_counter[base] = counter
+        setattr(instance, slug_field_name, slug_candidate)
+        slugs.append(slug_candidate)
+    return slugs
+
+
 def _build_unique_slug(instance, source_value, slug_field_name='slug'):
     """Generate a unique slug for a model instance."""
-    base_slug = slugify(source_value) or f'{instance.__class__.__name__.lower()}-{instance.pk or "item"}'
-    slug_candidate = base_slug
-    counter = 1
+    return allocate_unique_slugs(instance.__class__, [(instance, source_value)], slug_field_name)[0]
+
+
+def _sync_public_visibility(instance, save_kwargs):
+    """
+    Recompute ``is_publicly_visible`` for a content node about to be saved.
+
+    Returns True when an existing node flipped, meaning its descendants need a
+    bulk refresh once the save has gone through.
+    """
+    from .services.visibility import compute_public_visibility
+
+    previous = instance.is_publicly_visible
+    instance.is_publicly_visible = compute_public_visibility(instance)
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None:
+        save_kwargs['update_fields'] = {*update_fields, 'is_publicly_visible'}
+    # +1 / -1 when the node starts or stops counting towards its ancestors' counters.
+    if instance._state.adding:
+        instance._visibility_delta = int(instance.is_publicly_visible)
+    else:
+        instance._visibility_delta = int(instance.is_publicly_visible) - int(previous)
+    return not instance._state.adding and previous != instance.is_publicly_visible
+
+
+def _cascade_and_refresh(instance, visibility_changed):
+    """
+    After saving a content node: cascade a deactivation to its descendants and,
+    when the node flipped, refresh their visibility. A cascade deferred to a
+    task refreshes visibility there, so the request does not rewrite the subtree.
+    """
+    from .services.cascade import cascade_deactivate
+    from .services.visibility import refresh_public_visibility
+
+    # Cascade soft-delete so inactive nodes never expose active descendants.
+    instance.cascade_result = None if instance.is_active else cascade_deactivate(instance)
+    deferred = instance.cascade_result is not None and instance.cascade_result.deferred
+    if visibility_changed and not deferred:
+        refresh_public_visibility(instance)
 
-    model_cls = instance.__class__
-    while model_cls.objects.filter(**{slug_field_name: slug_candidate}).exclude(pk=instance.pk).exists():
-        counter += 1
-        slug_candidate = f'{base_slug}-{counter}'
-    return slug_candidate
 
 class User(AbstractUser):
     username = None
@@ -281,6 +359,10 @@ class Course(models.Model):
         db_index=True,
     )
     is_active = models.BooleanField(default=True, db_index=True)
+    subject_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible subjects (maintained automatically)")
+    chapter_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible chapters below this node (maintained automatically)")
+    topic_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible topics below this node (maintained automatically)")
+    approved_video_count = models.PositiveIntegerField(default=0, editable=False, help_text="Approved videos on publicly visible topics below this node (maintained automatically)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -294,16 +376,15 @@ class Course(models.Model):
     def __str__(self):
         return f"{self.title} ({self.get_grade_display()})"
 
+    def slug_source(self):
+        return self.title
+
     def save(self, *args, **kwargs):
+        adding = self._state.adding
         if not self.slug:
-            self.slug = _build_unique_slug(self, self.title)
+            self.slug = _build_unique_slug(self, self.slug_source())
         super().save(*args, **kwargs)
-        if not self.is_active:
-            # Cascade soft-delete so inactive courses never expose active descendants.
-            Subject.objects.filter(course=self).update(is_active=False)
-            Syllabus.objects.filter(subject__course=self).update(is_active=False)
-            Chapter.objects.filter(syllabus__subject__course=self).update(is_active=False)
-            Topic.objects.filter(chapter__syllabus__subject__course=self).update(is_active=False)
+        _cascade_and_refresh(self, visibility_changed=not adding)
 
 
 class Syllabus(models.Model):
@@ -328,6 +409,14 @@ class Syllabus(models.Model):
         db_index=True,
     )
     is_active = models.BooleanField(default=True, db_index=True)
+    is_publicly_visible = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Active and published here and at every ancestor level (maintained automatically)",
+    )
+    chapter_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible chapters below this node (maintained automatically)")
+    topic_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible topics below this node (maintained automatically)")
+    approved_video_count = models.PositiveIntegerField(default=0, editable=False, help_text="Approved videos on publicly visible topics below this node (maintained automatically)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -343,19 +432,21 @@ class Syllabus(models.Model):
         indexes = [
             models.Index(fields=['subject', 'is_active']),
             models.Index(fields=['academic_year']),
+            models.Index(fields=['subject', 'is_publicly_visible']),
         ]
     
     def __str__(self):
         return f"{self.subject.course.title} - {self.title} ({self.academic_year})"
 
+    def slug_source(self):
+        return f'{self.subject.name}-{self.title}-{self.academic_year}'
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            slug_source = f'{self.subject.name}-{self.title}-{self.academic_year}'
-            self.slug = _build_unique_slug(self, slug_source)
+            self.slug = _build_unique_slug(self, self.slug_source())
+        visibility_changed = _sync_public_visibility(self, kwargs)
         super().save(*args, **kwargs)
-        if not self.is_active:
-            Chapter.objects.filter(syllabus=self).update(is_active=False)
-            Topic.objects.filter(chapter__syllabus=self).update(is_active=False)
+        _cascade_and_refresh(self, visibility_changed)
 
 
 class Subject(models.Model):
@@ -381,6 +472,14 @@ class Subject(models.Model):
         db_index=True,
     )
     is_active = models.BooleanField(default=True, db_index=True)
+    is_publicly_visible = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Active and published here and at every ancestor level (maintained automatically)",
+    )
+    chapter_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible chapters below this node (maintained automatically)")
+    topic_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible topics below this node (maintained automatically)")
+    approved_video_count = models.PositiveIntegerField(default=0, editable=False, help_text="Approved videos on publicly visible topics below this node (maintained automatically)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -394,19 +493,21 @@ class Subject(models.Model):
         ]
         indexes = [
             models.Index(fields=['course', 'is_active', 'order']),
+            models.Index(fields=['course', 'is_publicly_visible', 'order']),
         ]
     
     def __str__(self):
         return self.name
 
+    def slug_source(self):
+        return f'{self.course.title}-{self.name}'
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = _build_unique_slug(self, f'{self.course.title}-{self.name}')
+            self.slug = _build_unique_slug(self, self.slug_source())
+        visibility_changed = _sync_public_visibility(self, kwargs)
         super().save(*args, **kwargs)
-        if not self.is_active:
-            Syllabus.objects.filter(subject=self).update(is_active=False)
-            Chapter.objects.filter(syllabus__subject=self).update(is_active=False)
-            Topic.objects.filter(chapter__syllabus__subject=self).update(is_active=False)
+        _cascade_and_refresh(self, visibility_changed)
 
 
 class Chapter(models.Model):
@@ -431,6 +532,13 @@ class Chapter(models.Model):
         db_index=True,
     )
     is_active = models.BooleanField(default=True, db_index=True)
+    is_publicly_visible = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Active and published here and at every ancestor level (maintained automatically)",
+    )
+    topic_count = models.PositiveIntegerField(default=0, editable=False, help_text="Publicly visible topics below this node (maintained automatically)")
+    approved_video_count = models.PositiveIntegerField(default=0, editable=False, help_text="Approved videos on publicly visible topics below this node (maintained automatically)")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -444,17 +552,21 @@ class Chapter(models.Model):
         ]
         indexes = [
             models.Index(fields=['syllabus', 'is_active', 'chapter_number']),
+            models.Index(fields=['syllabus', 'is_publicly_visible', 'chapter_number']),
         ]
     
     def __str__(self):
         return f"Ch {self.chapter_number}: {self.title}"
 
+    def slug_source(self):
+        return f'{self.syllabus.title}-{self.chapter_number}-{self.title}'
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = _build_unique_slug(self, f'{self.syllabus.title}-{self.chapter_number}-{self.title}')
+            self.slug = _build_unique_slug(self, self.slug_source())
+        visibility_changed = _sync_public_visibility(self, kwargs)
         super().save(*args, **kwargs)
-        if not self.is_active:
-            Topic.objects.filter(chapter=self).update(is_active=False)
+        _cascade_and_refresh(self, visibility_changed)
 
 
 class Topic(models.Model):
@@ -497,6 +609,11 @@ class Topic(models.Model):
         db_index=True,
     )
     is_active = models.BooleanField(default=True, db_index=True)
+    is_publicly_visible = models.BooleanField(
+        default=False,
+        editable=False,
+        help_text="Active and published here and at every ancestor level (maintained automatically)",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
@@ -511,17 +628,105 @@ class Topic(models.Model):
         indexes = [
             models.Index(fields=['chapter', 'is_active', 'order']),
             models.Index(fields=['status']),
+            models.Index(fields=['chapter', 'is_publicly_visible', 'order']),
         ]
     
     def __str__(self):
         return self.title
 
+    def slug_source(self):
+        return f'{self.chapter.title}-{self.order}-{self.title}'
+
     def save(self, *args, **kwargs):
         if not self.slug:
-            self.slug = _build_unique_slug(self, f'{self.chapter.title}-{self.order}-{self.title}')
+            self.slug = _build_unique_slug(self, self.slug_source())
+        _sync_public_visibility(self, kwargs)
         super().save(*args, **kwargs)
 
 
+class SyllabusArtifact(models.Model):
+    """
+    Immutable, versioned snapshot of a published syllabus subtree.
+
+    ``payload`` is zlib-compressed JSON holding the public tree and the public
+    chapter/topic listings, compiled by the publish action. Public readers are
+    served the latest version instead of querying the live chapter/topic tables.
+    """
+    syllabus = models.ForeignKey(Syllabus, on_delete=models.CASCADE, related_name='artifacts')
+    version = models.PositiveIntegerField()
+    payload = models.BinaryField()
+    content_hash = models.CharField(max_length=64, help_text="SHA-256 of the uncompressed JSON")
+    chapter_count = models.PositiveIntegerField(default=0)
+    topic_count = models.PositiveIntegerField(default=0)
+    published_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['syllabus', '-version']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['syllabus', 'version'],
+                name='uniq_syllabus_artifact_version',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.syllabus.title} v{self.version}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Published syllabus artifacts are immutable")
+        super().save(*args, **kwargs)
+
+
+class SyllabusImportJob(models.Model):
+    """
+    A syllabus file imported in the background.
+
+    The upload is stored in ``upload`` until the worker has read it; ``phase``,
+    ``pages_processed`` and the created-row counts are updated as the import
+    runs so admins can poll the job instead of holding the request open.
+    """
+    STATUS_CHOICES = [
+        ('QUEUED', 'Queued'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    ]
+    PHASE_CHOICES = [
+        ('QUEUED', 'Waiting for a worker'),
+        ('EXTRACTING', 'Extracting text'),
+        ('PARSING', 'Parsing chapters and topics'),
+        ('IMPORTING', 'Creating syllabus rows'),
+        ('DONE', 'Done'),
+    ]
+
+    subject = models.ForeignKey(Subject, on_delete=models.CASCADE, related_name='import_jobs')
+    file_name = models.CharField(max_length=255)
+    upload = models.FileField(upload_to='syllabus_imports/', blank=True)
+    options = models.JSONField(default=dict, blank=True, help_text="Syllabus fields: title, academic_year, description, status, is_active")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='QUEUED')
+    phase = models.CharField(max_length=20, choices=PHASE_CHOICES, default='QUEUED')
+    pages_total = models.PositiveIntegerField(null=True, blank=True)
+    pages_processed = models.PositiveIntegerField(default=0)
+    chapters_created = models.PositiveIntegerField(default=0)
+    topics_created = models.PositiveIntegerField(default=0)
+    syllabus = models.ForeignKey(Syllabus, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    error = models.TextField(blank=True)
+    task_id = models.CharField(max_length=255, blank=True)
+    created_by = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL, related_name='+')
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"Import of {self.file_name} ({self.status})"
+
+
 class VideoResult(models.Model):
     """
     YouTube video results from topic searches
@@ -553,6 +758,11 @@ class VideoResult(models.Model):
     class Meta:
         ordering = ['-view_count']
         unique_together = ['topic', 'video_id']
+        indexes = [
+            # Keyset pagination of the admin video list walks (created_at, id).
+            models.Index(fields=['-created_at', '-id']),
+            models.Index(fields=['approval_status', '-created_at', '-id']),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.get_approval_status_display()})"
@@ -0,0 +1,133 @@
+import base64
+import json
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination:
+    """
+    Opt-in cursor pagination over a queryset's ordering plus ``id``.
+
+    Pages are fetched with a ``WHERE (ordering..., id) > last row`` filter rather
+    than an OFFSET, so every page costs the same however deep the client reads.
+    Listing endpoints keep returning a plain list unless ``cursor`` or
+    ``page_size`` is passed; paginated responses look like
+    ``{"next": <url or null>, "results": [...]}``.
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    default_page_size = 50
+    max_page_size = 500
+
+    def __init__(self):
+        self.request = None
+        self.next_cursor = None
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        raw = request.query_params.get(self.page_size_query_param)
+        if raw is None:
+            return self.default_page_size
+        try:
+            page_size = int(raw)
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Must be an integer"})
+        if page_size < 1:
+            raise ValidationError({self.page_size_query_param: "Must be at least 1"})
+        return min(page_size, self.max_page_size)
+
+    @staticmethod
+    def get_ordering(queryset):
+        """Ordering fields of the queryset, always ending with a unique ``id`` tiebreak."""
+        ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+        if not all(isinstance(field, str) for field in ordering):
+            raise TypeError("KeysetPagination only supports field-name orderings")
+        ordering = [{'pk': 'id', '-pk': '-id'}.get(field, field) for field in ordering]
+        if not any(field.lstrip('-') == 'id' for field in ordering):
+            # Break ties in the direction of the last key so a composite index still applies.
+            ordering.append('-id' if ordering and ordering[-1].startswith('-') else 'id')
+        return ordering
+
+    def decode_cursor(self, cursor, ordering):
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        except (ValueError, UnicodeDecodeError):
+            raise ValidationError({self.cursor_query_param: "Invalid cursor"})
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise ValidationError({self.cursor_query_param: "Invalid cursor"})
+        return values
+
+    @staticmethod
+    def encode_cursor(values):
+        payload = json.dumps(values, default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def keyset_filter(ordering, values):
+        """(a, b, id) after (x, y, z) == a>x OR (a=x AND b>y) OR (a=x AND b=y AND id>z)."""
+        clauses = []
+        for position, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            equal_prefix = {ordering[i].lstrip('-'): values[i] for i in range(position)}
+            clauses.append(Q(**equal_prefix, **{f'{name}__{lookup}': values[position]}))
+        return reduce(or_, clauses)
+
+    def paginate_queryset(self, queryset, request):
+        self.request = request
+        ordering = self.get_ordering(queryset)
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*ordering)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            queryset = queryset.filter(self.keyset_filter(ordering, self.decode_cursor(cursor, ordering)))
+
+        rows = list(queryset[:page_size + 1])
+        page = rows[:page_size]
+        if len(rows) > page_size:
+            last = page[-1]
+            self.next_cursor = self.encode_cursor([getattr(last, field.lstrip('-')) for field in ordering])
+        return page
+
+    @staticmethod
+    def _row_after(row, ordering, values):
+        for field, value in zip(ordering, values):
+            current = row[field.lstrip('-')]
+            if current != value:
+                return current < value if field.startswith('-') else current > value
+        return False
+
+    def paginate_rows(self, rows, request, ordering):
+        """
+        Same pages and cursors as ``paginate_queryset``, over dict rows that are
+        already sorted by ``ordering`` (e.g. listings read from a published artifact).
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, ordering)
+            rows = [row for row in rows if self._row_after(row, ordering, values)]
+
+        page = rows[:page_size]
+        if len(rows) > page_size:
+            self.next_cursor = self.encode_cursor([page[-1][field.lstrip('-')] for field in ordering])
+        return page
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({'next': self.get_next_link(), 'results': data})
@@ -0,0 +1,112 @@
+"""
+Per-endpoint SQL query budgets with N+1 detection.
+
+Views declare how many queries a request may cost::
+
+    class TopicListCreateView(APIView):
+        @query_budget(3)
+        def get(self, request): ...
+
+The budget only runs when ``settings.QUERY_BUDGET_MODE`` is set:
+
+* ``"raise"`` (tests): exceeding the budget, or issuing the same query shape
+  ``QUERY_BUDGET_REPEAT_THRESHOLD`` times, raises ``QueryBudgetExceeded``.
+* ``"log"`` (optional at runtime): the same findings are logged as warnings
+  and the response carries an ``X-Query-Count`` header.
+
+``record_queries`` and ``repeated_query_shapes`` can also be used directly
+in tests.
+"""
+import logging
+import re
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT_THRESHOLD = 5
+
+_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_IN_LIST_RE = re.compile(r"IN \((?:%s|\?)(?:, (?:%s|\?))*\)")
+_SPACE_RE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_shape(sql):
+    """SQL with literals, parameters and IN-lists collapsed, so per-row repeats compare equal."""
+    shape = _LITERAL_RE.sub('?', sql)
+    shape = _IN_LIST_RE.sub('IN (...)', shape)
+    return _SPACE_RE.sub(' ', shape).strip()
+
+
+class QueryLog:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    def __len__(self):
+        return len(self.queries)
+
+
+@contextmanager
+def record_queries(using='default'):
+    """Collect the SQL of every query run on ``using`` inside the block, DEBUG or not."""
+    log = QueryLog()
+    with connections[using].execute_wrapper(log):
+        yield log
+
+
+def repeated_query_shapes(queries, threshold=None):
+    """{shape: count} for query shapes issued at least ``threshold`` times: the N+1 suspects."""
+    if threshold is None:
+        threshold = getattr(settings, 'QUERY_BUDGET_REPEAT_THRESHOLD', DEFAULT_REPEAT_THRESHOLD)
+    counts = Counter(query_shape(sql) for sql in queries)
+    return {shape: count for shape, count in counts.items() if count >= threshold}
+
+
+def budget_problems(log, max_queries, threshold=None):
+    problems = []
+    if len(log) > max_queries:
+        problems.append(f"{len(log)} queries, budget is {max_queries}")
+    for shape, count in repeated_query_shapes(log.queries, threshold).items():
+        problems.append(f"N+1 suspect, {count}x: {shape[:200]}")
+    return problems
+
+
+def query_budget(max_queries):
+    """
+    Declare the query budget of an APIView method (see module docstring).
+    Put it above other decorators so their queries are counted too.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            mode = getattr(settings, 'QUERY_BUDGET_MODE', None)
+            if not mode:
+                return view_method(self, request, *args, **kwargs)
+
+            with record_queries() as log:
+                response = view_method(self, request, *args, **kwargs)
+
+            problems = budget_problems(log, max_queries)
+            if problems:
+                message = f"{type(self).__name__}.{request.method} {request.path}: " + "; ".join(problems)
+                if mode == 'raise':
+                    raise QueryBudgetExceeded(message)
+                logger.warning("Query budget exceeded: %s", message)
+            response['X-Query-Count'] = str(len(log))
+            return response
+        wrapper.query_budget = max_queries
+        return wrapper
+    return decorator
@@ -0,0 +1,21 @@
+import json
+
+from django.http import HttpResponse
+from django.utils.functional import cached_property
+
+
+class PrerenderedJSONResponse(HttpResponse):
+    """
+    Response for JSON that was already rendered (e.g. a cached snapshot).
+
+    The bytes are sent as-is; ``data`` mirrors DRF's ``Response.data`` for
+    callers that want the decoded payload.
+    """
+
+    def __init__(self, content=b'', **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content, **kwargs)
+
+    @cached_property
+    def data(self):
+        return json.loads(self.content)
@@ -1,6 +1,6 @@
 
 from rest_framework import serializers
-from .models import User, UserProfile, Plan, PlanPricing, Subscription, ProfileSubscription, Course, Syllabus, Subject, Chapter, Topic, Task, TaskItem, TaskVideo, TaskQuiz, TaskGame, TaskActivity,VideoResult
+from .models import User, UserProfile, Plan, PlanPricing, Subscription, ProfileSubscription, Course, Syllabus, Subject, Chapter, Topic, Task, TaskItem, TaskVideo, TaskQuiz, TaskGame, TaskActivity,VideoResult, SyllabusImportJob
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     password2 = serializers.CharField(write_only=True, required=True, label="Confirm Password")
@@ -243,7 +243,90 @@ class SubscriptionPriceSerializer(serializers.Serializer):
 
 # ==================== COURSE SERIALIZERS ===================
 
-class CourseSerializer(serializers.ModelSerializer):
+class SparseFieldsetMixin:
+    """
+    Lets a ModelSerializer be trimmed with ``?fields=a,b`` or ``?exclude=c``.
+
+    ``project_queryset`` defers the model columns that no kept field reads, so
+    large TEXT/JSON columns of omitted fields are never loaded. Fields whose
+    columns cannot be inferred from their ``source`` (method fields, display
+    helpers) list them in ``Meta.sparse_field_dependencies``; relations a field
+    walks go in ``Meta.sparse_field_select_related``.
+    """
+    fields_query_param = 'fields'
+    exclude_query_param = 'exclude'
+
+    def __init__(self, *args, fields=None, exclude=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name in self._omitted_fields(fields, exclude):
+            self.fields.pop(name)
+
+    @classmethod
+    def _declared_names(cls):
+        return list(cls.Meta.fields)
+
+    @classmethod
+    def _omitted_fields(cls, fields=None, exclude=None):
+        names = cls._declared_names()
+        omitted = set()
+        if fields is not None:
+            omitted |= set(names) - set(fields)
+        if exclude:
+            omitted |= set(exclude)
+        return [name for name in names if name in omitted]
+
+    @classmethod
+    def fieldset_from_request(cls, request):
+        """Parse ``?fields=`` / ``?exclude=`` into serializer kwargs; unknown names are a 400."""
+        fieldset = {}
+        known = set(cls._declared_names())
+        for param, key in ((cls.fields_query_param, 'fields'), (cls.exclude_query_param, 'exclude')):
+            raw = request.query_params.get(param)
+            if raw is None:
+                continue
+            names = [name.strip() for name in raw.split(',') if name.strip()]
+            unknown = [name for name in names if name not in known]
+            if unknown:
+                raise serializers.ValidationError({param: f"Unknown field(s): {', '.join(unknown)}"})
+            fieldset[key] = names
+        return fieldset
+
+    @classmethod
+    def project_queryset(cls, queryset, fields=None, exclude=None):
+        """
+        Defer every concrete column that the kept fields (and the ordering) do
+        not need, and join the relations listed in ``Meta.sparse_field_select_related``
+        for kept fields.
+        """
+        omitted = cls._omitted_fields(fields, exclude)
+        kept = [name for name in cls._declared_names() if name not in omitted]
+
+        relations = getattr(cls.Meta, 'sparse_field_select_related', {})
+        joins = [relations[name] for name in kept if name in relations]
+        if joins:
+            queryset = queryset.select_related(*joins)
+        if not omitted:
+            return queryset
+
+        dependencies = getattr(cls.Meta, 'sparse_field_dependencies', {})
+        declared = cls._declared_fields
+        needed = {field.lstrip('-').split('__')[0] for field in queryset.query.order_by}
+        if isinstance(queryset.query.select_related, dict):
+            needed.update(queryset.query.select_related)
+        for name in kept:
+            needed.update(dependencies.get(name, ()))
+            source = declared[name].source if name in declared else None
+            needed.add((source or name).split('.')[0])
+
+        model = cls.Meta.model
+        deferrable = [
+            field.name for field in model._meta.concrete_fields
+            if not field.primary_key and field.name not in needed
+        ]
+        return queryset.defer(*deferrable) if deferrable else queryset
+
+
+class CourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     grade_display = serializers.CharField(source='get_grade_display', read_only=True)
     
     class Meta:
@@ -253,11 +336,13 @@ class CourseSerializer(serializers.ModelSerializer):
             'grade', 'grade_display',
             'thumbnail',
             'status', 'is_active',
+            'subject_count', 'chapter_count', 'topic_count', 'approved_video_count',
             'created_at', 'updated_at',
         ]
+        sparse_field_dependencies = {'grade_display': ['grade']}
 
 
-class SyllabusSerializer(serializers.ModelSerializer):
+class SyllabusSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     subject_title = serializers.CharField(source='subject.name', read_only=True)
     course_title = serializers.CharField(source='subject.course.title', read_only=True)
     
@@ -269,11 +354,27 @@ class SyllabusSerializer(serializers.ModelSerializer):
             'title', 'description',
             'academic_year',
             'status', 'is_active',
+            'chapter_count', 'topic_count', 'approved_video_count',
             'created_at', 'updated_at',
         ]
+        sparse_field_select_related = {'subject_title': 'subject', 'course_title': 'subject__course'}
 
 
-class SubjectSerializer(serializers.ModelSerializer):
+class SyllabusImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SyllabusImportJob
+        fields = [
+            'id', 'subject', 'file_name', 'options',
+            'status', 'phase',
+            'pages_total', 'pages_processed',
+            'chapters_created', 'topics_created',
+            'syllabus', 'error', 'task_id',
+            'created_at', 'started_at', 'finished_at', 'updated_at',
+        ]
+        read_only_fields = fields
+
+
+class SubjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     course_title = serializers.CharField(source='course.title', read_only=True)
     
     class Meta:
@@ -284,11 +385,13 @@ class SubjectSerializer(serializers.ModelSerializer):
             'name', 'description',
             'order', 'icon',
             'status', 'is_active',
+            'chapter_count', 'topic_count', 'approved_video_count',
             'created_at', 'updated_at',
         ]
+        sparse_field_select_related = {'course_title': 'course'}
 
 
-class ChapterSerializer(serializers.ModelSerializer):
+class ChapterSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     subject_name = serializers.CharField(source='syllabus.subject.name', read_only=True)
     syllabus_title = serializers.CharField(source='syllabus.title', read_only=True)
     
@@ -300,11 +403,13 @@ class ChapterSerializer(serializers.ModelSerializer):
             'title', 'description',
             'chapter_number',
             'status', 'is_active',
+            'topic_count', 'approved_video_count',
             'created_at', 'updated_at',
         ]
+        sparse_field_select_related = {'syllabus_title': 'syllabus', 'subject_name': 'syllabus__subject'}
 
 
-class TopicSerializer(serializers.ModelSerializer):
+class TopicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     chapter_title = serializers.CharField(source='chapter.title', read_only=True)
     
     class Meta:
@@ -320,40 +425,65 @@ class TopicSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at',
         ]
         read_only_fields = ['search_status', 'last_searched_at']
+        sparse_field_select_related = {'chapter_title': 'chapter'}
+
+
+class TreeDepthMixin:
+    """
+    Nested tree serializer that can be cut at a given depth.
+
+    ``depth=0`` drops the ``tree_child_field`` entirely; ``depth=n`` keeps
+    ``n`` levels below this one. ``None`` keeps the whole subtree.
+    """
+    tree_child_field = None
+
+    def __init__(self, *args, depth=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if depth is None or self.tree_child_field is None:
+            return
+        if depth <= 0:
+            self.fields.pop(self.tree_child_field)
+        else:
+            child = self.fields[self.tree_child_field].child
+            self.fields[self.tree_child_field] = type(child)(many=True, read_only=True, depth=depth - 1)
 
 
-class TopicTreeSerializer(serializers.ModelSerializer):
+class TopicTreeSerializer(TreeDepthMixin, serializers.ModelSerializer):
     class Meta:
         model = Topic
         fields = ['id', 'title', 'slug', 'description', 'order', 'video_url', 'notes', 'attachments']
 
 
-class ChapterTreeSerializer(serializers.ModelSerializer):
+class ChapterTreeSerializer(TreeDepthMixin, serializers.ModelSerializer):
     topics = TopicTreeSerializer(many=True, read_only=True)
+    tree_child_field = 'topics'
 
     class Meta:
         model = Chapter
         fields = ['id', 'title', 'slug', 'description', 'chapter_number', 'topics']
 
 
-class SyllabusTreeSerializer(serializers.ModelSerializer):
+class SyllabusTreeSerializer(TreeDepthMixin, serializers.ModelSerializer):
     chapters = ChapterTreeSerializer(many=True, read_only=True)
+    tree_child_field = 'chapters'
 
     class Meta:
         model = Syllabus
         fields = ['id', 'title', 'slug', 'description', 'academic_year', 'chapters']
 
 
-class SubjectTreeSerializer(serializers.ModelSerializer):
+class SubjectTreeSerializer(TreeDepthMixin, serializers.ModelSerializer):
     syllabi = SyllabusTreeSerializer(many=True, read_only=True)
+    tree_child_field = 'syllabi'
 
     class Meta:
         model = Subject
         fields = ['id', 'name', 'slug', 'description', 'order', 'syllabi']
 
 
-class CourseFullTreeSerializer(serializers.ModelSerializer):
+class CourseFullTreeSerializer(TreeDepthMixin, serializers.ModelSerializer):
     subjects = SubjectTreeSerializer(many=True, read_only=True)
+    tree_child_field = 'subjects'
 
     class Meta:
         model = Course
@@ -363,7 +493,7 @@ class CourseFullTreeSerializer(serializers.ModelSerializer):
 
 # ==================== VIDEO SERIALIZERS ====================
 
-class VideoResultSerializer(serializers.ModelSerializer):
+class VideoResultSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Serializer for video results"""
     context = serializers.SerializerMethodField()
     
@@ -382,6 +512,8 @@ class VideoResultSerializer(serializers.ModelSerializer):
             'view_count', 'like_count', 'comment_count',
             'tags_from_video', 'description', 'created_at', 'updated_at'
         ]
+        sparse_field_dependencies = {'context': ['topic']}
+        sparse_field_select_related = {'context': 'topic__chapter__syllabus__subject__course'}
         
     def get_context(self, obj):
         if not obj.topic:
@@ -460,7 +592,11 @@ class TaskSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_by', 'created_at', 'updated_at']
     
     def get_item_count(self, obj):
-        return obj.items.filter(is_active=True).count()
+        # Listing querysets annotate the count (see ``_task_queryset`` in views); single objects count here.
+        count = getattr(obj, 'active_item_count', None)
+        if count is None:
+            count = obj.items.filter(is_active=True).count()
+        return count
 # Serializers for adding items
 class AddVideoItemSerializer(serializers.Serializer):
     """Serializer for adding a video item to a task"""
@@ -0,0 +1,221 @@
+"""
+Batched authoring of chapters and topics under one syllabus.
+
+A batch is a list of operations::
+
+    {"op": "create", "type": "chapter", "ref": "c1", "data": {"title": "...", "chapter_number": 1}}
+    {"op": "create", "type": "topic", "data": {"chapter_ref": "c1", "title": "...", "order": 1}}
+    {"op": "update", "type": "topic", "id": 42, "data": {"title": "..."}}
+    {"op": "deactivate", "type": "chapter", "id": 7}
+
+An ``update`` with ``"is_active": false`` is applied as a ``deactivate``, so
+a chapter's topics are always deactivated with it.
+
+Every operation is validated first; if any is invalid nothing is written.
+Otherwise the batch is applied with ``bulk_create`` / ``bulk_update`` inside one
+transaction, followed by a single visibility refresh and cache bump.
+"""
+from django.db import IntegrityError, transaction
+from rest_framework import serializers
+
+from authentication.models import Chapter, Topic, allocate_unique_slugs
+from authentication.services.content_cache import bump_course_version
+from authentication.services.visibility import refresh_public_visibility
+
+
+MAX_BULK_OPERATIONS = 1000
+OPERATIONS = ('create', 'update', 'deactivate')
+
+
+class BulkChapterItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Chapter
+        fields = ['title', 'description', 'chapter_number', 'status', 'is_active']
+
+
+class BulkTopicItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Topic
+        fields = ['title', 'description', 'video_url', 'notes', 'attachments', 'order', 'status', 'is_active']
+
+
+ITEM_SERIALIZERS = {'chapter': BulkChapterItemSerializer, 'topic': BulkTopicItemSerializer}
+MODELS = {'chapter': Chapter, 'topic': Topic}
+
+
+class BulkOperationError(Exception):
+    """Raised with the per-item results when a batch is rejected; nothing was written."""
+
+    def __init__(self, results):
+        super().__init__("Bulk operation rejected")
+        self.results = results
+
+
+class _Batch:
+    def __init__(self, syllabus, operations):
+        self.syllabus = syllabus
+        self.operations = operations
+        self.results = [{'index': index} for index in range(len(operations))]
+        self.has_errors = False
+
+        ids = {kind: set() for kind in MODELS}
+        for operation in operations:
+            if isinstance(operation, dict):
+                kind = operation.get('type')
+                if kind in MODELS and isinstance(operation.get('id'), int):
+                    ids[kind].add(operation['id'])
+                data = operation.get('data')
+                if isinstance(data, dict) and isinstance(data.get('chapter'), int):
+                    ids['chapter'].add(data['chapter'])
+        # Existing rows touched by the batch, restricted to this syllabus.
+        self.chapters = Chapter.objects.filter(syllabus=syllabus).in_bulk(ids['chapter'])
+        self.topics = Topic.objects.select_related('chapter').filter(chapter__syllabus=syllabus).in_bulk(ids['topic'])
+        self.created_chapters = {}
+
+    def fail(self, index, errors):
+        self.results[index]['errors'] = errors
+        self.has_errors = True
+
+    def resolve_chapter(self, index, data):
+        """Chapter for a topic: an existing id under this syllabus or a ``chapter_ref`` created in the batch."""
+        if data.get('chapter_ref') is not None:
+            chapter = self.created_chapters.get(data['chapter_ref'])
+            if chapter is None:
+                self.fail(index, {'chapter_ref': ['No chapter with this ref is created earlier in the batch']})
+            return chapter
+        if data.get('chapter') is not None:
+            chapter = self.chapters.get(data['chapter'])
+            if chapter is None:
+                self.fail(index, {'chapter': ['Chapter not found in this syllabus']})
+            return chapter
+        return None
+
+
+def _validate(batch):
+    """Turn operations into unsaved/modified instances grouped by (op, type)."""
+    plan = {(op, kind): [] for op in OPERATIONS for kind in MODELS}
+
+    for index, operation in enumerate(batch.operations):
+        if not isinstance(operation, dict):
+            batch.fail(index, {'non_field_errors': ['Operation must be an object']})
+            continue
+        op, kind = operation.get('op'), operation.get('type')
+        batch.results[index].update({'op': op, 'type': kind})
+        if op not in OPERATIONS:
+            batch.fail(index, {'op': [f"Must be one of: {', '.join(OPERATIONS)}"]})
+            continue
+        if kind not in MODELS:
+            batch.fail(index, {'type': ['Must be chapter or topic']})
+            continue
+
+        data = operation.get('data') or {}
+        if not isinstance(data, dict):
+            batch.fail(index, {'data': ['Must be an object']})
+            continue
+
+        if op == 'create':
+            instance = MODELS[kind](syllabus=batch.syllabus) if kind == 'chapter' else Topic()
+        else:
+            existing = (batch.chapters if kind == 'chapter' else batch.topics).get(operation.get('id'))
+            if existing is None:
+                batch.fail(index, {'id': [f'{kind.title()} not found in this syllabus']})
+                continue
+            instance = existing
+
+        if op == 'deactivate':
+            plan[(op, kind)].append((index, instance, set()))
+            continue
+
+        item = ITEM_SERIALIZERS[kind](data=data, partial=(op == 'update'))
+        if not item.is_valid():
+            batch.fail(index, item.errors)
+            continue
+
+        if kind == 'topic':
+            chapter = batch.resolve_chapter(index, data)
+            if chapter is not None:
+                instance.chapter = chapter
+            elif op == 'create':
+                if 'errors' not in batch.results[index]:
+                    batch.fail(index, {'chapter': ['chapter or chapter_ref is required']})
+                continue
+            elif 'errors' in batch.results[index]:
+                continue
+
+        if op == 'update' and item.validated_data.get('is_active') is False:
+            # Deactivating through an update cascades like the deactivate op.
+            del item.validated_data['is_active']
+            plan[('deactivate', kind)].append((index, instance, set()))
+
+        for field, value in item.validated_data.items():
+            setattr(instance, field, value)
+        changed = set(item.validated_data) | ({'chapter'} if kind == 'topic' and op == 'update' and (
+            data.get('chapter') is not None or data.get('chapter_ref') is not None) else set())
+        plan[(op, kind)].append((index, instance, changed))
+
+        if op == 'create' and kind == 'chapter' and operation.get('ref') is not None:
+            batch.created_chapters[operation['ref']] = instance
+
+    return plan
+
+
+def _apply_creates(model_cls, entries, results, id_key='id'):
+    instances = [instance for _, instance, _ in entries]
+    if not instances:
+        return
+    allocate_unique_slugs(model_cls, [(instance, instance.slug_source()) for instance in instances])
+    model_cls.objects.bulk_create(instances)
+    for index, instance, _ in entries:
+        results[index].update({'status': 'created', id_key: instance.id, 'slug': instance.slug})
+
+
+def _apply_updates(model_cls, entries, results):
+    fields = set()
+    for _, _, changed in entries:
+        fields |= changed
+    if fields:
+        model_cls.objects.bulk_update([instance for _, instance, _ in entries], sorted(fields | {'updated_at'}))
+    for index, instance, _ in entries:
+        results[index].update({'status': 'updated', 'id': instance.id})
+
+
+def apply_syllabus_operations(syllabus, operations):
+    """
+    Validate and apply a batch of chapter/topic operations under ``syllabus``.
+    Returns per-item results in input order; raises ``BulkOperationError`` if
+    any item is invalid or the batch violates a constraint.
+    """
+    if not isinstance(operations, list) or not operations:
+        raise BulkOperationError([{'errors': {'operations': ['Must be a non-empty list']}}])
+    if len(operations) > MAX_BULK_OPERATIONS:
+        raise BulkOperationError([{'errors': {'operations': [f'At most {MAX_BULK_OPERATIONS} operations per batch']}}])
+
+    batch = _Batch(syllabus, operations)
+    plan = _validate(batch)
+    if batch.has_errors:
+        raise BulkOperationError(batch.results)
+
+    results = batch.results
+    try:
+        with transaction.atomic():
+            _apply_creates(Chapter, plan[('create', 'chapter')], results)
+            _apply_updates(Chapter, plan[('update', 'chapter')], results)
+            _apply_creates(Topic, plan[('create', 'topic')], results)
+            _apply_updates(Topic, plan[('update', 'topic')], results)
+
+            chapter_ids = [instance.id for _, instance, _ in plan[('deactivate', 'chapter')]]
+            topic_ids = [instance.id for _, instance, _ in plan[('deactivate', 'topic')]]
+            if chapter_ids:
+                Chapter.objects.filter(id__in=chapter_ids, is_active=True).update(is_active=False)
+                Topic.objects.filter(chapter_id__in=chapter_ids, is_active=True).update(is_active=False)
+            if topic_ids:
+                Topic.objects.filter(id__in=topic_ids, is_active=True).update(is_active=False)
+            for index, instance, _ in plan[('deactivate', 'chapter')] + plan[('deactivate', 'topic')]:
+                results[index].update({'status': 'deactivated', 'id': instance.id})
+
+            # Bulk writes skip save() and signals: fix visibility flags and cached trees once.
+            refresh_public_visibility(syllabus)
+    except IntegrityError as exc:
+        raise BulkOperationError([{'errors': {'non_field_errors': [f'Batch violates a uniqueness constraint: {exc}']}}])
+    bump_course_version(syllabus.subject.course_id)
+    return results
@@ -0,0 +1,137 @@
+"""
+Set-based soft-delete cascade for the course hierarchy.
+
+Deactivating a node deactivates every descendant. The cascade collects the
+primary keys of descendants that are still active, one query per level, and
+flips them in pk-chunked UPDATEs inside one transaction. Rows that are already
+inactive are never rewritten.
+
+Cascades larger than ``CONTENT_CASCADE_ASYNC_THRESHOLD`` rows (sized with one
+COUNT per level) run in a Celery task instead, queued once the deactivating
+transaction commits. The admin request then only saves the root: the task
+deactivates the descendants, refreshes their visibility and recounts the
+course, so the subtree stays in public listings until the task has run.
+"""
+import logging
+import uuid
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+
+from authentication.services.content_cache import bump_course_version_on_commit, course_id_for_node
+from authentication.services.visibility import descendant_scopes, refresh_public_visibility
+
+
+logger = logging.getLogger(__name__)
+
+CASCADE_CHUNK_SIZE = 500
+DEFAULT_ASYNC_THRESHOLD = 5000
+
+
+@dataclass
+class CascadeResult:
+    """Outcome of a cascade: per-model counts when run inline, or the task id when deferred."""
+    deactivated: dict = field(default_factory=dict)
+    task_id: str = None
+
+    @property
+    def deferred(self):
+        return self.task_id is not None
+
+
+def collect_active_descendants(root):
+    """Map each descendant model to the pks of its rows under ``root`` that are still active."""
+    pk_sets = {}
+    for model_cls, _, scope in descendant_scopes(root):
+        pks = list(model_cls.objects.filter(is_active=True, **scope).values_list('pk', flat=True))
+        if pks:
+            pk_sets[model_cls] = pks
+    return pk_sets
+
+
+def count_active_descendants(root):
+    """Number of descendants of ``root`` that are still active (one COUNT per level)."""
+    return sum(
+        model_cls.objects.filter(is_active=True, **scope).count() for model_cls, _, scope in descendant_scopes(root)
+    )
+
+
+def _chunks(pks, size=CASCADE_CHUNK_SIZE):
+    for start in range(0, len(pks), size):
+        yield pks[start:start + size]
+
+
+def deactivate_pk_sets(pk_sets, progress=None):
+    """
+    Deactivate the given rows in one transaction.
+
+    ``progress`` is called as ``progress(done, total)`` after every chunk.
+    """
+    total = sum(len(pks) for pks in pk_sets.values())
+    done = 0
+    deactivated = {}
+    with transaction.atomic():
+        for model_cls, pks in pk_sets.items():
+            count = 0
+            for chunk in _chunks(pks):
+                count += model_cls.objects.filter(pk__in=chunk, is_active=True).update(is_active=False)
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+            deactivated[model_cls._meta.model_name] = count
+    return deactivated
+
+
+def _async_threshold():
+    return getattr(settings, 'CONTENT_CASCADE_ASYNC_THRESHOLD', DEFAULT_ASYNC_THRESHOLD)
+
+
+def cascade_deactivate(root):
+    """
+    Deactivate every active descendant of ``root``.
+
+    Small cascades run inline. Larger ones are handed to
+    ``cascade_deactivate_task`` once the current transaction commits, so the
+    admin request returns immediately and a rolled-back deactivation never
+    cascades. The task id is chosen up front so it can be returned at once;
+    if the broker cannot be reached the cascade falls back to running inline.
+    """
+    threshold = _async_threshold()
+    if threshold is not None and count_active_descendants(root) > threshold:
+        result = CascadeResult(task_id=str(uuid.uuid4()))
+        label, pk = root._meta.label, root.pk
+        transaction.on_commit(lambda: _dispatch(label, pk, result))
+        return result
+
+    pk_sets = collect_active_descendants(root)
+    if not pk_sets:
+        return CascadeResult()
+    return CascadeResult(deactivated=deactivate_pk_sets(pk_sets))
+
+
+def _dispatch(model_label, pk, result):
+    from authentication.tasks import cascade_deactivate_task
+
+    try:
+        cascade_deactivate_task.apply_async((model_label, pk), task_id=result.task_id)
+    except Exception:
+        logger.exception("Could not queue cascade for %s %s; running inline", model_label, pk)
+        root = apps.get_model(model_label).objects.filter(pk=pk).first()
+        if root is not None:
+            result.task_id = None
+            result.deactivated = run_deferred_cascade(root)
+
+
+def run_deferred_cascade(root, progress=None):
+    """
+    Task body: deactivate descendants of ``root``, refresh their visibility and
+    counters, and invalidate its cached content once that commits.
+    """
+    with transaction.atomic():
+        deactivated = deactivate_pk_sets(collect_active_descendants(root), progress=progress)
+        refresh_public_visibility(root)
+        # Queryset updates do not send signals, so the cached tree is invalidated here.
+        bump_course_version_on_commit(course_id_for_node(type(root), root.pk))
+    return deactivated
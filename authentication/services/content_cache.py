@@ -0,0 +1,145 @@
+"""
+Versioned cache for public course content.
+
+Every course carries a content version that lives in the cache. Saving any
+node of the course hierarchy bumps that version (see ``authentication.signals``),
+so cached snapshots keyed by the old version simply stop being read.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+
+
+TREE_CACHE_TIMEOUT = 60 * 60 * 24
+CATALOG_VERSION_KEY = "content-version:catalog"
+
+# Lookup path from each content model to the id of the course it belongs to.
+COURSE_ID_PATHS = {
+    Course: "id",
+    Subject: "course_id",
+    Syllabus: "subject__course_id",
+    Chapter: "syllabus__subject__course_id",
+    Topic: "chapter__syllabus__subject__course_id",
+}
+
+
+def _now_version():
+    # Versions start from the current time in milliseconds so a version key that
+    # was evicted never restarts at a value an older snapshot was stored under.
+    return int(time.time() * 1000)
+
+
+def _course_version_key(course_id):
+    return f"content-version:course:{course_id}"
+
+
+def _course_snapshot_key(course_id, version, name):
+    return f"course-snapshot:{course_id}:{version}:{name}"
+
+
+def _course_slug_key(slug):
+    return f"course-slug:{slug}"
+
+
+def _get_version(key):
+    version = cache.get(key)
+    if version is None:
+        version = _now_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def _bump_version(key):
+    current = cache.get(key) or 0
+    cache.set(key, max(current + 1, _now_version()), timeout=None)
+
+
+def get_course_version(course_id):
+    return _get_version(_course_version_key(course_id))
+
+
+def get_catalog_version():
+    """Version covering every course; bumped together with any course version."""
+    return _get_version(CATALOG_VERSION_KEY)
+
+
+def bump_course_version(*course_ids):
+    course_ids = {course_id for course_id in course_ids if course_id}
+    for course_id in course_ids:
+        _bump_version(_course_version_key(course_id))
+    if course_ids:
+        _bump_version(CATALOG_VERSION_KEY)
+
+
+def bump_course_version_on_commit(*course_ids):
+    """
+    Bump once the current transaction commits (at once outside a transaction).
+    A bump inside the transaction would let a concurrent reader cache the
+    pre-commit rows under the new version.
+    """
+    transaction.on_commit(lambda: bump_course_version(*course_ids))
+
+
+def version_timestamp(version):
+    """Versions are millisecond timestamps (or just above), usable as Last-Modified."""
+    return version // 1000
+
+
+def course_id_for_node(model_cls, pk):
+    return model_cls.objects.filter(pk=pk).values_list(COURSE_ID_PATHS[model_cls], flat=True).first()
+
+
+def get_node_version(model_cls, pk):
+    """
+    Content version for a node, or the catalog version when the node does not
+    exist (so an empty listing changes ETag once the node is created).
+    """
+    course_id = course_id_for_node(model_cls, pk)
+    if course_id is None:
+        return get_catalog_version()
+    return get_course_version(course_id)
+
+
+def get_course_snapshot(course_id, name, build):
+    """
+    Return a serialized snapshot (JSON bytes) of part of a course, e.g. its full
+    tree or one syllabus subtree, identified by ``name`` within the course.
+
+    ``build`` is only called on a cache miss and must return the JSON bytes, or
+    None when the content is not publicly available (misses are not cached).
+    """
+    version = get_course_version(course_id)
+    key = _course_snapshot_key(course_id, version, name)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        if payload is None:
+            return None
+        cache.set(key, payload, TREE_CACHE_TIMEOUT)
+    return payload
+
+
+def get_course_tree(course_id, build, depth=None):
+    """Serialized course tree, optionally cut at ``depth`` levels below the course."""
+    name = "tree" if depth is None else f"tree:depth={depth}"
+    return get_course_snapshot(course_id, name, build)
+
+
+def get_course_id_for_slug(slug):
+    entry = cache.get(_course_slug_key(slug))
+    if not entry:
+        return None
+    course_id, version = entry
+    # Any change to the course (including a slug rename) bumps its version and
+    # invalidates the mapping.
+    if version != get_course_version(course_id):
+        return None
+    return course_id
+
+
+def remember_course_slug(slug, course_id):
+    cache.set(_course_slug_key(slug), (course_id, get_course_version(course_id)), TREE_CACHE_TIMEOUT)
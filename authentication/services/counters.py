@@ -0,0 +1,140 @@
+"""
+Denormalized content counters on courses, subjects, syllabi and chapters.
+
+Each node stores how many publicly visible subjects / chapters / topics sit
+below it and how many approved videos those topics carry, so catalog listings
+can show "12 chapters, 87 topics" without COUNT queries.
+
+Counters are kept current in two ways:
+
+* Single-row writes (a node created visible, a topic shown or hidden, a video
+  approved or moved) add ``+n`` / ``-n`` to the ancestors with ``F()`` updates,
+  one UPDATE per ancestor level (see ``authentication.signals``).
+* Anything that can flip many rows at once (visibility refreshes, cascades,
+  bulk writes) recounts the affected course with one set-based UPDATE per
+  level, using correlated COUNT subqueries.
+
+``python manage.py recount_content_counters`` rebuilds every counter.
+"""
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+
+
+APPROVED = 'APPROVED'
+
+# Counter columns carried by each level, top-down.
+COUNTER_FIELDS = {
+    Course: ('subject_count', 'chapter_count', 'topic_count', 'approved_video_count'),
+    Subject: ('chapter_count', 'topic_count', 'approved_video_count'),
+    Syllabus: ('chapter_count', 'topic_count', 'approved_video_count'),
+    Chapter: ('topic_count', 'approved_video_count'),
+}
+
+# Path from each level up to every counter-carrying ancestor.
+UP_PATHS = {
+    Course: {},
+    Subject: {Course: 'course'},
+    Syllabus: {Subject: 'subject', Course: 'subject__course'},
+    Chapter: {Syllabus: 'syllabus', Subject: 'syllabus__subject', Course: 'syllabus__subject__course'},
+    Topic: {
+        Chapter: 'chapter',
+        Syllabus: 'chapter__syllabus',
+        Subject: 'chapter__syllabus__subject',
+        Course: 'chapter__syllabus__subject__course',
+    },
+}
+
+# counter -> (counted model, filter, model whose UP_PATHS lead to the ancestors, prefix to reach it)
+COUNTED = {
+    'subject_count': (Subject, {'is_publicly_visible': True}, Subject, ''),
+    'chapter_count': (Chapter, {'is_publicly_visible': True}, Chapter, ''),
+    'topic_count': (Topic, {'is_publicly_visible': True}, Topic, ''),
+    'approved_video_count': (
+        VideoResult, {'approval_status': APPROVED, 'topic__is_publicly_visible': True}, Topic, 'topic__',
+    ),
+}
+
+
+def _count_subquery(counter, level):
+    model_cls, filters, via_model, prefix = COUNTED[counter]
+    path = prefix + UP_PATHS[via_model][level]
+    counts = (
+        model_cls.objects.filter(**{path: OuterRef('pk')}, **filters)
+        .order_by()
+        .values(path)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def recount_content_counters(course_ids=None):
+    """
+    Rebuild counters for the given courses (all courses when None).
+    One UPDATE per level; returns the number of rows written.
+    """
+    if course_ids is not None:
+        course_ids = [course_id for course_id in course_ids if course_id]
+        if not course_ids:
+            return 0
+
+    updated = 0
+    for level, fields in COUNTER_FIELDS.items():
+        rows = level.objects.all()
+        if course_ids is not None:
+            course_path = f"{UP_PATHS[level][Course]}_id" if level is not Course else 'id'
+            rows = rows.filter(**{f'{course_path}__in': course_ids})
+        updated += rows.update(**{field: _count_subquery(field, level) for field in fields})
+    return updated
+
+
+def course_id_of(node):
+    """Course id of any content node."""
+    if isinstance(node, Course):
+        return node.pk
+    path = UP_PATHS[type(node)][Course]
+    return type(node).objects.filter(pk=node.pk).values_list(f'{path}_id', flat=True).first()
+
+
+def _ancestor_ids(level, pk):
+    """{level: id} for the node ``pk`` of ``level`` and each of its ancestors (one query)."""
+    paths = UP_PATHS[level]
+    ids = {level: pk}
+    if paths:
+        row = level.objects.filter(pk=pk).values_list(*[f'{path}_id' for path in paths.values()]).first()
+        if row is None:
+            return {}
+        ids.update(zip(paths, row))
+    return ids
+
+
+def apply_counter_deltas(level, pk, **deltas):
+    """
+    Add ``deltas`` (counter name -> +n/-n) to the node ``pk`` of ``level`` and
+    to every ancestor that carries those counters. Returns the course id touched.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas or pk is None:
+        return None
+    ancestors = _ancestor_ids(level, pk)
+    for ancestor, ancestor_id in ancestors.items():
+        changes = {
+            field: Greatest(F(field) + delta, Value(0))
+            for field, delta in deltas.items() if field in COUNTER_FIELDS[ancestor]
+        }
+        if changes:
+            ancestor.objects.filter(pk=ancestor_id).update(**changes)
+    return ancestors.get(Course)
+
+
+def counted_video_chapter(approval_status, topic_id):
+    """Chapter id whose counters include a video in this state, or None if it is not counted."""
+    if approval_status != APPROVED or topic_id is None:
+        return None
+    return Topic.objects.filter(pk=topic_id, is_publicly_visible=True).values_list('chapter_id', flat=True).first()
+
+
+def approved_video_total(topic_id):
+    return VideoResult.objects.filter(topic_id=topic_id, approval_status=APPROVED).count()
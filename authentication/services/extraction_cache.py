@@ -0,0 +1,88 @@
+"""
+Cache of text extracted from uploaded files, keyed by content hash.
+
+Admins often upload the same syllabus file again (a retry after a validation
+error, or the same PDF imported into several subjects). Extracted text is
+stored under the SHA-256 of the uploaded bytes, and parsed chapter structures
+under the SHA-256 of that text, so a repeat upload skips extraction and parsing.
+
+Entries live in the ``extraction`` cache alias (a per-process LocMem cache
+with LRU culling by default) and carry ``EXTRACTOR_VERSION`` in their keys:
+bump it whenever extraction or parsing output changes so stale entries are
+never read. Texts whose UTF-8 encoding is larger than
+``EXTRACTION_CACHE_MAX_ITEM_BYTES``, and the structures parsed from them, are
+not cached, so the alias holds at most ``MAX_ENTRIES`` times that many bytes
+of text per process (see settings.py for the budget).
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+
+
+EXTRACTOR_VERSION = 2
+EXTRACTION_CACHE_ALIAS = "extraction"
+EXTRACTION_CACHE_TIMEOUT = 60 * 60 * 24 * 7
+DEFAULT_MAX_ITEM_BYTES = 512 * 1024
+
+
+def _cache():
+    return caches[EXTRACTION_CACHE_ALIAS]
+
+
+def _max_item_bytes():
+    return getattr(settings, "EXTRACTION_CACHE_MAX_ITEM_BYTES", DEFAULT_MAX_ITEM_BYTES)
+
+
+def content_digest(data):
+    """SHA-256 hex digest of bytes or text."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path):
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+def stream_digest(file_obj, chunk_size=64 * 1024):
+    """(SHA-256 hex digest, size in bytes) of a file object, read chunk by chunk."""
+    digest, size = hashlib.sha256(), 0
+    file_obj.seek(0)
+    chunks = file_obj.chunks(chunk_size) if hasattr(file_obj, "chunks") else iter(lambda: file_obj.read(chunk_size), b"")
+    for chunk in chunks:
+        digest.update(chunk)
+        size += len(chunk)
+    file_obj.seek(0)
+    return digest.hexdigest(), size
+
+
+def _text_key(namespace, digest):
+    return f"extracted-text:{namespace}:v{EXTRACTOR_VERSION}:{digest}"
+
+
+def _structure_key(digest):
+    return f"parsed-syllabus:v{EXTRACTOR_VERSION}:{digest}"
+
+
+def get_extracted_text(namespace, digest):
+    """{"text", "pages"} extracted earlier from a file with this digest, or None."""
+    return _cache().get(_text_key(namespace, digest))
+
+
+def remember_extracted_text(namespace, digest, text, pages=None):
+    if not text or len(text.encode("utf-8")) > _max_item_bytes():
+        return
+    _cache().set(_text_key(namespace, digest), {"text": text, "pages": pages}, EXTRACTION_CACHE_TIMEOUT)
+
+
+def get_parsed_structure(text_digest):
+    return _cache().get(_structure_key(text_digest))
+
+
+def remember_parsed_structure(text_digest, chapters, text_bytes=0):
+    """``text_bytes`` is the UTF-8 size of the parsed text; structures of texts too large to cache are skipped."""
+    if text_bytes > _max_item_bytes():
+        return
+    _cache().set(_structure_key(text_digest), chapters, EXTRACTION_CACHE_TIMEOUT)
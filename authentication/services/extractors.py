@@ -0,0 +1,135 @@
+"""
+Document text extraction: one registry for every upload path.
+
+Extractors are generators registered per file extension. Each yields the text
+of a document one unit at a time (a PDF page, a DOCX paragraph or table row, a
+spreadsheet row, a line of plain text), so callers stream the chunks or join
+them once instead of building strings with ``+=``. A source may be a
+filesystem path or a binary file object such as an ``UploadedFile``.
+
+Syllabus imports (``file_parser``) and Celery tag extraction (``api.parsers``)
+both read files through ``iter_document_text``. Support for a new format is a
+registered generator::
+
+    @register_extractor("odt")
+    def extract_odt(source, progress=None):
+        yield ...
+"""
+import os
+
+import docx
+import openpyxl
+
+from authentication.services.pdf_extraction import iter_pdf_pages
+
+
+EXTRACTORS = {}
+
+
+def register_extractor(*extensions):
+    """Register a ``(source, progress=None)`` text generator for file extensions."""
+    def decorator(extractor):
+        for extension in extensions:
+            EXTRACTORS[extension.lower()] = extractor
+        return extractor
+    return decorator
+
+
+def supported_extensions():
+    return sorted(EXTRACTORS)
+
+
+def file_extension(name):
+    name = (name or "").lower()
+    return name.rsplit(".", 1)[-1] if "." in name else ""
+
+
+def _is_path(source):
+    return isinstance(source, (str, os.PathLike))
+
+
+def _source_name(source):
+    return os.fspath(source) if _is_path(source) else (getattr(source, "name", "") or "")
+
+
+def iter_document_text(source, extension=None, progress=None):
+    """
+    Yield the text chunks of a document. The type comes from ``extension`` or
+    the source's file name; raises ValueError for unsupported types.
+    ``progress(done, total)`` reports pages (PDF) or sheets (XLSX) as they are
+    read; other formats report a single unit once finished.
+    """
+    extension = extension or file_extension(_source_name(source))
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise ValueError(f"Unsupported file type: {extension or 'unknown'}")
+    if not _is_path(source) and hasattr(source, "seek"):
+        source.seek(0)
+    yield from extractor(source, progress=progress)
+
+
+def extract_document_text(source, extension=None, progress=None):
+    """All text of a document, one chunk per line."""
+    return "\n".join(iter_document_text(source, extension=extension, progress=progress))
+
+
+def local_path(source):
+    """Filesystem path of a source: a path, an upload spooled to disk or a locally stored file."""
+    if _is_path(source):
+        return os.fspath(source)
+    if hasattr(source, "temporary_file_path"):
+        return source.temporary_file_path()
+    try:
+        return source.path
+    except (AttributeError, NotImplementedError, ValueError):
+        return None
+
+
+@register_extractor("pdf")
+def extract_pdf(source, progress=None):
+    # Worker processes open the file by path; only sources that are already
+    # in memory (no path on disk) are handed over as bytes.
+    path = local_path(source)
+    yield from iter_pdf_pages(path if path is not None else source.read(), progress=progress)
+
+
+@register_extractor("docx")
+def extract_docx(source, progress=None):
+    document = docx.Document(source)
+    for paragraph in document.paragraphs:
+        yield paragraph.text
+    for table in document.tables:
+        for row in table.rows:
+            row_text = " ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
+            if row_text:
+                yield row_text
+    if progress:
+        progress(1, 1)
+
+
+@register_extractor("xlsx")
+def extract_xlsx(source, progress=None):
+    workbook = openpyxl.load_workbook(source, read_only=True)
+    try:
+        sheets = workbook.worksheets
+        for done, sheet in enumerate(sheets, start=1):
+            for row in sheet.iter_rows(values_only=True):
+                yield " ".join(str(value) for value in row if value)
+            if progress:
+                progress(done, len(sheets))
+    finally:
+        workbook.close()
+
+
+@register_extractor("txt", "doc")
+def extract_plain_text(source, progress=None):
+    # Legacy .doc files have no parser here; their readable runs are decoded as text.
+    handle = open(source, "rb") if _is_path(source) else source
+    try:
+        for line in handle:
+            yield line.decode("utf-8", errors="ignore").rstrip("\r\n")
+    finally:
+        if handle is not source:
+            handle.close()
+    if progress:
+        progress(1, 1)
@@ -1,8 +1,20 @@
-import io
 import re
 
-import docx
-import pdfplumber
+from authentication.services.extraction_cache import (
+    content_digest,
+    get_extracted_text,
+    get_parsed_structure,
+    remember_extracted_text,
+    remember_parsed_structure,
+    stream_digest,
+)
+from authentication.services.extractors import (
+    EXTRACTORS,
+    extract_document_text,
+    file_extension,
+    supported_extensions,
+)
+from authentication.uploads import too_large_message, upload_max_size
 
 
 CHAPTER_PATTERNS = [
@@ -12,50 +24,53 @@ CHAPTER_PATTERNS = [
 TOPIC_BULLET_PATTERN = re.compile(r"^\s*(?:[-*]|[0-9]+[\.\)]|[a-zA-Z][\.\)])\s+(.+)$")
 
 
-def validate_upload(file_obj, max_size_bytes=10 * 1024 * 1024):
+def validate_upload(file_obj, max_size_bytes=None):
     if not file_obj:
         raise ValueError("file is required")
 
-    filename = getattr(file_obj, "name", "") or ""
-    ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
-    if ext not in {"pdf", "doc", "docx"}:
-        raise ValueError("Unsupported file type. Allowed: PDF, DOC, DOCX")
+    ext = file_extension(getattr(file_obj, "name", ""))
+    if ext not in EXTRACTORS:
+        allowed = ", ".join(extension.upper() for extension in supported_extensions())
+        raise ValueError(f"Unsupported file type. Allowed: {allowed}")
 
+    max_size_bytes = max_size_bytes or upload_max_size()
     size = getattr(file_obj, "size", None)
     if size is not None and size > max_size_bytes:
-        raise ValueError("File too large. Maximum size is 10MB")
+        raise ValueError(too_large_message(max_size_bytes))
 
     return ext
 
 
-def extract_text_from_uploaded_file(file_obj):
+def extract_text_from_uploaded_file(file_obj, progress=None):
+    """
+    Text of an uploaded document (any type in the extractor registry).
+    ``progress(done, total)`` is called as pages are read (documents without
+    pages count as a single page). The upload is hashed and read in chunks,
+    and results are cached by its SHA-256, so re-uploads skip extraction.
+    """
     ext = validate_upload(file_obj)
-    file_obj.seek(0)
-    raw = file_obj.read()
-    if not raw:
+    digest, size = stream_digest(file_obj)
+    if not size:
         raise ValueError("Uploaded file is empty")
 
-    text = ""
-    if ext == "pdf":
-        with pdfplumber.open(io.BytesIO(raw)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text() or ""
-                text += page_text + "\n"
-    elif ext == "docx":
-        document = docx.Document(io.BytesIO(raw))
-        for para in document.paragraphs:
-            text += para.text + "\n"
-        for table in document.tables:
-            for row in table.rows:
-                row_text = " ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
-                if row_text:
-                    text += row_text + "\n"
-    else:  # .doc basic fallback
-        text = raw.decode("utf-8", errors="ignore")
-
-    text = text.strip()
+    cached = get_extracted_text(ext, digest)
+    if cached is not None:
+        if progress and cached["pages"]:
+            progress(cached["pages"], cached["pages"])
+        return cached["text"]
+
+    page_count = None
+
+    def report(done, total):
+        nonlocal page_count
+        page_count = total
+        if progress:
+            progress(done, total)
+
+    text = extract_document_text(file_obj, ext, progress=report).strip()
     if not text:
         raise ValueError("Could not extract readable text from the file")
+    remember_extracted_text(ext, digest, text, page_count)
     return text
 
 
@@ -63,7 +78,18 @@ def parse_syllabus_text(text):
     """
     Parse raw text into a structure:
     [{"chapter_number": 1, "title": "...", "topics": ["...", "..."]}, ...]
+    Parsed structures are cached by the SHA-256 of ``text``.
     """
+    encoded = text.encode("utf-8")
+    digest = content_digest(encoded)
+    chapters = get_parsed_structure(digest)
+    if chapters is None:
+        chapters = _parse_syllabus_lines(text)
+        remember_parsed_structure(digest, chapters, len(encoded))
+    return chapters
+
+
+def _parse_syllabus_lines(text):
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
     chapters = []
     current = None
@@ -0,0 +1,113 @@
+"""
+Sparse ``order`` keys and constant-cost moves for topics and subjects.
+
+Siblings keep gaps of ``ORDER_GAP`` between their order values, so moving a
+node before/after a sibling usually writes one row: the midpoint of the two
+neighbouring keys. When a gap is exhausted the siblings are renumbered with two
+set-based UPDATEs (shift out of the way, then lay out fresh gaps), never with
+one statement per row, and without tripping ``uniq_topic_chapter_order``.
+"""
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Max, Value, When
+from django.utils import timezone
+
+from authentication.models import Subject, Topic
+from authentication.services.content_cache import bump_course_version_on_commit
+
+
+ORDER_GAP = 1024
+
+# model -> (sibling scope field, course id path from the node)
+ORDERED_MODELS = {
+    Topic: ('chapter', 'chapter__syllabus__subject__course_id'),
+    Subject: ('course', 'course_id'),
+}
+
+
+class MoveError(ValueError):
+    pass
+
+
+def _siblings(node):
+    scope, _ = ORDERED_MODELS[type(node)]
+    return type(node).objects.filter(**{f'{scope}_id': getattr(node, f'{scope}_id')})
+
+
+def renumber_siblings(siblings, ordered_ids):
+    """
+    Rewrite ``order`` to ``ORDER_GAP, 2*ORDER_GAP, ...`` following ``ordered_ids``.
+
+    Unique constraints are checked row by row, so rows are first shifted above
+    every current and final value, then given their final keys.
+    """
+    if not ordered_ids:
+        return 0
+    rows = siblings.filter(id__in=ordered_ids)
+    highest = rows.aggregate(highest=Max('order'))['highest'] or 0
+    now = timezone.now()
+    rows.update(order=F('order') + highest + len(ordered_ids) * ORDER_GAP + 1)
+    return rows.update(
+        order=Case(
+            *[When(id=pk, then=Value((position + 1) * ORDER_GAP)) for position, pk in enumerate(ordered_ids)],
+            output_field=IntegerField(),
+        ),
+        updated_at=now,
+    )
+
+
+def _neighbour_keys(siblings, target, before):
+    """(lower, upper) order keys the moved node must fall strictly between."""
+    if before:
+        lower = siblings.filter(order__lt=target.order).aggregate(key=Max('order'))['key']
+        return (-1 if lower is None else lower), target.order
+    upper = siblings.filter(order__gt=target.order).order_by('order').values_list('order', flat=True).first()
+    return target.order, upper
+
+
+@transaction.atomic
+def move_node(node, before=None, after=None):
+    """
+    Move a topic/subject directly before or after a sibling (given by id).
+    Returns True when the siblings had to be renumbered.
+    """
+    model_cls = type(node)
+    if model_cls not in ORDERED_MODELS:
+        raise MoveError(f'{model_cls.__name__} does not support reordering')
+    if (before is None) == (after is None):
+        raise MoveError('Exactly one of before or after is required')
+
+    target_id = before if before is not None else after
+    if target_id == node.pk:
+        raise MoveError('A node cannot be moved relative to itself')
+
+    siblings = _siblings(node).exclude(pk=node.pk)
+    target = siblings.select_for_update().filter(pk=target_id).only('id', 'order').first()
+    if target is None:
+        raise MoveError('Target must be a sibling of the node being moved')
+
+    lower, upper = _neighbour_keys(siblings, target, before is not None)
+    # Subjects may share an order value (ties fall back to name); a midpoint cannot split a tie.
+    tied = model_cls is not Topic and siblings.filter(order=target.order).exclude(pk=target.pk).exists()
+    renumbered = False
+    if upper is None and not tied:
+        new_order = lower + ORDER_GAP
+    elif upper is not None and upper - lower > 1 and not tied:
+        new_order = (lower + upper) // 2
+    else:
+        ordering = [*model_cls._meta.ordering, 'id']
+        ordered_ids = list(siblings.order_by(*ordering).values_list('id', flat=True))
+        index = ordered_ids.index(target.pk) + (0 if before is not None else 1)
+        ordered_ids.insert(index, node.pk)
+        renumber_siblings(_siblings(node), ordered_ids)
+        new_order = (index + 1) * ORDER_GAP
+        renumbered = True
+
+    if not renumbered:
+        model_cls.objects.filter(pk=node.pk).update(order=new_order, updated_at=timezone.now())
+    node.order = new_order
+
+    # Queryset updates skip post_save, so invalidate the cached course tree here.
+    _, course_path = ORDERED_MODELS[model_cls]
+    course_id = model_cls.objects.filter(pk=node.pk).values_list(course_path, flat=True).first()
+    bump_course_version_on_commit(course_id)
+    return renumbered
@@ -0,0 +1,133 @@
+"""
+PDF text extraction fanned out over a process pool.
+
+``page.extract_text()`` is CPU-bound pure Python, so a large PDF is split into
+contiguous page ranges that worker processes extract in parallel; results are
+reassembled in page order and joined once. Small PDFs and single-worker setups
+extract serially in-process.
+
+The pool comes from ``billiard`` (Celery's fork of ``multiprocessing``), which
+lets daemonic processes start children, so Celery prefork workers (import jobs,
+keyword extraction) fan out too. Workers open the PDF by path; PDFs given as
+bytes are written to one temporary file first rather than pickled per range.
+
+Settings:
+
+* ``PDF_EXTRACTION_WORKERS``: pool size (default: CPU count).
+* ``PDF_EXTRACTION_MAX_PAGES``: reject PDFs with more pages (default: no limit).
+* ``PDF_PARALLEL_MIN_PAGES``: below this many pages the pool is not worth starting.
+"""
+import io
+import os
+import tempfile
+
+import pdfplumber
+from billiard.pool import Pool
+from django.conf import settings
+
+
+DEFAULT_PARALLEL_MIN_PAGES = 16
+# Each worker gets a few ranges so a slow range does not leave the others idle.
+RANGES_PER_WORKER = 4
+
+
+def _open(source):
+    """pdfplumber document from a path or raw bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return pdfplumber.open(io.BytesIO(bytes(source)))
+    return pdfplumber.open(source)
+
+
+def _extract_range(source, start, stop):
+    """Worker: text of pages ``start``..``stop - 1``, one string per page."""
+    texts = []
+    with _open(source) as pdf:
+        for page in pdf.pages[start:stop]:
+            texts.append(page.extract_text() or "")
+            page.close()
+    return texts
+
+
+def _worker_count(workers):
+    if workers is None:
+        workers = getattr(settings, "PDF_EXTRACTION_WORKERS", None)
+    return max(1, workers or os.cpu_count() or 1)
+
+
+def page_ranges(page_count, parts):
+    """Split ``range(page_count)`` into at most ``parts`` contiguous (start, stop) ranges."""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges, start = [], 0
+    for index in range(parts):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def iter_pdf_pages(source, workers=None, max_pages=None, progress=None):
+    """
+    Yield the text of every page of a PDF (path or bytes), in page order.
+
+    ``progress(done, total)`` is called as pages are yielded. Raises
+    ValueError when the PDF has more than ``max_pages`` pages
+    (``settings.PDF_EXTRACTION_MAX_PAGES`` when not given).
+    """
+    if max_pages is None:
+        max_pages = getattr(settings, "PDF_EXTRACTION_MAX_PAGES", None)
+    with _open(source) as pdf:
+        total = len(pdf.pages)
+        if max_pages is not None and total > max_pages:
+            raise ValueError(f"PDF has {total} pages. Maximum is {max_pages}")
+
+        workers = _worker_count(workers)
+        min_pages = getattr(settings, "PDF_PARALLEL_MIN_PAGES", DEFAULT_PARALLEL_MIN_PAGES)
+        if workers == 1 or total < min_pages:
+            for done, page in enumerate(pdf.pages, start=1):
+                yield page.extract_text() or ""
+                # pdfplumber caches parsed pages on the document; drop them as we go.
+                page.close()
+                if progress:
+                    progress(done, total)
+            return
+
+    path = None
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as handle:
+            handle.write(source)
+        source = path = handle.name
+    try:
+        ranges = page_ranges(total, workers * RANGES_PER_WORKER)
+        done = 0
+        pool = Pool(processes=min(workers, len(ranges)))
+        finished = False
+        try:
+            # Results are read in submission order while later ranges are still being extracted.
+            # apply_async rather than imap: billiard workers only exit promptly once the parent
+            # has acknowledged their results, which it does for ApplyResult but not IMapIterator.
+            results = [pool.apply_async(_extract_range, (source, start, stop)) for start, stop in ranges]
+            for result in results:
+                chunk = result.get()
+                yield from chunk
+                done += len(chunk)
+                if progress:
+                    progress(done, total)
+            finished = True
+        finally:
+            # Idle workers exit as soon as the pool is closed; only abandoned runs are terminated.
+            pool.close() if finished else pool.terminate()
+            pool.join()
+    finally:
+        if path is not None:
+            os.remove(path)
+
+
+def extract_pdf_pages(source, workers=None, max_pages=None, progress=None):
+    """List of page texts of a PDF (see ``iter_pdf_pages``)."""
+    return list(iter_pdf_pages(source, workers=workers, max_pages=max_pages, progress=progress))
+
+
+def extract_pdf_text(source, workers=None, max_pages=None, progress=None):
+    """All page text of a PDF joined with newlines (see ``extract_pdf_pages``)."""
+    return "\n".join(extract_pdf_pages(source, workers=workers, max_pages=max_pages, progress=progress))
@@ -0,0 +1,129 @@
+"""
+Publishing syllabi as immutable artifacts.
+
+``publish_syllabus`` compiles the public subtree of a syllabus (its tree plus
+the public chapter and topic listings) into a compressed, versioned
+``SyllabusArtifact``. Once a syllabus has an artifact, public readers get that
+artifact instead of live ``Chapter`` / ``Topic`` rows, so admin edits are only
+visible after the next publish. Syllabi without an artifact (drafts, or
+content never published through this action) keep using the live tables.
+
+Artifacts never change after they are written, so decoded payloads are kept in
+a small in-process cache keyed by artifact id and content hash.
+"""
+import hashlib
+import json
+import zlib
+from functools import lru_cache
+
+from django.db import transaction
+from django.db.models import Max, OuterRef, Subquery
+from rest_framework.renderers import JSONRenderer
+
+from authentication.models import Chapter, Syllabus, SyllabusArtifact, Topic
+from authentication.serializers import ChapterSerializer, TopicSerializer
+from authentication.services.content_cache import bump_course_version_on_commit
+from authentication.services.tree_builder import build_syllabus_tree
+
+
+ARTIFACT_CACHE_SIZE = 256
+
+
+def compile_syllabus_payload(syllabus_id):
+    """Public tree and listings of a syllabus as JSON bytes, or None if it is not public."""
+    tree = build_syllabus_tree(syllabus_id)
+    if tree is None:
+        return None
+    chapters = (
+        Chapter.objects.filter(syllabus_id=syllabus_id, is_publicly_visible=True)
+        .select_related('syllabus__subject')
+        .order_by('chapter_number')
+    )
+    topics = (
+        Topic.objects.filter(chapter__syllabus_id=syllabus_id, is_publicly_visible=True)
+        .select_related('chapter')
+        .order_by('chapter_id', 'order')
+    )
+    topics_by_chapter = {}
+    for row in TopicSerializer(topics, many=True).data:
+        topics_by_chapter.setdefault(str(row['chapter']), []).append(row)
+    return JSONRenderer().render({
+        'tree': tree,
+        'chapters': ChapterSerializer(chapters, many=True).data,
+        'topics': topics_by_chapter,
+    })
+
+
+@transaction.atomic
+def publish_syllabus(syllabus, user=None):
+    """
+    Mark ``syllabus`` published and store a new artifact version of its public
+    subtree. Raises ValueError when its subject or course is not public.
+    """
+    Syllabus.objects.select_for_update().filter(pk=syllabus.pk).first()
+    if syllabus.status != 'PUBLISHED' or not syllabus.is_active:
+        syllabus.status = 'PUBLISHED'
+        syllabus.is_active = True
+        syllabus.save()
+    syllabus.refresh_from_db(fields=['is_publicly_visible'])
+    if not syllabus.is_publicly_visible:
+        raise ValueError("Syllabus cannot be published while its subject or course is not published")
+
+    payload = compile_syllabus_payload(syllabus.id)
+    document = json.loads(payload)
+    latest = SyllabusArtifact.objects.filter(syllabus=syllabus).aggregate(latest=Max('version'))['latest']
+    artifact = SyllabusArtifact.objects.create(
+        syllabus=syllabus,
+        version=(latest or 0) + 1,
+        payload=zlib.compress(payload, 6),
+        content_hash=hashlib.sha256(payload).hexdigest(),
+        chapter_count=len(document['chapters']),
+        topic_count=sum(len(rows) for rows in document['topics'].values()),
+        published_by=user if user is not None and user.is_authenticated else None,
+    )
+    bump_course_version_on_commit(syllabus.subject.course_id)
+    return artifact
+
+
+def _current_artifacts():
+    """Latest artifact of each syllabus that is still publicly visible."""
+    latest = (
+        SyllabusArtifact.objects.filter(syllabus=OuterRef('syllabus'))
+        .order_by('-version')
+        .values('version')[:1]
+    )
+    return SyllabusArtifact.objects.filter(
+        syllabus__is_publicly_visible=True,
+        version=Subquery(latest),
+    )
+
+
+@lru_cache(maxsize=ARTIFACT_CACHE_SIZE)
+def load_artifact_document(artifact_id, content_hash):
+    """Decoded artifact payload. Treat it as read-only: it is shared between requests."""
+    payload = SyllabusArtifact.objects.values_list('payload', flat=True).get(pk=artifact_id)
+    return json.loads(zlib.decompress(bytes(payload)))
+
+
+def published_syllabus_document(syllabus_id):
+    """Decoded current artifact of a public syllabus, or None when it has none."""
+    row = _current_artifacts().filter(syllabus_id=syllabus_id).values_list('id', 'content_hash').first()
+    return None if row is None else load_artifact_document(*row)
+
+
+def published_syllabus_trees(course_id):
+    """{syllabus id: artifact tree} for the published syllabi of a course."""
+    rows = (
+        _current_artifacts()
+        .filter(syllabus__subject__course_id=course_id)
+        .values_list('syllabus_id', 'id', 'content_hash')
+    )
+    return {syllabus_id: load_artifact_document(pk, content_hash)['tree'] for syllabus_id, pk, content_hash in rows}
+
+
+def project_rows(rows, serializer_class, fields=None, exclude=None):
+    """Apply a ``?fields=`` / ``?exclude=`` fieldset to listing rows read from an artifact."""
+    omitted = set(serializer_class._omitted_fields(fields, exclude))
+    if not omitted:
+        return rows
+    return [{key: value for key, value in row.items() if key not in omitted} for row in rows]
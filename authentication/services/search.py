@@ -0,0 +1,246 @@
+"""
+Full-text search over the public content hierarchy.
+
+Topics (title, description, notes), chapters (title) and subjects (name) are
+indexed inside the database so the index follows every write, including
+queryset ``update()`` calls that bypass signals:
+
+* SQLite: one FTS5 external-content table per model, kept in sync by triggers.
+* PostgreSQL: a generated ``search_vector`` tsvector column with a GIN index.
+* Anything else (or SQLite without FTS5): a ``LIKE`` fallback.
+
+Hits are ranked (bm25 / ts_rank) and returned with their breadcrumb path.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Q
+
+from authentication.models import Chapter, Subject, Topic
+
+
+SEARCH_MAX_LIMIT = 50
+
+# kind -> (model, indexed columns with their rank weights, breadcrumb path)
+INDEXED_MODELS = {
+    'topic': (Topic, (('title', 10.0), ('description', 2.0), ('notes', 1.0)), 'chapter__syllabus__subject__course'),
+    'chapter': (Chapter, (('title', 10.0),), 'syllabus__subject__course'),
+    'subject': (Subject, (('name', 10.0),), 'course'),
+}
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+_PG_WEIGHTS = ('A', 'B', 'C', 'D')
+
+
+def _fts_table(model_cls):
+    return f'{model_cls._meta.db_table}_fts'
+
+
+def _fts5_available():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if cursor.fetchone()[0]:
+            return True
+        # Builds with FTS5 loaded as an extension do not report the compile option.
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+            cursor.execute("DROP TABLE temp._fts5_probe")
+        except Exception:
+            return False
+        return True
+
+
+_backend = None
+
+
+def search_backend():
+    global _backend
+    if _backend is None:
+        if connection.vendor == 'postgresql':
+            _backend = 'postgresql'
+        elif connection.vendor == 'sqlite' and _fts5_available():
+            _backend = 'fts5'
+        else:
+            _backend = 'like'
+    return _backend
+
+
+# ---------------------------------------------------------------- index DDL
+
+def _sqlite_index_sql(model_cls, columns):
+    table = model_cls._meta.db_table
+    fts = _fts_table(model_cls)
+    names = [name for name, _ in columns]
+    cols = ', '.join(names)
+    new_values = ', '.join(f'new.{name}' for name in names)
+    old_values = ', '.join(f'old.{name}' for name in names)
+    delete_row = f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES('delete', old.id, {old_values});"
+    insert_row = f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='id', "
+        f"tokenize='unicode61 remove_diacritics 2')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN {delete_row} {insert_row} END",
+    ]
+
+
+def _postgres_index_sql(model_cls, columns):
+    table = model_cls._meta.db_table
+    vector = ' || '.join(
+        f"setweight(to_tsvector('simple', coalesce({name}, '')), '{_PG_WEIGHTS[min(position, 3)]}')"
+        for position, (name, _) in enumerate(columns)
+    )
+    return [
+        f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ({vector}) STORED",
+        f"CREATE INDEX IF NOT EXISTS {table}_search_idx ON {table} USING GIN (search_vector)",
+    ]
+
+
+def _sqlite_triggers_present(model_cls):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE %s",
+            [f'{_fts_table(model_cls)}_a%'],
+        )
+        return cursor.fetchone()[0] == 3
+
+
+def ensure_search_index(rebuild=False):
+    """
+    Create the search index if it is missing. Idempotent; run after migrations
+    because SQLite table rebuilds drop the triggers that keep FTS5 in sync.
+    Returns the backend in use.
+    """
+    backend = search_backend()
+    if backend == 'like':
+        return backend
+
+    with connection.cursor() as cursor:
+        for model_cls, columns, _ in INDEXED_MODELS.values():
+            if backend == 'postgresql':
+                for statement in _postgres_index_sql(model_cls, columns):
+                    cursor.execute(statement)
+                continue
+            needs_rebuild = rebuild or not _sqlite_triggers_present(model_cls)
+            for statement in _sqlite_index_sql(model_cls, columns):
+                cursor.execute(statement)
+            if needs_rebuild:
+                fts = _fts_table(model_cls)
+                cursor.execute(f"INSERT INTO {fts}({fts}) VALUES('rebuild')")
+    return backend
+
+
+# ---------------------------------------------------------------- querying
+
+def _tokens(query):
+    return _TOKEN_RE.findall(query.lower())
+
+
+def _ranked_ids_fts5(model_cls, columns, tokens, limit):
+    table = model_cls._meta.db_table
+    fts = _fts_table(model_cls)
+    weights = ', '.join(str(weight) for _, weight in columns)
+    # Every token must match; the last one also matches as a prefix (type-ahead).
+    match = ' '.join(f'"{token}"' for token in tokens[:-1])
+    match = f'{match} "{tokens[-1]}"*'.strip()
+    sql = (
+        f"SELECT c.id, -bm25({fts}, {weights}) AS score FROM {fts} "
+        f"JOIN {table} c ON c.id = {fts}.rowid "
+        f"WHERE {fts} MATCH %s AND c.is_publicly_visible "
+        f"ORDER BY bm25({fts}, {weights}) LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match, limit])
+        return cursor.fetchall()
+
+
+def _ranked_ids_postgres(model_cls, tokens, limit):
+    table = model_cls._meta.db_table
+    tsquery = ' & '.join(f'{token}:*' for token in tokens)
+    sql = (
+        f"SELECT id, ts_rank(search_vector, q) AS score FROM {table}, to_tsquery('simple', %s) q "
+        f"WHERE search_vector @@ q AND is_publicly_visible "
+        f"ORDER BY score DESC LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [tsquery, limit])
+        return cursor.fetchall()
+
+
+def _ranked_ids_like(model_cls, columns, tokens, limit):
+    queryset = model_cls.objects.filter(is_publicly_visible=True)
+    for token in tokens:
+        queryset = queryset.filter(
+            Q(*[Q(**{f'{name}__icontains': token}) for name, _ in columns], _connector=Q.OR)
+        )
+    title = columns[0][0]
+    ids = queryset.order_by(title, 'id').values_list('id', flat=True)[:limit]
+    return [(pk, 0.0) for pk in ids]
+
+
+def _breadcrumb(obj, path):
+    crumbs = []
+    node = obj
+    for attr in path.split('__'):
+        node = getattr(node, attr)
+        crumbs.append({
+            'type': node._meta.model_name,
+            'id': node.id,
+            'title': getattr(node, 'title', None) or getattr(node, 'name', ''),
+            'slug': node.slug,
+        })
+    return list(reversed(crumbs))
+
+
+def search_content(query, limit=20):
+    """
+    Ranked public hits for ``query`` across topics, chapters and subjects.
+    Each hit carries its breadcrumb from the course down to its parent.
+    """
+    tokens = _tokens(query)
+    if not tokens:
+        return []
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
+    backend = search_backend()
+
+    hits = []
+    for kind, (model_cls, columns, path) in INDEXED_MODELS.items():
+        if backend == 'fts5':
+            ranked = _ranked_ids_fts5(model_cls, columns, tokens, limit)
+        elif backend == 'postgresql':
+            ranked = _ranked_ids_postgres(model_cls, tokens, limit)
+        else:
+            ranked = _ranked_ids_like(model_cls, columns, tokens, limit)
+        if not ranked:
+            continue
+
+        objects = model_cls.objects.select_related(path).only(
+            'id', 'slug', columns[0][0], *_breadcrumb_fields(path)
+        ).in_bulk([pk for pk, _ in ranked])
+        for pk, score in ranked:
+            obj = objects.get(pk)
+            if obj is None:
+                continue
+            hits.append({
+                'type': kind,
+                'id': obj.id,
+                'title': getattr(obj, columns[0][0]),
+                'slug': obj.slug,
+                'score': round(float(score), 4),
+                'breadcrumb': _breadcrumb(obj, path),
+            })
+
+    hits.sort(key=lambda hit: -hit['score'])
+    return hits[:limit]
+
+
+def _breadcrumb_fields(path):
+    """Columns needed to render a breadcrumb, for ``.only()`` alongside ``select_related``."""
+    fields = []
+    prefix = ''
+    for attr in path.split('__'):
+        prefix = f'{prefix}__{attr}' if prefix else attr
+        label = 'name' if attr == 'subject' else 'title'
+        fields.extend([prefix, f'{prefix}__slug', f'{prefix}__{label}'])
+    return fields
@@ -0,0 +1,119 @@
+"""
+Background syllabus imports.
+
+``queue_syllabus_import`` stores the upload on a ``SyllabusImportJob`` and
+hands it to ``import_syllabus_task`` once that row is committed; the admin
+request returns straight away with the job id. The worker runs the same extract -> parse -> import steps as
+the synchronous endpoint, writing the current phase, page progress and
+created-row counts onto the job as it goes. If the broker cannot be reached
+the job runs inline, like deferred cascades do.
+"""
+import logging
+
+from django.db import transaction
+from django.utils import timezone
+
+from authentication.models import SyllabusImportJob
+from authentication.services.file_parser import extract_text_from_uploaded_file, parse_syllabus_text
+from authentication.services.syllabus_service import import_syllabus_structure
+
+
+logger = logging.getLogger(__name__)
+
+# Write page progress every N pages (and on the last page) rather than per page.
+PROGRESS_EVERY = 10
+
+
+def _update(job, **fields):
+    for field, value in fields.items():
+        setattr(job, field, value)
+    SyllabusImportJob.objects.filter(pk=job.pk).update(updated_at=timezone.now(), **fields)
+
+
+def queue_syllabus_import(*, subject, uploaded_file, options, user=None):
+    """Store ``uploaded_file`` on a new job and start it. Returns the job."""
+    job = SyllabusImportJob.objects.create(
+        subject=subject,
+        file_name=getattr(uploaded_file, "name", "") or "upload",
+        upload=uploaded_file,
+        options=options,
+        created_by=user if user is not None and user.is_authenticated else None,
+    )
+    # A worker must never look for a job row that has not been committed yet.
+    transaction.on_commit(lambda: _dispatch(job))
+    return job
+
+
+def _dispatch(job):
+    from authentication.tasks import import_syllabus_task
+
+    try:
+        task = import_syllabus_task.delay(job.pk)
+    except Exception:
+        logger.exception("Could not queue syllabus import job %s; running inline", job.pk)
+        run_import_job(job.pk)
+        job.refresh_from_db()
+    else:
+        _update(job, task_id=task.id or "")
+
+
+def _finish(job, **fields):
+    """Record the outcome; the stored upload is not needed once the job has run."""
+    if job.upload:
+        job.upload.delete(save=False)
+    _update(job, upload="", finished_at=timezone.now(), **fields)
+
+
+def run_import_job(job_id):
+    """
+    Task body: import the job's file and record the outcome on the job.
+    The job is claimed with a conditional UPDATE, so a redelivered task (or
+    the inline fallback racing a late delivery) never runs it twice.
+    """
+    now = timezone.now()
+    claimed = SyllabusImportJob.objects.filter(pk=job_id, status='QUEUED').update(
+        status='RUNNING', phase='EXTRACTING', started_at=now, updated_at=now
+    )
+    if not claimed:
+        return None
+    job = SyllabusImportJob.objects.get(pk=job_id)
+
+    def report(done, total):
+        if done == total or done - job.pages_processed >= PROGRESS_EVERY:
+            _update(job, pages_processed=done, pages_total=total)
+
+    options = job.options or {}
+    try:
+        # Read from storage in chunks; PDFs are opened by path.
+        text = extract_text_from_uploaded_file(job.upload, progress=report)
+        job.upload.close()
+
+        _update(job, phase='PARSING')
+        parsed_chapters = parse_syllabus_text(text)
+
+        _update(job, phase='IMPORTING')
+        result = import_syllabus_structure(
+            subject_id=job.subject_id,
+            title=options.get("title") or job.file_name.rsplit(".", 1)[0],
+            academic_year=options.get("academic_year", ""),
+            description=options.get("description", ""),
+            status=options.get("status", "DRAFT"),
+            is_active=options.get("is_active", True),
+            chapters_payload=parsed_chapters,
+            mode=options.get("mode", "create"),
+        )
+    except ValueError as exc:
+        _finish(job, status='FAILED', error=str(exc))
+    except Exception as exc:
+        logger.exception("Syllabus import job %s failed", job.pk)
+        _finish(job, status='FAILED', error=f"Import failed: {exc}")
+    else:
+        _finish(
+            job,
+            status='SUCCEEDED',
+            phase='DONE',
+            syllabus=result["syllabus"],
+            chapters_created=result["chapters_created"],
+            topics_created=result["topics_created"],
+        )
+    return job
@@ -0,0 +1,210 @@
+"""
+Incremental re-import of a syllabus from a corrected file.
+
+Instead of creating a fresh tree, parsed chapters and topics are matched to
+the rows the syllabus already has, and only the differences are written:
+
+* chapters match by normalized title first, then by chapter number (so a
+  renamed chapter keeps its id, and an inserted chapter does not shift the
+  identity of the ones after it);
+* topics match by normalized title within their chapter, then anywhere in the
+  syllabus (a topic moved to another chapter keeps its id);
+* matched rows get their new title / number / order / chapter, unmatched
+  parsed entries are inserted, and unmatched existing rows are deactivated.
+
+Matched topics keep their id, ``search_status``, videos and tasks, so a
+re-import does not trigger new YouTube searches for content that is unchanged.
+Inactive rows take part in matching and are reactivated when they reappear.
+The syllabus row itself takes the uploaded description, status and active
+flag, so a merge never leaves active chapters under an inactive syllabus.
+"""
+from django.db.models import F
+from django.utils import timezone
+
+from authentication.models import Chapter, Topic, allocate_unique_slugs
+from authentication.services.content_cache import bump_course_version_on_commit
+from authentication.services.visibility import refresh_public_visibility
+
+
+def normalize_title(title):
+    return " ".join(title.split()).lower()
+
+
+def _title_pool(rows):
+    """{normalized title: rows}, active rows first so they are matched before inactive ones."""
+    pool = {}
+    for row in sorted(rows, key=lambda row: (not row.is_active, row.pk)):
+        pool.setdefault(normalize_title(row.title), []).append(row)
+    return pool
+
+
+def _take(pool, title, matched):
+    for row in pool.get(normalize_title(title), []):
+        if row.pk not in matched:
+            matched.add(row.pk)
+            return row
+    return None
+
+
+def _park(leftovers, taken, field):
+    """
+    Final ``field`` values for unmatched rows: each keeps its current value
+    unless a matched or new row needs it, in which case it moves above every
+    value in use.
+    """
+    next_free = max([*taken, *(getattr(row, field) for row in leftovers)], default=0) + 1
+    positions = {}
+    for row in sorted(leftovers, key=lambda row: getattr(row, field)):
+        position = getattr(row, field)
+        if position in taken:
+            position, next_free = next_free, next_free + 1
+        taken.add(position)
+        positions[row.pk] = position
+    return positions
+
+
+def _write(model_cls, rows, changes, field, scope_field, fields, batch_size):
+    """
+    Apply ``changes`` ({pk: {attr: value}}) to ``rows`` with one shift UPDATE and
+    ``bulk_update``. Rows whose ``field`` or ``scope_field`` changes are first
+    shifted above every current and final value, so no intermediate state trips
+    the (scope, field) unique constraint.
+    """
+    changed = [row for row in rows if row.pk in changes]
+    if not changed:
+        return
+    moving = [
+        row.pk for row in changed
+        if changes[row.pk].get(field, getattr(row, field)) != getattr(row, field)
+        or changes[row.pk].get(scope_field, getattr(row, scope_field)) != getattr(row, scope_field)
+    ]
+    if moving:
+        highest = max(
+            [getattr(row, field) for row in rows] + [changes[pk].get(field, 0) for pk in changes]
+        )
+        model_cls.objects.filter(pk__in=moving).update(**{field: F(field) + highest + 1})
+
+    now = timezone.now()
+    for row in changed:
+        for attr, value in changes[row.pk].items():
+            setattr(row, attr, value)
+        row.updated_at = now
+    model_cls.objects.bulk_update(changed, [*fields, 'updated_at'], batch_size=batch_size)
+
+
+def merge_syllabus_structure(
+    syllabus, planned, *, description="", status="DRAFT", is_active=True, batch_size=None
+):
+    """
+    Bring ``syllabus`` in line with ``planned`` chapters (as returned by
+    ``plan_syllabus_structure``). Must run inside a transaction; returns
+    created / updated / deactivated / unchanged counts per level.
+    """
+    wanted = {"description": description, "status": status, "is_active": is_active}
+    diff = {attr: value for attr, value in wanted.items() if getattr(syllabus, attr) != value}
+    if diff:
+        # save() so visibility, the deactivation cascade and counters behave as for any edit.
+        for attr, value in diff.items():
+            setattr(syllabus, attr, value)
+        syllabus.save()
+
+    chapters = list(Chapter.objects.filter(syllabus=syllabus))
+    topics = list(Topic.objects.filter(chapter__syllabus=syllabus))
+    summary = {f"{level}_{outcome}": 0 for level in ("chapters", "topics")
+               for outcome in ("created", "updated", "deactivated", "unchanged")}
+
+    # Chapters: title match, then number match, then new.
+    matched = set()
+    by_title = _title_pool(chapters)
+    by_number = {chapter.chapter_number: chapter for chapter in chapters}
+    targets = [_take(by_title, title, matched) for _, title, _ in planned]
+    for index, (number, _, _) in enumerate(planned):
+        candidate = by_number.get(number)
+        if targets[index] is None and candidate is not None and candidate.pk not in matched:
+            matched.add(candidate.pk)
+            targets[index] = candidate
+
+    chapter_changes = {}
+    new_chapters = []
+    for target, (number, title, _) in zip(targets, planned):
+        if target is None:
+            new_chapters.append(Chapter(
+                syllabus=syllabus, title=title, chapter_number=number, status=status, is_active=is_active,
+            ))
+            continue
+        wanted = {"title": title, "chapter_number": number, "is_active": is_active}
+        diff = {attr: value for attr, value in wanted.items() if getattr(target, attr) != value}
+        if diff:
+            chapter_changes[target.pk] = diff
+        summary["chapters_updated" if diff else "chapters_unchanged"] += 1
+
+    leftovers = [chapter for chapter in chapters if chapter.pk not in matched]
+    parked = _park(leftovers, {number for number, _, _ in planned}, "chapter_number")
+    for chapter in leftovers:
+        diff = {"is_active": False} if chapter.is_active else {}
+        if parked[chapter.pk] != chapter.chapter_number:
+            diff["chapter_number"] = parked[chapter.pk]
+        if diff:
+            chapter_changes[chapter.pk] = diff
+        summary["chapters_deactivated"] += chapter.is_active
+
+    _write(Chapter, chapters, chapter_changes, "chapter_number", "syllabus_id",
+           ["title", "chapter_number", "is_active"], batch_size)
+    allocate_unique_slugs(Chapter, [(chapter, chapter.slug_source()) for chapter in new_chapters])
+    Chapter.objects.bulk_create(new_chapters, batch_size=batch_size)
+    summary["chapters_created"] = len(new_chapters)
+
+    # Topics: title match in the same chapter, then anywhere in the syllabus, then new.
+    final_chapters = iter(new_chapters)
+    placements = []  # (chapter, order, title, existing topic or None)
+    topic_matched = set()
+    by_chapter = {}
+    for topic in topics:
+        by_chapter.setdefault(topic.chapter_id, []).append(topic)
+    pools = {chapter_id: _title_pool(rows) for chapter_id, rows in by_chapter.items()}
+    for target, (_, _, topic_titles) in zip(targets, planned):
+        chapter = target if target is not None else next(final_chapters)
+        pool = pools.get(chapter.pk, {}) if target is not None else {}
+        for order, title in enumerate(topic_titles, start=1):
+            placements.append((chapter, order, title, _take(pool, title, topic_matched)))
+
+    syllabus_pool = _title_pool(topics)
+    placements = [
+        (chapter, order, title, existing or _take(syllabus_pool, title, topic_matched))
+        for chapter, order, title, existing in placements
+    ]
+
+    topic_changes = {}
+    new_topics = []
+    taken = {}
+    for chapter, order, title, existing in placements:
+        taken.setdefault(chapter.pk, set()).add(order)
+        if existing is None:
+            new_topics.append(Topic(chapter=chapter, title=title, order=order, status=status, is_active=is_active))
+            continue
+        wanted = {"chapter_id": chapter.pk, "title": title, "order": order, "is_active": is_active}
+        diff = {attr: value for attr, value in wanted.items() if getattr(existing, attr) != value}
+        if diff:
+            topic_changes[existing.pk] = diff
+        summary["topics_updated" if diff else "topics_unchanged"] += 1
+
+    for chapter_id, rows in by_chapter.items():
+        leftovers = [topic for topic in rows if topic.pk not in topic_matched]
+        parked = _park(leftovers, taken.setdefault(chapter_id, set()), "order")
+        for topic in leftovers:
+            diff = {"is_active": False} if topic.is_active else {}
+            if parked[topic.pk] != topic.order:
+                diff["order"] = parked[topic.pk]
+            if diff:
+                topic_changes[topic.pk] = diff
+            summary["topics_deactivated"] += topic.is_active
+
+    _write(Topic, topics, topic_changes, "order", "chapter_id", ["chapter", "title", "order", "is_active"], batch_size)
+    allocate_unique_slugs(Topic, [(topic, topic.slug_source()) for topic in new_topics])
+    Topic.objects.bulk_create(new_topics, batch_size=batch_size)
+    summary["topics_created"] = len(new_topics)
+
+    # Queryset writes skip save() and signals: fix visibility, counters and cached trees once.
+    refresh_public_visibility(syllabus)
+    bump_course_version_on_commit(syllabus.subject.course_id)
+    return summary
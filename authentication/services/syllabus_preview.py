@@ -0,0 +1,98 @@
+"""
+Two-phase syllabus imports: preview, then commit by token.
+
+``create_import_preview`` keeps the chapter/topic structure parsed from an
+upload in the cache under a random, short-lived token. The admin reviews it
+and ``commit_import_preview`` imports that exact structure, so the file is
+neither uploaded nor extracted a second time and nothing is written to the
+database until the admin commits. Tokens belong to the admin who created them
+and are used once.
+
+Previews live in the ``default`` cache, which is Redis in deployments (see
+``CACHES`` in settings.py), so a preview made on one web worker can be
+committed on another. A local-memory default cache (``LOCAL_CACHE=1``) is only
+suitable for single-process runs.
+
+A commit claims its token by deleting it before importing: cache deletes are
+atomic and report whether the key existed, so of two concurrent commits of the
+same token (a double-clicked button) only one imports.
+"""
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+
+from authentication.services.syllabus_service import import_syllabus_structure, plan_syllabus_structure
+
+
+DEFAULT_PREVIEW_TTL = 30 * 60
+
+
+def preview_ttl():
+    return getattr(settings, "SYLLABUS_IMPORT_PREVIEW_TTL", DEFAULT_PREVIEW_TTL)
+
+
+def _preview_key(token):
+    return f"syllabus-import-preview:{token}"
+
+
+def create_import_preview(*, subject_id, title, options, chapters_payload, user):
+    """
+    Cache the import plan for ``chapters_payload`` and return ``(token, preview)``.
+    ``preview["chapters"]`` is what a commit will create: numbered, deduplicated
+    chapters with their topic titles. Raises ValueError when nothing would be imported.
+    """
+    planned = plan_syllabus_structure(chapters_payload or [])
+    if not planned:
+        raise ValueError("No valid chapters found to create")
+
+    preview = {
+        "subject_id": subject_id,
+        "title": title,
+        "options": options,
+        "user_id": user.pk,
+        "chapters": [
+            {"chapter_number": chapter_number, "title": chapter_title, "topics": topics}
+            for chapter_number, chapter_title, topics in planned
+        ],
+    }
+    token = secrets.token_urlsafe(24)
+    cache.set(_preview_key(token), preview, preview_ttl())
+    return token, preview
+
+
+def get_import_preview(token, user):
+    """The cached preview for ``token`` if it exists and was created by ``user``, else None."""
+    if not token:
+        return None
+    preview = cache.get(_preview_key(token))
+    if preview is None or preview["user_id"] != user.pk:
+        return None
+    return preview
+
+
+def commit_import_preview(token, preview):
+    """
+    Claim ``token`` and import its preview. Returns None when another commit
+    already claimed the token. If the import fails the token is restored so
+    the admin can retry.
+    """
+    key = _preview_key(token)
+    if not cache.delete(key):
+        return None
+
+    options = preview["options"]
+    try:
+        return import_syllabus_structure(
+            subject_id=preview["subject_id"],
+            title=preview["title"],
+            academic_year=options.get("academic_year", ""),
+            description=options.get("description", ""),
+            status=options.get("status", "DRAFT"),
+            is_active=options.get("is_active", True),
+            chapters_payload=preview["chapters"],
+            mode=options.get("mode", "create"),
+        )
+    except Exception:
+        cache.set(key, preview, preview_ttl())
+        raise
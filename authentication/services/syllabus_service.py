@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.db import IntegrityError, transaction
 
-from authentication.models import Chapter, Subject, Syllabus, Topic
+from authentication.models import Chapter, Subject, Syllabus, Topic, allocate_unique_slugs
+from authentication.services.content_cache import bump_course_version_on_commit
+from authentication.services.syllabus_merge import merge_syllabus_structure
+from authentication.services.visibility import refresh_public_visibility
 
 
 def create_syllabus(*, subject, title, academic_year="", description="", status="DRAFT", is_active=True):
@@ -50,6 +54,50 @@ def create_topic(
     )
 
 
+DEFAULT_IMPORT_BATCH_SIZE = 500
+IMPORT_MODES = ("create", "merge")
+
+
+def _import_batch_size(batch_size=None):
+    if batch_size is not None:
+        return batch_size
+    return getattr(settings, "SYLLABUS_IMPORT_BATCH_SIZE", DEFAULT_IMPORT_BATCH_SIZE)
+
+
+def plan_syllabus_structure(chapters_payload):
+    """
+    Validate and dedupe parsed chapters in memory.
+
+    Returns [(chapter_number, title, [topic titles])]: chapters without a
+    positive number or a title are dropped, repeated chapter numbers keep the
+    first occurrence, and topics are deduped case-insensitively per chapter.
+    """
+    planned = []
+    seen_chapter_numbers = set()
+    for chapter_data in chapters_payload:
+        chapter_number = int(chapter_data.get("chapter_number", 0) or 0)
+        chapter_title = (chapter_data.get("title") or "").strip()
+        if chapter_number <= 0 or not chapter_title:
+            continue
+        if chapter_number in seen_chapter_numbers:
+            continue
+        seen_chapter_numbers.add(chapter_number)
+
+        topics = []
+        seen_topics = set()
+        for topic_title in chapter_data.get("topics", []):
+            clean_topic_title = (topic_title or "").strip()
+            if not clean_topic_title:
+                continue
+            normalized = clean_topic_title.lower()
+            if normalized in seen_topics:
+                continue
+            seen_topics.add(normalized)
+            topics.append(clean_topic_title)
+        planned.append((chapter_number, chapter_title, topics))
+    return planned
+
+
 @transaction.atomic
 def import_syllabus_structure(
     *,
@@ -60,8 +108,25 @@ def import_syllabus_structure(
     status="DRAFT",
     is_active=True,
     chapters_payload=None,
+    batch_size=None,
+    mode="create",
 ):
-    subject = Subject.objects.filter(id=subject_id, is_active=True).first()
+    """
+    Create a syllabus with its chapters and topics from parsed file content.
+
+    The payload is validated up front, slugs are allocated for each level in
+    one pass and rows are written with ``bulk_create`` (``batch_size`` rows per
+    INSERT, ``settings.SYLLABUS_IMPORT_BATCH_SIZE`` by default), so the query
+    count no longer grows with the number of chapters and topics.
+
+    With ``mode="merge"``, an existing syllabus with the same subject, title
+    and academic year is updated in place instead (see ``syllabus_merge``);
+    the result then has ``"merged": True`` and per-level update counts.
+    """
+    if mode not in IMPORT_MODES:
+        raise ValueError(f"mode must be one of: {', '.join(IMPORT_MODES)}")
+
+    subject = Subject.objects.filter(id=subject_id, is_active=True).select_related("course").first()
     if not subject:
         raise ValueError("subject_id is invalid or inactive")
 
@@ -69,6 +134,24 @@ def import_syllabus_structure(
     if not chapters_payload:
         raise ValueError("No parsed chapters found")
 
+    planned = plan_syllabus_structure(chapters_payload)
+    if not planned:
+        raise ValueError("No valid chapters found to create")
+
+    batch_size = _import_batch_size(batch_size)
+    if mode == "merge":
+        existing = (
+            Syllabus.objects.select_for_update()
+            .filter(subject=subject, title=title, academic_year=academic_year)
+            .first()
+        )
+        if existing is not None:
+            summary = merge_syllabus_structure(
+                existing, planned, description=description, status=status, is_active=is_active,
+                batch_size=batch_size,
+            )
+            return {"syllabus": existing, "merged": True, **summary}
+
     try:
         syllabus = create_syllabus(
             subject=subject,
@@ -81,53 +164,27 @@ def import_syllabus_structure(
     except IntegrityError as exc:
         raise ValueError(f"Could not create syllabus: {exc}") from exc
 
-    chapters_created = 0
-    topics_created = 0
-
-    seen_chapter_numbers = set()
-    for chapter_data in chapters_payload:
-        chapter_number = int(chapter_data.get("chapter_number", 0) or 0)
-        chapter_title = (chapter_data.get("title") or "").strip()
-        if chapter_number <= 0 or not chapter_title:
-            continue
-        if chapter_number in seen_chapter_numbers:
-            continue
-        seen_chapter_numbers.add(chapter_number)
-
-        chapter = create_chapter(
-            syllabus=syllabus,
-            title=chapter_title,
-            chapter_number=chapter_number,
-            status=status,
-            is_active=is_active,
-        )
-        chapters_created += 1
-
-        seen_topics = set()
-        order_counter = 0
-        for topic_title in chapter_data.get("topics", []):
-            clean_topic_title = (topic_title or "").strip()
-            if not clean_topic_title:
-                continue
-            normalized = clean_topic_title.lower()
-            if normalized in seen_topics:
-                continue
-            seen_topics.add(normalized)
-            order_counter += 1
-            create_topic(
-                chapter=chapter,
-                title=clean_topic_title,
-                order=order_counter,
-                status=status,
-                is_active=is_active,
-            )
-            topics_created += 1
-
-    if chapters_created == 0:
-        raise ValueError("No valid chapters found to create")
+    chapters = [
+        Chapter(syllabus=syllabus, title=chapter_title, chapter_number=chapter_number, status=status, is_active=is_active)
+        for chapter_number, chapter_title, _ in planned
+    ]
+    allocate_unique_slugs(Chapter, [(chapter, chapter.slug_source()) for chapter in chapters])
+    Chapter.objects.bulk_create(chapters, batch_size=batch_size)
+
+    topics = [
+        Topic(chapter=chapter, title=topic_title, order=order, status=status, is_active=is_active)
+        for chapter, (_, _, topic_titles) in zip(chapters, planned)
+        for order, topic_title in enumerate(topic_titles, start=1)
+    ]
+    allocate_unique_slugs(Topic, [(topic, topic.slug_source()) for topic in topics])
+    Topic.objects.bulk_create(topics, batch_size=batch_size)
+
+    # bulk_create skips save() and signals: set visibility flags, counters and cached trees once.
+    refresh_public_visibility(syllabus)
+    bump_course_version_on_commit(subject.course_id)
 
     return {
         "syllabus": syllabus,
-        "chapters_created": chapters_created,
-        "topics_created": topics_created,
+        "chapters_created": len(chapters),
+        "topics_created": len(topics),
     }
@@ -0,0 +1,131 @@
+"""
+Fast builder for the public course tree.
+
+Produces the same structure (and, once rendered, the same bytes) as
+``CourseFullTreeSerializer`` / ``SyllabusTreeSerializer``, but reads each level
+with a single ``.values()`` query and links rows to their parents by id in
+one pass, without instantiating model objects or serializer fields.
+"""
+import copy
+from collections import defaultdict
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.serializers import (
+    ChapterTreeSerializer,
+    CourseFullTreeSerializer,
+    SubjectTreeSerializer,
+    SyllabusTreeSerializer,
+    TopicTreeSerializer,
+)
+
+
+class TreeLevel:
+    def __init__(self, model, serializer_class, parent_field, ordering):
+        self.model = model
+        self.serializer_class = serializer_class
+        self.parent_field = parent_field
+        self.ordering = ordering
+        self.child_key = serializer_class.tree_child_field
+        self.fields = [name for name in serializer_class.Meta.fields if name != self.child_key]
+
+
+COURSE_LEVEL = TreeLevel(Course, CourseFullTreeSerializer, None, ())
+
+# Public levels below a course, top-down. Orderings match the views' Prefetch chain.
+PUBLIC_TREE_LEVELS = (
+    TreeLevel(Subject, SubjectTreeSerializer, 'course', ('order', 'name')),
+    TreeLevel(Syllabus, SyllabusTreeSerializer, 'subject', ('-academic_year', 'title')),
+    TreeLevel(Chapter, ChapterTreeSerializer, 'syllabus', ('chapter_number',)),
+    TreeLevel(Topic, TopicTreeSerializer, 'chapter', ('order',)),
+)
+
+
+def _descendant_rows(root_id, levels, skip_syllabi=()):
+    """
+    Yield (level, parent key, rows) for each level below the root, one query per level.
+    Rows under the syllabi in ``skip_syllabi`` are not read.
+    """
+    path = []
+    for level in levels:
+        path.insert(0, level.parent_field)
+        parent_key = f'{level.parent_field}_id'
+        rows = level.model.objects.filter(is_publicly_visible=True, **{'__'.join(path): root_id})
+        if skip_syllabi and 'syllabus' in path:
+            rows = rows.exclude(**{'__'.join(path[:path.index('syllabus') + 1]) + '__in': list(skip_syllabi)})
+        rows = rows.order_by(*level.ordering).values(parent_key, *level.fields)
+        yield level, parent_key, rows
+
+
+def prune_tree(node, levels, depth):
+    """Drop everything more than ``depth`` levels below ``node``; ``levels`` starts at the node's level."""
+    child_key = levels[0].child_key if levels else None
+    if depth is None or child_key is None or child_key not in node:
+        return node
+    if depth <= 0:
+        node.pop(child_key)
+        return node
+    for child in node[child_key]:
+        prune_tree(child, levels[1:], depth - 1)
+    return node
+
+
+def splice_published_syllabi(course_tree, published, depth=None):
+    """
+    Replace the syllabus nodes of a course tree (built either way) with their
+    artifact trees from ``published``, cut to the same ``depth``.
+    """
+    levels = PUBLIC_TREE_LEVELS[:depth]
+    if not published or len(levels) < 2:
+        return course_tree
+    syllabus_depth = len(levels) - 2
+    for subject in course_tree[COURSE_LEVEL.child_key]:
+        syllabi = subject[PUBLIC_TREE_LEVELS[0].child_key]
+        for index, node in enumerate(syllabi):
+            tree = published.get(node['id'])
+            if tree is not None:
+                syllabi[index] = prune_tree(copy.deepcopy(tree), PUBLIC_TREE_LEVELS[1:], syllabus_depth)
+    return course_tree
+
+
+def _build_tree(root_level, root_queryset, levels, published=None):
+    root = root_queryset.values(*root_level.fields).first()
+    if root is None:
+        return None
+
+    published = published or {}
+    parents = {root['id']: root}
+    parent_level = root_level
+    for level, parent_key, rows in _descendant_rows(root['id'], levels, skip_syllabi=published):
+        children_by_parent = defaultdict(list)
+        nodes = {}
+        for row in rows:
+            parent_id = row.pop(parent_key)
+            if parent_id in parents:
+                children_by_parent[parent_id].append(row)
+                nodes[row['id']] = row
+        for parent_id, parent in parents.items():
+            parent[parent_level.child_key] = children_by_parent.get(parent_id, [])
+        parents = nodes
+        parent_level = level
+
+    # Nodes of the last level read have no child key, like a depth-cut serializer.
+    return root
+
+
+def build_course_tree(course_id, depth=None, published=None):
+    """
+    Plain-dict course tree (published courses only), cut at ``depth`` levels.
+    ``published`` maps syllabus ids to artifact trees that replace the live subtree.
+    """
+    levels = PUBLIC_TREE_LEVELS[:depth]
+    queryset = Course.objects.filter(id=course_id, is_active=True, status='PUBLISHED')
+    tree = _build_tree(COURSE_LEVEL, queryset, levels, published)
+    # Published syllabi are served from their artifact tree; their live rows were not read.
+    return None if tree is None else splice_published_syllabi(tree, published, depth)
+
+
+def build_syllabus_tree(syllabus_id, depth=None):
+    """Plain-dict subtree for one publicly visible syllabus, cut at ``depth`` levels."""
+    levels = PUBLIC_TREE_LEVELS[2:][:depth]
+    queryset = Syllabus.objects.filter(id=syllabus_id, is_publicly_visible=True)
+    return _build_tree(PUBLIC_TREE_LEVELS[1], queryset, levels)
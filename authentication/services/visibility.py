@@ -0,0 +1,83 @@
+"""
+Maintenance of the denormalized ``is_publicly_visible`` flag.
+
+A node is publicly visible when it is active and published, and so is every
+ancestor up to the course. Public listings filter on the flag alone instead of
+joining the whole ancestor chain.
+"""
+from django.db.models import Q
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services.counters import course_id_of, recount_content_counters
+
+
+PUBLISHED = "PUBLISHED"
+
+# Content levels below Course, top-down, with the name of their parent field.
+LEVELS = (
+    (Subject, "course"),
+    (Syllabus, "subject"),
+    (Chapter, "syllabus"),
+    (Topic, "chapter"),
+)
+LEVEL_MODELS = (Course,) + tuple(model for model, _ in LEVELS)
+
+
+def _visible_condition(model_cls, parent_field):
+    own = Q(is_active=True, status=PUBLISHED)
+    if model_cls is Subject:
+        return own & Q(course__is_active=True, course__status=PUBLISHED)
+    return own & Q(**{f"{parent_field}__is_publicly_visible": True})
+
+
+def compute_public_visibility(instance):
+    """Visibility of a single node from its own state and its parent's stored state."""
+    if not (instance.is_active and instance.status == PUBLISHED):
+        return False
+    if isinstance(instance, Subject):
+        return Course.objects.filter(pk=instance.course_id, is_active=True, status=PUBLISHED).exists()
+    if isinstance(instance, Syllabus):
+        return Subject.objects.filter(pk=instance.subject_id, is_publicly_visible=True).exists()
+    if isinstance(instance, Chapter):
+        return Syllabus.objects.filter(pk=instance.syllabus_id, is_publicly_visible=True).exists()
+    if isinstance(instance, Topic):
+        return Chapter.objects.filter(pk=instance.chapter_id, is_publicly_visible=True).exists()
+    raise TypeError(f"Unsupported content node: {instance!r}")
+
+
+def descendant_scopes(root):
+    """
+    Yield (model, parent_field, filter kwargs) for each level below ``root``,
+    with the filter restricting rows to root's descendants.
+    """
+    depth = LEVEL_MODELS.index(type(root))
+    path = []
+    for model_cls, parent_field in LEVELS[depth:]:
+        path.insert(0, parent_field)
+        yield model_cls, parent_field, {"__".join(path): root.pk}
+
+
+def refresh_public_visibility(root=None):
+    """
+    Recompute the flag for every descendant of ``root`` (or the whole catalog).
+
+    Runs two set-based UPDATEs per level, each touching only rows whose stored
+    flag is wrong, so an unchanged subtree costs no writes. Content counters of
+    the affected course are rebuilt afterwards when anything may have moved.
+    """
+    if root is None:
+        scopes = [(model_cls, parent_field, {}) for model_cls, parent_field in LEVELS]
+    else:
+        scopes = descendant_scopes(root)
+
+    changed = 0
+    for model_cls, parent_field, scope in scopes:
+        rows = model_cls.objects.filter(**scope)
+        visible = _visible_condition(model_cls, parent_field)
+        changed += rows.filter(visible, is_publicly_visible=False).update(is_publicly_visible=True)
+        changed += rows.filter(is_publicly_visible=True).exclude(visible).update(is_publicly_visible=False)
+
+    # Below a course, the root itself has just flipped or had its subtree written in bulk.
+    if changed or (root is not None and not isinstance(root, Course)):
+        recount_content_counters(None if root is None else [course_id_of(root)])
+    return changed
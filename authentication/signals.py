@@ -0,0 +1,134 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+from .services.content_cache import COURSE_ID_PATHS, bump_course_version
+from .services.counters import (
+    apply_counter_deltas,
+    approved_video_total,
+    counted_video_chapter,
+    recount_content_counters,
+)
+
+# Parent foreign key of each node below Course.
+PARENT_FIELDS = {Subject: 'course_id', Syllabus: 'subject_id', Chapter: 'syllabus_id', Topic: 'chapter_id'}
+
+
+def course_id_for(instance):
+    """Resolve the course id of a content node from its parent foreign key."""
+    if isinstance(instance, Course):
+        return instance.pk
+    if isinstance(instance, Subject):
+        return instance.course_id
+    if isinstance(instance, Syllabus):
+        return Subject.objects.filter(pk=instance.subject_id).values_list('course_id', flat=True).first()
+    if isinstance(instance, Chapter):
+        return (
+            Syllabus.objects.filter(pk=instance.syllabus_id)
+            .values_list('subject__course_id', flat=True)
+            .first()
+        )
+    if isinstance(instance, Topic):
+        return (
+            Chapter.objects.filter(pk=instance.chapter_id)
+            .values_list('syllabus__subject__course_id', flat=True)
+            .first()
+        )
+    return None
+
+
+@receiver(pre_save)
+def remember_previous_course(sender, instance, raw=False, **kwargs):
+    # A node moved to another parent leaves a stale copy in the old course tree
+    # and stale counters on its old ancestors, so remember where it lived before the write.
+    if raw or sender not in PARENT_FIELDS or instance._state.adding:
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk)
+        .values_list(COURSE_ID_PATHS[sender], PARENT_FIELDS[sender])
+        .first()
+    )
+    instance._previous_course_id, instance._previous_parent_id = previous or (None, None)
+
+
+@receiver(post_save)
+def bump_content_version_on_save(sender, instance, raw=False, **kwargs):
+    if raw or sender not in COURSE_ID_PATHS:
+        return
+    bump_course_version(course_id_for(instance), getattr(instance, '_previous_course_id', None))
+
+
+@receiver(post_delete)
+def bump_content_version_on_delete(sender, instance, **kwargs):
+    if sender not in COURSE_ID_PATHS:
+        return
+    bump_course_version(course_id_for(instance))
+
+
+# ---------------------------------------------------------------- counters
+# Parent level of each node counted by the denormalized counters.
+COUNTED_PARENTS = {Subject: (Course, 'course_id'), Chapter: (Syllabus, 'syllabus_id'), Topic: (Chapter, 'chapter_id')}
+
+
+@receiver(post_save)
+def update_counters_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw or sender not in PARENT_FIELDS:
+        return
+    previous_parent_id = getattr(instance, '_previous_parent_id', None)
+    if not created and previous_parent_id not in (None, getattr(instance, PARENT_FIELDS[sender])):
+        # A move takes the node's whole subtree (and its videos) from one ancestor
+        # chain to another; moves are rare, so recount both courses.
+        recount_content_counters({instance._previous_course_id, course_id_for(instance)})
+        return
+    # Flips of subjects/chapters move whole subtrees: their save() refreshes
+    # visibility, which recounts the course. New nodes and topic flips are deltas.
+    if sender not in COUNTED_PARENTS or not (created or sender is Topic):
+        return
+    delta = getattr(instance, '_visibility_delta', 0)
+    if not delta:
+        return
+    counts = {f'{sender._meta.model_name}_count': delta}
+    if sender is Topic and not created:
+        counts['approved_video_count'] = delta * approved_video_total(instance.pk)
+    parent, parent_field = COUNTED_PARENTS[sender]
+    apply_counter_deltas(parent, getattr(instance, parent_field), **counts)
+
+
+@receiver(post_delete)
+def update_counters_on_delete(sender, instance, **kwargs):
+    # A deleted topic's videos are deleted (and uncounted) before the topic itself.
+    if sender not in COUNTED_PARENTS or not instance.is_publicly_visible:
+        return
+    parent, parent_field = COUNTED_PARENTS[sender]
+    apply_counter_deltas(parent, getattr(instance, parent_field), **{f'{sender._meta.model_name}_count': -1})
+
+
+@receiver(pre_save, sender=VideoResult)
+def remember_counted_video(sender, instance, raw=False, **kwargs):
+    instance._counted_chapter_id = None
+    if raw or instance._state.adding:
+        return
+    previous = VideoResult.objects.filter(pk=instance.pk).values_list('approval_status', 'topic_id').first()
+    if previous is not None:
+        instance._counted_chapter_id = counted_video_chapter(*previous)
+
+
+@receiver(post_save, sender=VideoResult)
+def update_video_counters_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    before = getattr(instance, '_counted_chapter_id', None)
+    after = counted_video_chapter(instance.approval_status, instance.topic_id)
+    if before == after:
+        return
+    touched = {
+        apply_counter_deltas(Chapter, before, approved_video_count=-1),
+        apply_counter_deltas(Chapter, after, approved_video_count=1),
+    }
+    bump_course_version(*touched)
+
+
+@receiver(post_delete, sender=VideoResult)
+def update_video_counters_on_delete(sender, instance, **kwargs):
+    chapter_id = counted_video_chapter(instance.approval_status, instance.topic_id)
+    bump_course_version(apply_counter_deltas(Chapter, chapter_id, approved_video_count=-1))
@@ -0,0 +1,36 @@
+# authentication/tasks.py
+from celery import shared_task
+from django.apps import apps
+
+from .services.cascade import run_deferred_cascade
+from .services.syllabus_import import run_import_job
+
+
+@shared_task(bind=True)
+def cascade_deactivate_task(self, model_label, pk):
+    """
+    Deactivate all descendants of a content node in the background.
+    Reports PROGRESS with {"done", "total"} while it runs.
+    """
+    model_cls = apps.get_model(model_label)
+    try:
+        root = model_cls.objects.get(pk=pk)
+    except model_cls.DoesNotExist:
+        return {"error": f"{model_label} {pk} not found"}
+
+    def report(done, total):
+        self.update_state(state='PROGRESS', meta={'done': done, 'total': total})
+
+    return {"deactivated": run_deferred_cascade(root, progress=report)}
+
+
+@shared_task
+def import_syllabus_task(job_id):
+    """
+    Import the file of a SyllabusImportJob. Progress is recorded on the job
+    itself (see SyllabusImportJobStatusView), not in the task result.
+    """
+    job = run_import_job(job_id)
+    if job is None:
+        return {"error": f"Import job {job_id} not found or already started"}
+    return {"job_id": job.pk, "status": job.status}
@@ -0,0 +1,69 @@
+"""
+Disk-spooled, size-limited file uploads.
+
+Django keeps uploads under ``FILE_UPLOAD_MAX_MEMORY_SIZE`` in memory and only
+checks their size once the whole body has been read. Upload views decorated
+with ``spooled_uploads`` instead write every file straight to a temporary file
+and stop reading as soon as it passes ``UPLOAD_MAX_SIZE_BYTES``, so a burst of
+parallel imports costs disk, not worker memory. Extractors then open the
+temporary file by path.
+"""
+from functools import wraps
+
+from django.conf import settings
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from rest_framework import status
+from rest_framework.response import Response
+
+
+DEFAULT_UPLOAD_MAX_SIZE = 10 * 1024 * 1024
+# Room for the multipart boundaries and ordinary form fields around the file.
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def upload_max_size():
+    return getattr(settings, "UPLOAD_MAX_SIZE_BYTES", DEFAULT_UPLOAD_MAX_SIZE)
+
+
+def too_large_message(max_size):
+    return f"File too large. Maximum size is {max_size // (1024 * 1024)}MB"
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class SpooledUploadHandler(TemporaryFileUploadHandler):
+    """Write every uploaded file to a temporary file and abort once it passes ``max_size``."""
+
+    def __init__(self, request=None, max_size=None):
+        super().__init__(request)
+        self.max_size = max_size or upload_max_size()
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        # A body that is too large even without its form fields is refused before it is read.
+        if content_length and content_length > self.max_size + MULTIPART_OVERHEAD:
+            raise UploadTooLarge(too_large_message(self.max_size))
+
+    def receive_data_chunk(self, raw_data, start):
+        if start + len(raw_data) > self.max_size:
+            self.file.close()
+            raise UploadTooLarge(too_large_message(self.max_size))
+        return super().receive_data_chunk(raw_data, start)
+
+
+def spooled_uploads(max_size=None):
+    """
+    Spool the files of an APIView method's request to disk with a streaming
+    size limit. Uploads over the limit get a 413 before the view sees them.
+    """
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            request._request.upload_handlers = [SpooledUploadHandler(request._request, max_size)]
+            try:
+                return view_method(self, request, *args, **kwargs)
+            except UploadTooLarge as exc:
+                return Response({"error": str(exc)}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        return wrapper
+    return decorator
@@ -35,11 +35,18 @@ urlpatterns = [
     # Syllabus endpoints (Admin)
     path('admin/syllabi/', SyllabusListCreateView.as_view(), name='syllabus-list-create'),
     path('admin/syllabi/<int:pk>/', SyllabusDetailView.as_view(), name='syllabus-detail'),
+    path('admin/syllabi/<int:pk>/publish/', SyllabusPublishView.as_view(), name='syllabus-publish'),
     path('admin/syllabi/import/', SyllabusImportView.as_view(), name='syllabus-import'),
+    path('admin/syllabi/import/preview/', SyllabusImportPreviewView.as_view(), name='syllabus-import-preview'),
+    path('admin/syllabi/import/commit/', SyllabusImportCommitView.as_view(), name='syllabus-import-commit'),
+    path('admin/syllabi/import-jobs/', SyllabusImportJobCreateView.as_view(), name='syllabus-import-job-create'),
+    path('admin/syllabi/import-jobs/<int:pk>/', SyllabusImportJobStatusView.as_view(), name='syllabus-import-job-status'),
+    path('admin/syllabi/<int:syllabus_id>/bulk/', SyllabusBulkContentView.as_view(), name='syllabus-bulk-content'),
     
     # Subject endpoints (Admin)
     path('admin/subjects/', SubjectListCreateView.as_view(), name='subject-list-create'),
     path('admin/subjects/<int:pk>/', SubjectDetailView.as_view(), name='subject-detail'),
+    path('admin/subjects/<int:pk>/move/', SubjectMoveView.as_view(), name='subject-move'),
     
     # Chapter endpoints (Admin)
     path('admin/chapters/', ChapterListCreateView.as_view(), name='chapter-list-create'),
@@ -48,6 +55,7 @@ urlpatterns = [
     # Topic endpoints (Admin)
     path('admin/topics/', TopicListCreateView.as_view(), name='topic-list-create'),
     path('admin/topics/<int:pk>/', TopicDetailView.as_view(), name='topic-detail'),
+    path('admin/topics/<int:pk>/move/', TopicMoveView.as_view(), name='topic-move'),
 
     # ==================== CONTENT CONSUMPTION ENDPOINTS (NON-ADMIN) ====================
     path('courses/', PublicCourseListView.as_view(), name='public-course-list'),
@@ -57,9 +65,12 @@ urlpatterns = [
     path('chapters/<int:chapter_id>/topics/', PublicTopicListByChapterView.as_view(), name='public-topic-list-by-chapter'),
     path('courses/<int:course_id>/full-tree/', CourseFullTreeView.as_view(), name='course-full-tree'),
     path('courses/<slug:slug>/full-tree/', CourseFullTreeBySlugView.as_view(), name='course-full-tree-by-slug'),
+    path('syllabi/<int:syllabus_id>/tree/', SyllabusTreeView.as_view(), name='syllabus-tree'),
+    path('search/', ContentSearchView.as_view(), name='content-search'),
 
     # Admin topic processing
     path('admin/process-topics/', AdminProcessTopicBatchView.as_view(), name='admin-process-topics'),
+    path('admin/cascades/<str:task_id>/', AdminCascadeStatusView.as_view(), name='admin-cascade-status'),
     
     # Task management (Admin)
     path('admin/tasks/', AdminTaskListCreateView.as_view(), name='admin-task-list-create'),
@@ -3,31 +3,71 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
+from celery.result import AsyncResult
 from django.contrib.auth import authenticate
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
-from django.db.models import Prefetch
+from django.db.models import Count, Prefetch, Q
+from django.urls import reverse
 
 from .serializers import (
     UserRegistrationSerializer, UserProfileSerializer,
     PlanSerializer, SubscriptionSerializer, SubscriptionCreateSerializer,
     SubscriptionPriceSerializer,
-    CourseSerializer, SyllabusSerializer, SubjectSerializer, ChapterSerializer, TopicSerializer,
-    CourseFullTreeSerializer,
+    CourseSerializer, SyllabusSerializer, SyllabusImportJobSerializer, SubjectSerializer, ChapterSerializer, TopicSerializer,
+    CourseFullTreeSerializer, SyllabusTreeSerializer,
     TaskSerializer, AddVideoItemSerializer, TaskItemSerializer, AddQuizItemSerializer
 )
-from .models import User, UserProfile, Plan, Subscription, Course, Syllabus, Subject, Chapter, Topic,Task,TaskItem,TaskVideo,TaskQuiz,TaskGame,TaskActivity,VideoResult
+from .models import User, UserProfile, Plan, Subscription, Course, Syllabus, Subject, Chapter, Topic,Task,TaskItem,TaskVideo,TaskQuiz,TaskGame,TaskActivity,VideoResult,SyllabusImportJob
 from .utils import calculate_subscription_price, create_subscription, validate_profile_limits
-from .services.file_parser import extract_text_from_uploaded_file, parse_syllabus_text
+from .listing import list_response
+from .pagination import KeysetPagination
+from .responses import PrerenderedJSONResponse
+from .decorators import conditional_on_content_version
+from .query_budget import query_budget
+from .uploads import spooled_uploads
+from .services.content_cache import (
+    course_id_for_node,
+    get_catalog_version,
+    get_course_id_for_slug,
+    get_course_snapshot,
+    get_course_tree,
+    get_course_version,
+    get_node_version,
+    remember_course_slug,
+)
+from .services.bulk_content import BulkOperationError, apply_syllabus_operations
+from .services.ordering import MoveError, move_node
+from .services.publishing import (
+    project_rows,
+    publish_syllabus,
+    published_syllabus_document,
+    published_syllabus_trees,
+)
+from .services.search import search_content
+from .services.tree_builder import (
+    PUBLIC_TREE_LEVELS,
+    build_course_tree,
+    build_syllabus_tree,
+    prune_tree,
+    splice_published_syllabi,
+)
+from .services.file_parser import extract_text_from_uploaded_file, parse_syllabus_text, validate_upload
+from .services.syllabus_import import queue_syllabus_import
+from .services.syllabus_preview import commit_import_preview, create_import_preview, get_import_preview, preview_ttl
 from .services.syllabus_service import (
+    IMPORT_MODES,
     create_chapter,
     create_syllabus,
     create_topic,
     import_syllabus_structure,
 )
 from django.utils import timezone
+import copy
 import threading
 
 class RegisterView(APIView):
@@ -453,10 +493,10 @@ class CourseListCreateView(APIView):
     """
     permission_classes = [IsAuthenticated]
     
+    @query_budget(2)
     def get(self, request):
         courses = Course.objects.all().order_by('grade', 'title')
-        serializer = CourseSerializer(courses, many=True)
-        return Response(serializer.data)
+        return list_response(request, courses, CourseSerializer)
     
     def post(self, request):
         if not request.user.is_staff:
@@ -472,6 +512,51 @@ class CourseListCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+def _soft_delete_response(request, node):
+    """
+    204 once a soft delete has cascaded, or 202 with the task id when the
+    cascade to descendants was deferred to a background task.
+    """
+    cascade = getattr(node, 'cascade_result', None)
+    if cascade is not None and cascade.deferred:
+        return Response(
+            {
+                "message": "Descendants are being deactivated in the background",
+                "task_id": cascade.task_id,
+                "status_url": request.build_absolute_uri(reverse("admin-cascade-status", args=[cascade.task_id])),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+    return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+def _move_response(request, model_cls, pk, serializer_class):
+    """Shared body of the move endpoints: body is {"before": <id>} or {"after": <id>}."""
+    if not request.user.is_staff:
+        return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+    node = model_cls.objects.filter(pk=pk).first()
+    if node is None:
+        return Response({"error": f"{model_cls.__name__} not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    try:
+        before = request.data.get("before")
+        after = request.data.get("after")
+        before = int(before) if before is not None else None
+        after = int(after) if after is not None else None
+    except (TypeError, ValueError):
+        return Response({"error": "before/after must be an integer id"}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        renumbered = move_node(node, before=before, after=after)
+    except MoveError as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    data = dict(serializer_class(node).data)
+    data["renumbered"] = renumbered
+    return Response(data)
+
+
 class CourseDetailView(APIView):
     """
     GET: View course details
@@ -532,7 +617,7 @@ class CourseDetailView(APIView):
         
         course.is_active = False  # Soft delete
         course.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _soft_delete_response(request, course)
 
 
 # ==================== SYLLABUS VIEWS ====================
@@ -540,6 +625,7 @@ class CourseDetailView(APIView):
 class SyllabusListCreateView(APIView):
     permission_classes = [IsAuthenticated]
     
+    @query_budget(2)
     def get(self, request):
         syllabi = Syllabus.objects.all().order_by('-academic_year', 'title')
         subject_id = request.query_params.get('subject_id') or request.query_params.get('subject')
@@ -549,8 +635,7 @@ class SyllabusListCreateView(APIView):
             except ValueError:
                 return Response({"error": "subject_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
             syllabi = syllabi.filter(subject_id=subject_id)
-        serializer = SyllabusSerializer(syllabi, many=True)
-        return Response(serializer.data)
+        return list_response(request, syllabi, SyllabusSerializer)
     
     def post(self, request):
         if not request.user.is_staff:
@@ -626,37 +711,113 @@ class SyllabusDetailView(APIView):
         
         syllabus.is_active = False
         syllabus.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _soft_delete_response(request, syllabus)
+
+
+class SyllabusPublishView(APIView):
+    """
+    POST /api/auth/admin/syllabi/<pk>/publish/
+    Publish a syllabus and compile its public chapters/topics into a new
+    immutable artifact version; public endpoints serve that artifact until the
+    next publish.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        if not request.user.is_staff:
+            return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+        syllabus = Syllabus.objects.select_related('subject').filter(pk=pk).first()
+        if syllabus is None:
+            return Response({"error": "Syllabus not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            artifact = publish_syllabus(syllabus, user=request.user)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "message": "Syllabus published",
+                "syllabus_id": syllabus.id,
+                "version": artifact.version,
+                "content_hash": artifact.content_hash,
+                "chapters": artifact.chapter_count,
+                "topics": artifact.topic_count,
+                "published_at": artifact.created_at,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+def _syllabus_import_request(request):
+    """
+    (uploaded_file, subject_id, options) from an import upload, or an error
+    Response as the last element when the request is incomplete.
+    """
+    uploaded_file = request.FILES.get("file")
+    subject_id = request.data.get("subject_id")
+    options = {
+        "title": (request.data.get("title") or "").strip(),
+        "academic_year": (request.data.get("academic_year") or "").strip(),
+        "description": (request.data.get("description") or "").strip(),
+        "status": (request.data.get("status") or "DRAFT").strip().upper(),
+        "is_active": str(request.data.get("is_active", "true")).lower() in {"true", "1", "yes"},
+        "mode": (request.data.get("mode") or "create").strip().lower(),
+    }
+
+    if not subject_id:
+        return None, None, Response({"error": "subject_id is required"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        subject_id = int(subject_id)
+    except ValueError:
+        return None, None, Response({"error": "subject_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+    if options["mode"] not in IMPORT_MODES:
+        return None, None, Response(
+            {"error": f"mode must be one of: {', '.join(IMPORT_MODES)}"}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if not uploaded_file:
+        return None, None, Response({"error": "file is required"}, status=status.HTTP_400_BAD_REQUEST)
+    return uploaded_file, subject_id, options
+
+
+def _syllabus_import_response(result):
+    """201 with created-row counts, or 200 with the merge summary for re-imports."""
+    syllabus = result.pop("syllabus")
+    if result.pop("merged", False):
+        return Response({"message": "Syllabus re-imported successfully", "syllabus_id": syllabus.id, **result})
+    return Response(
+        {
+            "message": "Syllabus imported successfully",
+            "syllabus_id": syllabus.id,
+            "chapters_created": result["chapters_created"],
+            "topics_created": result["topics_created"],
+        },
+        status=status.HTTP_201_CREATED,
+    )
 
 
 class SyllabusImportView(APIView):
     """
     POST /api/auth/admin/syllabi/import/
     Import a PDF/DOC/DOCX syllabus and create syllabus -> chapters -> topics.
+    Runs inside the request; see SyllabusImportJobCreateView for large files.
+    With mode=merge, a syllabus with the same subject/title/academic year is
+    updated in place (matched chapters and topics keep their ids) and 200 is returned.
     """
     permission_classes = [IsAuthenticated]
 
+    @spooled_uploads()
     def post(self, request):
         if not request.user.is_staff:
             return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
 
-        uploaded_file = request.FILES.get("file")
-        subject_id = request.data.get("subject_id")
-        title = (request.data.get("title") or "").strip()
-        academic_year = (request.data.get("academic_year") or "").strip()
-        description = (request.data.get("description") or "").strip()
-        status_value = (request.data.get("status") or "DRAFT").strip().upper()
-        is_active = str(request.data.get("is_active", "true")).lower() in {"true", "1", "yes"}
-
-        if not subject_id:
-            return Response({"error": "subject_id is required"}, status=status.HTTP_400_BAD_REQUEST)
-        try:
-            subject_id = int(subject_id)
-        except ValueError:
-            return Response({"error": "subject_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
-
-        if not uploaded_file:
-            return Response({"error": "file is required"}, status=status.HTTP_400_BAD_REQUEST)
+        uploaded_file, subject_id, options = _syllabus_import_request(request)
+        if isinstance(options, Response):
+            return options
+        title = options["title"]
 
         try:
             extracted_text = extract_text_from_uploaded_file(uploaded_file)
@@ -668,34 +829,195 @@ class SyllabusImportView(APIView):
             result = import_syllabus_structure(
                 subject_id=subject_id,
                 title=title,
-                academic_year=academic_year,
-                description=description,
-                status=status_value,
-                is_active=is_active,
+                academic_year=options["academic_year"],
+                description=options["description"],
+                status=options["status"],
+                is_active=options["is_active"],
                 chapters_payload=parsed_chapters,
+                mode=options["mode"],
+            )
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as exc:
+            return Response({"error": f"Import failed: {exc}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        return _syllabus_import_response(result)
+
+
+class SyllabusImportPreviewView(APIView):
+    """
+    POST /api/auth/admin/syllabi/import/preview/
+    Same fields as the synchronous import. Extracts and parses the file without
+    writing anything and returns the chapters/topics that would be imported,
+    with a short-lived token for SyllabusImportCommitView.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @spooled_uploads()
+    def post(self, request):
+        if not request.user.is_staff:
+            return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+        uploaded_file, subject_id, options = _syllabus_import_request(request)
+        if isinstance(options, Response):
+            return options
+
+        if not Subject.objects.filter(id=subject_id, is_active=True).exists():
+            return Response({"error": "subject_id is invalid or inactive"}, status=status.HTTP_400_BAD_REQUEST)
+
+        title = options["title"] or getattr(uploaded_file, "name", "Imported Syllabus").rsplit(".", 1)[0]
+        try:
+            extracted_text = extract_text_from_uploaded_file(uploaded_file)
+            token, preview = create_import_preview(
+                subject_id=subject_id,
+                title=title,
+                options=options,
+                chapters_payload=parse_syllabus_text(extracted_text),
+                user=request.user,
             )
         except ValueError as exc:
             return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as exc:
+            return Response({"error": f"Preview failed: {exc}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        chapters = preview["chapters"]
+        return Response(
+            {
+                "token": token,
+                "expires_in": preview_ttl(),
+                "subject_id": subject_id,
+                "title": title,
+                "mode": options["mode"],
+                "chapter_count": len(chapters),
+                "topic_count": sum(len(chapter["topics"]) for chapter in chapters),
+                "chapters": chapters,
+            }
+        )
+
+
+class SyllabusImportCommitView(APIView):
+    """
+    POST /api/auth/admin/syllabi/import/commit/
+    Body: {"token": "..."} from a preview. Imports the previewed structure;
+    responds like the synchronous import. Unknown, expired or already
+    committed tokens get 404.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        if not request.user.is_staff:
+            return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+        token = (request.data.get("token") or "").strip()
+        if not token:
+            return Response({"error": "token is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        preview = get_import_preview(token, request.user)
+        if preview is None:
+            return Response({"error": "Import preview not found or expired"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            result = commit_import_preview(token, preview)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as exc:
             return Response({"error": f"Import failed: {exc}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        if result is None:
+            # A concurrent commit of the same token got there first.
+            return Response({"error": "Import preview not found or expired"}, status=status.HTTP_404_NOT_FOUND)
+
+        return _syllabus_import_response(result)
+
+
+class SyllabusImportJobCreateView(APIView):
+    """
+    POST /api/auth/admin/syllabi/import-jobs/
+    Same fields as the synchronous import. The file is imported by a background
+    worker; responds 202 with the job id to poll.
+    """
+    permission_classes = [IsAuthenticated]
+
+    @spooled_uploads()
+    def post(self, request):
+        if not request.user.is_staff:
+            return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
 
-        syllabus = result["syllabus"]
+        uploaded_file, subject_id, options = _syllabus_import_request(request)
+        if isinstance(options, Response):
+            return options
+
+        try:
+            validate_upload(uploaded_file)
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        subject = Subject.objects.filter(id=subject_id, is_active=True).first()
+        if not subject:
+            return Response({"error": "subject_id is invalid or inactive"}, status=status.HTTP_400_BAD_REQUEST)
+
+        job = queue_syllabus_import(subject=subject, uploaded_file=uploaded_file, options=options, user=request.user)
         return Response(
             {
-                "message": "Syllabus imported successfully",
-                "syllabus_id": syllabus.id,
-                "chapters_created": result["chapters_created"],
-                "topics_created": result["topics_created"],
+                "message": "Syllabus import queued",
+                "job_id": job.id,
+                "status": job.status,
+                "phase": job.phase,
+                "status_url": request.build_absolute_uri(reverse("syllabus-import-job-status", args=[job.id])),
             },
-            status=status.HTTP_201_CREATED,
+            status=status.HTTP_202_ACCEPTED,
         )
 
 
+class SyllabusImportJobStatusView(APIView):
+    """
+    GET /api/auth/admin/syllabi/import-jobs/<pk>/
+    Phase, page progress and created-row counts of a background import.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, pk):
+        if not request.user.is_staff:
+            return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+        job = SyllabusImportJob.objects.filter(pk=pk).first()
+        if not job:
+            return Response({"error": "Import job not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response(SyllabusImportJobSerializer(job).data)
+
+
+class SyllabusBulkContentView(APIView):
+    """
+    POST /api/auth/admin/syllabi/<syllabus_id>/bulk/
+    Create, update and deactivate chapters/topics of one syllabus in a single
+    transaction. Body: {"operations": [...]}; all-or-nothing, with per-item results.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, syllabus_id):
+        if not request.user.is_staff:
+            return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            syllabus = Syllabus.objects.select_related('subject').get(pk=syllabus_id)
+        except Syllabus.DoesNotExist:
+            return Response({"error": "Syllabus not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            results = apply_syllabus_operations(syllabus, request.data.get("operations"))
+        except BulkOperationError as exc:
+            return Response(
+                {"error": "No changes were applied", "results": exc.results},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"syllabus_id": syllabus.id, "results": results})
+
+
 # ==================== SUBJECT VIEWS ====================
 
 class SubjectListCreateView(APIView):
     permission_classes = [IsAuthenticated]
     
+    @query_budget(2)
     def get(self, request):
         subjects = Subject.objects.all().order_by('order', 'name')
         course_id = request.query_params.get('course_id') or request.query_params.get('course')
@@ -705,8 +1027,7 @@ class SubjectListCreateView(APIView):
             except ValueError:
                 return Response({"error": "course_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
             subjects = subjects.filter(course_id=course_id)
-        serializer = SubjectSerializer(subjects, many=True)
-        return Response(serializer.data)
+        return list_response(request, subjects, SubjectSerializer)
     
     def post(self, request):
         if not request.user.is_staff:
@@ -777,7 +1098,18 @@ class SubjectDetailView(APIView):
         
         subject.is_active = False
         subject.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _soft_delete_response(request, subject)
+
+
+class SubjectMoveView(APIView):
+    """
+    POST /api/auth/admin/subjects/<pk>/move/
+    Place a subject directly before or after a sibling subject of the same course.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        return _move_response(request, Subject, pk, SubjectSerializer)
 
 
 # ==================== CHAPTER VIEWS ====================
@@ -785,6 +1117,7 @@ class SubjectDetailView(APIView):
 class ChapterListCreateView(APIView):
     permission_classes = [IsAuthenticated]
     
+    @query_budget(2)
     def get(self, request):
         chapters = Chapter.objects.all().order_by('chapter_number')
         syllabus_id = request.query_params.get('syllabus_id') or request.query_params.get('syllabus')
@@ -794,8 +1127,7 @@ class ChapterListCreateView(APIView):
             except ValueError:
                 return Response({"error": "syllabus_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
             chapters = chapters.filter(syllabus_id=syllabus_id)
-        serializer = ChapterSerializer(chapters, many=True)
-        return Response(serializer.data)
+        return list_response(request, chapters, ChapterSerializer)
     
     def post(self, request):
         if not request.user.is_staff:
@@ -871,7 +1203,7 @@ class ChapterDetailView(APIView):
         
         chapter.is_active = False
         chapter.save()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        return _soft_delete_response(request, chapter)
 
 
 # ==================== TOPIC VIEWS ====================
@@ -879,6 +1211,7 @@ class ChapterDetailView(APIView):
 class TopicListCreateView(APIView):
     permission_classes = [IsAuthenticated]
     
+    @query_budget(2)
     def get(self, request):
         topics = Topic.objects.all().order_by('order')
         chapter_id = request.query_params.get('chapter_id') or request.query_params.get('chapter')
@@ -888,8 +1221,7 @@ class TopicListCreateView(APIView):
             except ValueError:
                 return Response({"error": "chapter_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
             topics = topics.filter(chapter_id=chapter_id)
-        serializer = TopicSerializer(topics, many=True)
-        return Response(serializer.data)
+        return list_response(request, topics, TopicSerializer)
     
     def post(self, request):
         if not request.user.is_staff:
@@ -968,215 +1300,308 @@ class TopicDetailView(APIView):
         return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+class TopicMoveView(APIView):
+    """
+    POST /api/auth/admin/topics/<pk>/move/
+    Place a topic directly before or after a sibling topic.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        return _move_response(request, Topic, pk, TopicSerializer)
+
+
 # ==================== CONTENT CONSUMPTION VIEWS (NON-ADMIN) ====================
 
 class PublicCourseListView(APIView):
     """Public read-only: list active published courses."""
     permission_classes = [AllowAny]
 
+    @query_budget(2)
+    @conditional_on_content_version(get_catalog_version)
     def get(self, request):
         courses = Course.objects.filter(
             is_active=True,
             status='PUBLISHED',
         ).order_by('grade', 'title')
-        serializer = CourseSerializer(courses, many=True)
-        return Response(serializer.data)
+        return list_response(request, courses, CourseSerializer)
 
 
 class PublicSubjectListByCourseView(APIView):
     """Public read-only: list active published subjects for a course."""
     permission_classes = [AllowAny]
 
+    @query_budget(2)
+    @conditional_on_content_version(lambda course_id: get_course_version(course_id))
     def get(self, request, course_id):
         subjects = Subject.objects.filter(
             course_id=course_id,
-            is_active=True,
-            status='PUBLISHED',
-            course__is_active=True,
-            course__status='PUBLISHED',
+            is_publicly_visible=True,
         ).order_by('order', 'name')
-        serializer = SubjectSerializer(subjects, many=True)
-        return Response(serializer.data)
+        return list_response(request, subjects, SubjectSerializer)
 
 
 class PublicSyllabusListBySubjectView(APIView):
     """Public read-only: list active published syllabi for a subject."""
     permission_classes = [AllowAny]
 
+    @query_budget(3)
+    @conditional_on_content_version(lambda subject_id: get_node_version(Subject, subject_id))
     def get(self, request, subject_id):
         syllabi = Syllabus.objects.filter(
             subject_id=subject_id,
-            is_active=True,
-            status='PUBLISHED',
-            subject__is_active=True,
-            subject__status='PUBLISHED',
-            subject__course__is_active=True,
-            subject__course__status='PUBLISHED',
+            is_publicly_visible=True,
         ).order_by('-academic_year', 'title')
-        serializer = SyllabusSerializer(syllabi, many=True)
-        return Response(serializer.data)
+        return list_response(request, syllabi, SyllabusSerializer)
+
+
+def _artifact_listing_response(request, rows, queryset, serializer_class, fieldset):
+    """
+    Listing rows read from a published artifact, paginated with the same
+    ordering (and cursors) as the live ``queryset`` when a page is requested.
+    """
+    paginator = KeysetPagination()
+    if paginator.is_requested(request):
+        page = paginator.paginate_rows(rows, request, paginator.get_ordering(queryset))
+        return paginator.get_paginated_response(project_rows(page, serializer_class, **fieldset))
+    return Response(project_rows(rows, serializer_class, **fieldset))
 
 
 class PublicChapterListBySyllabusView(APIView):
     """Public read-only: list active published chapters for a syllabus."""
     permission_classes = [AllowAny]
 
+    @query_budget(4)
+    @conditional_on_content_version(lambda syllabus_id: get_node_version(Syllabus, syllabus_id))
     def get(self, request, syllabus_id):
+        fieldset = ChapterSerializer.fieldset_from_request(request)
         chapters = Chapter.objects.filter(
             syllabus_id=syllabus_id,
-            is_active=True,
-            status='PUBLISHED',
-            syllabus__is_active=True,
-            syllabus__status='PUBLISHED',
-            syllabus__subject__is_active=True,
-            syllabus__subject__status='PUBLISHED',
-            syllabus__subject__course__is_active=True,
-            syllabus__subject__course__status='PUBLISHED',
+            is_publicly_visible=True,
         ).order_by('chapter_number')
-        serializer = ChapterSerializer(chapters, many=True)
-        return Response(serializer.data)
+
+        document = published_syllabus_document(syllabus_id)
+        if document is not None:
+            return _artifact_listing_response(request, document['chapters'], chapters, ChapterSerializer, fieldset)
+
+        return list_response(request, chapters, ChapterSerializer, fieldset=fieldset)
 
 
 class PublicTopicListByChapterView(APIView):
     """Public read-only: list active published topics for a chapter."""
     permission_classes = [AllowAny]
 
+    @query_budget(5)
+    @conditional_on_content_version(lambda chapter_id: get_node_version(Chapter, chapter_id))
     def get(self, request, chapter_id):
+        fieldset = TopicSerializer.fieldset_from_request(request)
         topics = Topic.objects.filter(
             chapter_id=chapter_id,
-            is_active=True,
-            status='PUBLISHED',
-            chapter__is_active=True,
-            chapter__status='PUBLISHED',
-            chapter__syllabus__is_active=True,
-            chapter__syllabus__status='PUBLISHED',
-            chapter__syllabus__subject__is_active=True,
-            chapter__syllabus__subject__status='PUBLISHED',
-            chapter__syllabus__subject__course__is_active=True,
-            chapter__syllabus__subject__course__status='PUBLISHED',
+            is_publicly_visible=True,
         ).order_by('order')
-        serializer = TopicSerializer(topics, many=True)
-        return Response(serializer.data)
+
+        syllabus_id = Chapter.objects.filter(pk=chapter_id).values_list('syllabus_id', flat=True).first()
+        document = published_syllabus_document(syllabus_id) if syllabus_id else None
+        if document is not None:
+            rows = document['topics'].get(str(chapter_id), [])
+            return _artifact_listing_response(request, rows, topics, TopicSerializer, fieldset)
+
+        return list_response(request, topics, TopicSerializer, fieldset=fieldset)
+
+
+COURSE_TREE_LEVELS = ('subjects', 'syllabi', 'chapters', 'topics')
+
+
+def _public_tree_levels():
+    """(prefetch attribute, queryset) for each public tree level below a course, top-down."""
+    return [
+        (attr, level.model.objects.filter(is_publicly_visible=True).order_by(*level.ordering))
+        for attr, level in zip(COURSE_TREE_LEVELS, PUBLIC_TREE_LEVELS)
+    ]
+
+
+def _tree_prefetch(levels):
+    """Nest the given levels into a single Prefetch, outermost level first."""
+    prefetch = None
+    for attr, queryset in reversed(levels):
+        if prefetch is not None:
+            queryset = queryset.prefetch_related(prefetch)
+        prefetch = Prefetch(attr, queryset=queryset)
+    return prefetch
+
+
+def _requested_tree_depth(request, level_names):
+    """
+    Depth below the root asked for with ``?depth=N`` or ``?expand=a.b``.
+    Returns None for the full tree.
+    """
+    depth = request.query_params.get('depth')
+    expand = request.query_params.get('expand')
+    if depth is not None and expand is not None:
+        raise DRFValidationError({"error": "Use either depth or expand, not both"})
+
+    if expand is not None:
+        path = [part for part in expand.split('.') if part]
+        if path != list(level_names[:len(path)]):
+            raise DRFValidationError({"expand": f"Must be a prefix of {'.'.join(level_names)}"})
+        depth = len(path)
+    elif depth is not None:
+        try:
+            depth = int(depth)
+        except ValueError:
+            raise DRFValidationError({"depth": "Must be an integer"})
+        if not 0 <= depth <= len(level_names):
+            raise DRFValidationError({"depth": f"Must be between 0 and {len(level_names)}"})
+    else:
+        return None
+    # The full depth shares its snapshot with the default response.
+    return None if depth == len(level_names) else depth
+
+
+def _course_full_tree_queryset(depth=None):
+    levels = _public_tree_levels()[:depth]
+    queryset = Course.objects.filter(
+        is_active=True,
+        status='PUBLISHED',
+    )
+    if levels:
+        queryset = queryset.prefetch_related(_tree_prefetch(levels))
+    return queryset
+
+
+def _course_full_tree_response(course_id, depth=None, builder='values'):
+    """
+    Serve the course tree from its versioned snapshot, building it on a miss.
+    ``builder`` picks the ``values()`` fast path or the nested serializers; both
+    splice in the artifacts of published syllabi and render the same bytes.
+    """
+    def build():
+        published = published_syllabus_trees(course_id) if depth is None or depth >= 2 else None
+        if builder == 'values':
+            tree = build_course_tree(course_id, depth, published)
+        else:
+            course = _course_full_tree_queryset(depth).filter(id=course_id).first()
+            tree = CourseFullTreeSerializer(course, depth=depth).data if course else None
+            if tree is not None:
+                tree = splice_published_syllabi(tree, published, depth)
+        return None if tree is None else JSONRenderer().render(tree)
+
+    payload = get_course_tree(course_id, build, depth=depth)
+    if payload is None:
+        return Response({"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
+    return PrerenderedJSONResponse(payload)
 
 
 class CourseFullTreeView(APIView):
-    """Public read-only: return complete nested content tree for a course."""
+    """
+    Public read-only: return complete nested content tree for a course.
+    ?depth=0-4 or ?expand=subjects.syllabi cuts the tree below that level.
+    """
     permission_classes = [AllowAny]
+    tree_builder = 'values'
 
+    @query_budget(8)
+    @conditional_on_content_version(lambda course_id: get_course_version(course_id))
     def get(self, request, course_id):
-        course = (
-            Course.objects.filter(
-                id=course_id,
-                is_active=True,
-                status='PUBLISHED',
-            )
-            .prefetch_related(
-                Prefetch(
-                    'subjects',
-                    queryset=Subject.objects.filter(
-                        is_active=True,
-                        status='PUBLISHED',
-                    )
-                    .order_by('order', 'name')
-                    .prefetch_related(
-                        Prefetch(
-                            'syllabi',
-                            queryset=Syllabus.objects.filter(
-                                is_active=True,
-                                status='PUBLISHED',
-                            )
-                            .order_by('-academic_year', 'title')
-                            .prefetch_related(
-                                Prefetch(
-                                    'chapters',
-                                    queryset=Chapter.objects.filter(
-                                        is_active=True,
-                                        status='PUBLISHED',
-                                    )
-                                    .order_by('chapter_number')
-                                    .prefetch_related(
-                                        Prefetch(
-                                            'topics',
-                                            queryset=Topic.objects.filter(
-                                                is_active=True,
-                                                status='PUBLISHED',
-                                            ).order_by('order')
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-            )
+        depth = _requested_tree_depth(request, COURSE_TREE_LEVELS)
+        return _course_full_tree_response(course_id, depth, self.tree_builder)
+
+
+def _published_course_id_for_slug(slug):
+    course_id = get_course_id_for_slug(slug)
+    if course_id is None:
+        course_id = (
+            Course.objects.filter(slug=slug, is_active=True, status='PUBLISHED')
+            .values_list('id', flat=True)
             .first()
         )
+        if course_id is not None:
+            remember_course_slug(slug, course_id)
+    return course_id
 
-        if not course:
-            return Response({"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        serializer = CourseFullTreeSerializer(course)
-        return Response(serializer.data)
+def _course_slug_version(slug):
+    course_id = _published_course_id_for_slug(slug)
+    if course_id is None:
+        return get_catalog_version()
+    return get_course_version(course_id)
 
 
 class CourseFullTreeBySlugView(APIView):
     """Public read-only: return complete nested content tree for a course slug."""
     permission_classes = [AllowAny]
+    tree_builder = 'values'
 
+    @query_budget(9)
+    @conditional_on_content_version(_course_slug_version)
     def get(self, request, slug):
-        course = (
-            Course.objects.filter(
-                slug=slug,
-                is_active=True,
-                status='PUBLISHED',
-            )
-            .prefetch_related(
-                Prefetch(
-                    'subjects',
-                    queryset=Subject.objects.filter(
-                        is_active=True,
-                        status='PUBLISHED',
-                    )
-                    .order_by('order', 'name')
-                    .prefetch_related(
-                        Prefetch(
-                            'syllabi',
-                            queryset=Syllabus.objects.filter(
-                                is_active=True,
-                                status='PUBLISHED',
-                            )
-                            .order_by('-academic_year', 'title')
-                            .prefetch_related(
-                                Prefetch(
-                                    'chapters',
-                                    queryset=Chapter.objects.filter(
-                                        is_active=True,
-                                        status='PUBLISHED',
-                                    )
-                                    .order_by('chapter_number')
-                                    .prefetch_related(
-                                        Prefetch(
-                                            'topics',
-                                            queryset=Topic.objects.filter(
-                                                is_active=True,
-                                                status='PUBLISHED',
-                                            ).order_by('order')
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-            )
-            .first()
-        )
-
-        if not course:
+        course_id = _published_course_id_for_slug(slug)
+        if course_id is None:
             return Response({"error": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
+        depth = _requested_tree_depth(request, COURSE_TREE_LEVELS)
+        return _course_full_tree_response(course_id, depth, self.tree_builder)
+
+
+class SyllabusTreeView(APIView):
+    """
+    Public read-only: one syllabus with its chapters and topics, so clients that
+    loaded a shallow course tree can expand a single syllabus.
+    GET /api/auth/syllabi/<syllabus_id>/tree/?depth=0-2
+    """
+    permission_classes = [AllowAny]
+    tree_levels = COURSE_TREE_LEVELS[2:]
+    tree_builder = 'values'
+
+    @query_budget(8)
+    @conditional_on_content_version(lambda syllabus_id: get_node_version(Syllabus, syllabus_id))
+    def get(self, request, syllabus_id):
+        depth = _requested_tree_depth(request, self.tree_levels)
+        course_id = course_id_for_node(Syllabus, syllabus_id)
+        if course_id is None:
+            return Response({"error": "Syllabus not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        def build():
+            document = published_syllabus_document(syllabus_id)
+            if document is not None:
+                tree = prune_tree(copy.deepcopy(document['tree']), PUBLIC_TREE_LEVELS[1:], depth)
+            elif self.tree_builder == 'values':
+                tree = build_syllabus_tree(syllabus_id, depth)
+            else:
+                queryset = Syllabus.objects.filter(pk=syllabus_id, is_publicly_visible=True)
+                levels = _public_tree_levels()[2:][:depth]
+                if levels:
+                    queryset = queryset.prefetch_related(_tree_prefetch(levels))
+                syllabus = queryset.first()
+                tree = SyllabusTreeSerializer(syllabus, depth=depth).data if syllabus else None
+            return None if tree is None else JSONRenderer().render(tree)
+
+        name = f"syllabus:{syllabus_id}" if depth is None else f"syllabus:{syllabus_id}:depth={depth}"
+        payload = get_course_snapshot(course_id, name, build)
+        if payload is None:
+            return Response({"error": "Syllabus not found"}, status=status.HTTP_404_NOT_FOUND)
+        return PrerenderedJSONResponse(payload)
+
+
+class ContentSearchView(APIView):
+    """
+    Public read-only: ranked full-text search over topics, chapters and subjects.
+    GET /api/auth/search/?q=ohm law&limit=20
+    """
+    permission_classes = [AllowAny]
+
+    @query_budget(8)
+    @conditional_on_content_version(lambda: get_catalog_version())
+    def get(self, request):
+        query = (request.query_params.get('q') or '').strip()
+        if not query:
+            return Response({"error": "q is required"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            return Response({"error": "limit must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response({"query": query, "results": search_content(query, limit=limit)})
 
-        serializer = CourseFullTreeSerializer(course)
-        return Response(serializer.data)
 
 class AdminProcessTopicBatchView(APIView):
     """
@@ -1207,23 +1632,59 @@ class AdminProcessTopicBatchView(APIView):
         }, status=status.HTTP_202_ACCEPTED)
 
 
+class AdminCascadeStatusView(APIView):
+    """
+    GET /api/auth/admin/cascades/<task_id>/
+    Progress of a soft-delete cascade that was deferred to a background task.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, task_id):
+        if not request.user.is_staff:
+            return Response(
+                {"error": "Admin access required"},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        result = AsyncResult(task_id)
+        payload = {"task_id": task_id, "state": result.state}
+        if result.state == 'PROGRESS':
+            payload["progress"] = result.info
+        elif result.successful():
+            payload["result"] = result.result
+        elif result.failed():
+            payload["error"] = str(result.result)
+        return Response(payload)
+
+
+
+def _task_queryset():
+    """Tasks with everything ``TaskSerializer`` reads joined, prefetched or annotated up front."""
+    items = TaskItem.objects.select_related('video_data__video', 'quiz_data', 'game_data', 'activity_data')
+    return (
+        Task.objects
+        .select_related('topic__chapter__syllabus__subject__course')
+        .prefetch_related(Prefetch('items', queryset=items))
+        .annotate(active_item_count=Count('items', filter=Q(items__is_active=True)))
+    )
+
 
 class AdminTaskListCreateView(APIView):
     """Admin: List and create tasks"""
     permission_classes = [IsAuthenticated]
     
+    @query_budget(3)
     def get(self, request):
         # if not request.user.is_staff:
         #     return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
         
         grade = request.query_params.get('grade')
-        tasks = Task.objects.filter(is_active=True)
+        tasks = _task_queryset().filter(is_active=True)
         
         if grade:
-            tasks = tasks.filter(grade=grade)
+            tasks = tasks.filter(topic__chapter__syllabus__subject__course__grade=grade)
         
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data)
+        return list_response(request, tasks, TaskSerializer)
     
     def post(self, request):
         # if not request.user.is_staff:
@@ -1240,10 +1701,11 @@ class AdminTaskDetailView(APIView):
     
     def get_object(self, pk):
         try:
-            return Task.objects.get(pk=pk, is_active=True)
+            return _task_queryset().get(pk=pk, is_active=True)
         except Task.DoesNotExist:
             return None
     
+    @query_budget(3)
     def get(self, request, pk):
         # if not request.user.is_staff:
         #     return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
@@ -1659,6 +2121,7 @@ class AdminApprovedVideosListView(APIView):
     """Admin: List approved videos for selection"""
     permission_classes = [IsAuthenticated]
     
+    @query_budget(2)
     def get(self, request):
         # if not request.user.is_staff:
         #     return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
@@ -1671,16 +2134,15 @@ class AdminApprovedVideosListView(APIView):
         # Filter by grade
         grade = request.query_params.get('grade')
         if grade:
-            videos = videos.filter(topic__chapter__subject__syllabus__course__grade=grade)
+            videos = videos.filter(topic__chapter__syllabus__subject__course__grade=grade)
         
         # Search by title
         search = request.query_params.get('search')
         if search:
             videos = videos.filter(title__icontains=search)
         
-        videos = videos.order_by('-id')[:50]  # Limit to 50
-        serializer = VideoResultSerializer(videos, many=True)
-        return Response(serializer.data)
+        # Unpaginated responses are limited to 50
+        return list_response(request, videos.order_by('-id'), VideoResultSerializer, limit=50)
 
 
 # ==================== QUIZ ANSWER SUBMISSION ====================
@@ -1830,6 +2292,7 @@ class VideoListView(APIView):
     List all videos with optional filtering
     GET /api/auth/videos/?approval_status=PENDING&topic=1
     """
+    @query_budget(2)
     def get(self, request):
         from .serializers import VideoResultSerializer
         
@@ -1854,8 +2317,8 @@ class VideoListView(APIView):
         # Order by created date (newest first)
         videos = videos.order_by('-created_at')
         
-        serializer = VideoResultSerializer(videos, many=True)
-        return Response(serializer.data)
+        # ?stream=json|ndjson writes rows as they are read, for large exports
+        return list_response(request, videos, VideoResultSerializer, streamable=True)
 
 
 class VideoDetailView(APIView):
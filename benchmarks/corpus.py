@@ -0,0 +1,155 @@
+"""
+Synthetic syllabus documents for the parsing benchmarks.
+
+Every "page" is one chapter: a heading followed by topic lines in the bullet
+styles ``parse_syllabus_text`` understands and a comma-separated keyword line
+for ``extract_keywords_from_text``. The same lines are written as PDF, DOCX,
+XLSX and plain text, so each format carries identical content and timings are
+comparable across formats. Output is deterministic for a given seed.
+
+Run: python benchmarks/corpus.py --pages 100 --output /tmp/corpus
+"""
+import argparse
+import io
+import os
+import random
+
+import docx
+import openpyxl
+from docx.enum.text import WD_BREAK
+
+
+FORMATS = ('pdf', 'docx', 'xlsx', 'txt')
+TOPICS_PER_PAGE = 24
+
+WORDS = (
+    'motion force energy power work momentum gravity friction pressure density wave sound light '
+    'reflection refraction lens mirror current voltage resistance circuit magnet field atom molecule '
+    'element compound reaction acid base salt metal carbon cell tissue organ enzyme protein genetics '
+    'evolution ecosystem climate rainfall soil erosion map scale latitude longitude fraction ratio '
+    'algebra equation polynomial geometry triangle circle area volume probability statistics graph'
+).split()
+# Numbered topics use "1)": "1. " would read as a chapter heading.
+BULLETS = ('- {}', '* {}', '{n}) {}', '{letter}) {}', '{}')
+
+
+def _phrase(rng, words):
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def page_lines(page_number, rng):
+    """Lines of one page: a chapter heading, its topics and a keyword line."""
+    lines = [f'Chapter {page_number}: {_phrase(rng, 3)}']
+    for n in range(1, TOPICS_PER_PAGE + 1):
+        bullet = rng.choice(BULLETS)
+        lines.append(bullet.format(_phrase(rng, rng.randint(2, 6)), n=n, letter='abcdefghij'[n % 10]))
+    lines.append(', '.join(_phrase(rng, 2) for _ in range(6)))
+    return lines
+
+
+def syllabus_pages(pages, seed=0):
+    rng = random.Random(seed)
+    return [page_lines(number, rng) for number in range(1, pages + 1)]
+
+
+def syllabus_text(pages, seed=0):
+    return '\n'.join(line for page in syllabus_pages(pages, seed) for line in page)
+
+
+def _pdf_string(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def pdf_bytes(pages):
+    """A PDF with one page per chapter, each line drawn in Helvetica."""
+    objects = ['<< /Type /Catalog /Pages 2 0 R >>', None, '<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>']
+    kids = []
+    for lines in pages:
+        shown = ' T* '.join(f'({_pdf_string(line)})Tj' for line in lines)
+        stream = f'BT /F1 10 Tf 12 TL 56 770 Td {shown} ET'
+        objects.append(f'<< /Length {len(stream)} >>\nstream\n{stream}\nendstream')
+        objects.append(
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>'
+        )
+        kids.append(f'{len(objects)} 0 R')
+    objects[1] = f'<< /Type /Pages /Kids [{" ".join(kids)}] /Count {len(kids)} >>'
+
+    body = io.BytesIO()
+    body.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(body.tell())
+        body.write(f'{number} 0 obj\n{obj}\nendobj\n'.encode())
+    xref = body.tell()
+    body.write(f'xref\n0 {len(objects) + 1}\n0000000000 65535 f \n'.encode())
+    body.write(''.join(f'{offset:010d} 00000 n \n' for offset in offsets).encode())
+    body.write(f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+    return body.getvalue()
+
+
+def docx_bytes(pages):
+    """A DOCX with one paragraph per line and a page break after each chapter."""
+    document = docx.Document()
+    for lines in pages:
+        for line in lines:
+            paragraph = document.add_paragraph(line)
+        paragraph.add_run().add_break(WD_BREAK.PAGE)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def xlsx_bytes(pages):
+    """An XLSX with one row per line on a single sheet."""
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Syllabus')
+    for lines in pages:
+        for line in lines:
+            sheet.append([line])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def txt_bytes(pages):
+    return '\n'.join(line for lines in pages for line in lines).encode('utf-8')
+
+
+WRITERS = {'pdf': pdf_bytes, 'docx': docx_bytes, 'xlsx': xlsx_bytes, 'txt': txt_bytes}
+
+
+def write_corpus(directory, pages, formats=FORMATS, seed=0):
+    """
+    Write ``syllabus-<pages>-<seed>.<format>`` files into ``directory`` and
+    return {format: path}. Files that already exist are reused (large DOCX
+    files take a while to build); delete them after changing this module.
+    """
+    content = None
+    paths = {}
+    for fmt in formats:
+        path = os.path.join(directory, f'syllabus-{pages}-{seed}.{fmt}')
+        if not os.path.exists(path):
+            content = content or syllabus_pages(pages, seed)
+            with open(path, 'wb') as handle:
+                handle.write(WRITERS[fmt](content))
+        paths[fmt] = path
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='.')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for pages in args.pages:
+        for fmt, path in write_corpus(args.output, pages, args.formats, args.seed).items():
+            print(f'{path}  {os.path.getsize(path) / 1024:.0f} KiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""
+Benchmark: text extraction, syllabus parsing and keyword extraction by document size.
+
+Generates synthetic syllabi (see benchmarks/corpus.py) as PDF, DOCX, XLSX and
+plain text and measures each stage on them:
+
+  extract   extract_document_text() for every format, read from disk
+  parse     the uncached parse behind parse_syllabus_text()
+  keywords  api.parsers.extract_keywords_from_text()
+
+Times are the median of --repeat runs. Peak memory comes from a separate run
+under tracemalloc (Python allocations in this process only; parallel PDF
+workers are not counted), so it does not slow down the timed runs. Results are
+printed as a table and, with --output, written as JSON; --compare prints the
+time ratio against an earlier JSON file for the same stages and sizes.
+
+Run: python benchmarks/parsing.py [--pages 10 100 1000] [--repeat 3] [--output results.json] [--compare baseline.json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'guddu_backend.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from benchmarks.corpus import FORMATS, write_corpus  # noqa: E402
+
+
+def time_call(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, timings
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def quiet(func):
+    # extract_keywords_from_text prints every tag it finds.
+    def call():
+        with open(os.devnull, 'w') as sink, contextlib.redirect_stdout(sink):
+            return func()
+    return call
+
+
+def measure(stage, fmt, pages, input_bytes, func, repeat, memory):
+    result, timings = time_call(func, repeat)
+    median = statistics.median(timings)
+    row = {
+        'stage': stage,
+        'format': fmt,
+        'pages': pages,
+        'input_bytes': input_bytes,
+        'median_s': round(median, 6),
+        'min_s': round(min(timings), 6),
+        'per_page_ms': round(median * 1000 / pages, 4),
+        'mb_per_s': round(input_bytes / median / 1e6, 3) if median else None,
+        'peak_kib': round(peak_memory(func) / 1024) if memory else None,
+    }
+    return result, row
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment():
+    from authentication.services.extraction_cache import EXTRACTOR_VERSION
+    from authentication.services.pdf_extraction import _worker_count
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_commit': git_commit(),
+        'extractor_version': EXTRACTOR_VERSION,
+        'pdf_workers': _worker_count(None),
+    }
+
+
+def run(pages_list, formats, repeat, seed, corpus_dir, memory):
+    from api.parsers import extract_keywords_from_text
+    from authentication.services.extractors import extract_document_text
+    from authentication.services.file_parser import _parse_syllabus_lines
+
+    for pages in pages_list:
+        paths = write_corpus(corpus_dir, pages, formats, seed)
+        texts = {}
+        for fmt, path in paths.items():
+            texts[fmt], row = measure(
+                'extract', fmt, pages, os.path.getsize(path),
+                lambda path=path: extract_document_text(path), repeat, memory,
+            )
+            yield row
+
+        text = texts.get('txt') or next(iter(texts.values()))
+        if any(other != text for other in texts.values()):
+            print(f'warning: formats extract different text at {pages} pages', file=sys.stderr)
+        input_bytes = len(text.encode('utf-8'))
+
+        chapters, row = measure('parse', 'text', pages, input_bytes, lambda: _parse_syllabus_lines(text), repeat, memory)
+        assert len(chapters) == pages, f'parsed {len(chapters)} chapters from {pages} pages'
+        yield row
+
+        _, row = measure(
+            'keywords', 'text', pages, input_bytes, quiet(lambda: extract_keywords_from_text(text)), repeat, memory
+        )
+        yield row
+
+
+def key(row):
+    return row['stage'], row['format'], row['pages']
+
+
+def print_row(row, baseline, out):
+    peak = f"{row['peak_kib']:>9} KiB" if row['peak_kib'] is not None else ' ' * 13
+    line = (
+        f"{row['stage']:<9}{row['format']:<6}{row['pages']:>6} pages"
+        f"{row['median_s'] * 1000:>11.1f} ms{row['per_page_ms']:>9.3f} ms/page{row['mb_per_s']:>9.2f} MB/s{peak}"
+    )
+    previous = baseline.get(key(row))
+    if previous:
+        line += f"   {row['median_s'] / previous['median_s']:.2f}x baseline"
+    print(line, file=out, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=list(FORMATS))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--corpus', help='directory for the generated documents (kept between runs)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc run')
+    parser.add_argument('--output', help="write JSON results to this file ('-' for stdout)")
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as handle:
+            baseline = {key(row): row for row in json.load(handle)['results']}
+
+    # The table goes to stderr when the JSON goes to stdout.
+    out = sys.stderr if args.output == '-' else sys.stdout
+    with contextlib.ExitStack() as stack:
+        corpus_dir = args.corpus or stack.enter_context(tempfile.TemporaryDirectory())
+        os.makedirs(corpus_dir, exist_ok=True)
+        results = []
+        for row in run(args.pages, args.formats, args.repeat, args.seed, corpus_dir, not args.no_memory):
+            print_row(row, baseline, out)
+            results.append(row)
+
+    if args.output:
+        report = {
+            'benchmark': 'parsing',
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'environment': environment(),
+            'config': {'pages': args.pages, 'formats': args.formats, 'repeat': args.repeat, 'seed': args.seed},
+            'results': results,
+        }
+        if args.output == '-':
+            json.dump(report, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.output, 'w') as handle:
+                json.dump(report, handle, indent=2)
+
+
+if __name__ == '__main__':
+    main()
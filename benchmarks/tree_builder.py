@@ -0,0 +1,107 @@
+"""
+Benchmark: values()-based tree builder vs. the nested tree serializers.
+
+Builds a synthetic published course in a throwaway test database and times
+both paths end to end (queries + serialization + JSON rendering), checking
+that they produce identical bytes.
+
+Run: python benchmarks/tree_builder.py [--topics 5000] [--repeat 5]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'guddu_backend.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment, teardown_test_environment  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+
+def seed(topic_count, subjects=4, syllabi_per_subject=2, chapters_per_syllabus=10):
+    from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+
+    published = {'status': 'PUBLISHED', 'is_active': True, 'is_publicly_visible': True}
+    course = Course.objects.create(title='Benchmark course', grade='10', status='PUBLISHED', is_active=True)
+    subject_rows = Subject.objects.bulk_create(
+        Subject(course=course, name=f'Subject {i}', slug=f'bench-subject-{i}', order=i, **published)
+        for i in range(subjects)
+    )
+    syllabus_rows = Syllabus.objects.bulk_create(
+        Syllabus(subject=subject, title=f'Syllabus {j}', slug=f'bench-syllabus-{subject.id}-{j}', academic_year=f'202{j}-2{j + 1}', **published)
+        for subject in subject_rows for j in range(syllabi_per_subject)
+    )
+    chapter_rows = Chapter.objects.bulk_create(
+        Chapter(syllabus=syllabus, title=f'Chapter {k}', slug=f'bench-chapter-{syllabus.id}-{k}', chapter_number=k + 1, **published)
+        for syllabus in syllabus_rows for k in range(chapters_per_syllabus)
+    )
+    per_chapter = max(1, topic_count // len(chapter_rows))
+    Topic.objects.bulk_create(
+        (
+            Topic(
+                chapter=chapter, title=f'Topic {n}', slug=f'bench-topic-{chapter.id}-{n}', order=n + 1,
+                description='Lorem ipsum dolor sit amet. ' * 4, notes='Notes ' * 20,
+                attachments=[{'url': f'https://example.com/{chapter.id}/{n}.pdf'}], **published,
+            )
+            for chapter in chapter_rows for n in range(per_chapter)
+        ),
+        batch_size=1000,
+    )
+    return course.id, per_chapter * len(chapter_rows)
+
+
+def time_call(func, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return result, statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--topics', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    from authentication.serializers import CourseFullTreeSerializer
+    from authentication.services.tree_builder import build_course_tree
+    from authentication.views import _course_full_tree_queryset
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        course_id, topics = seed(args.topics)
+
+        def serializer_path():
+            course = _course_full_tree_queryset().get(id=course_id)
+            return JSONRenderer().render(CourseFullTreeSerializer(course).data)
+
+        def values_path():
+            return JSONRenderer().render(build_course_tree(course_id))
+
+        slow, slow_time = time_call(serializer_path, args.repeat)
+        fast, fast_time = time_call(values_path, args.repeat)
+        assert slow == fast, 'values() builder output differs from the serializers'
+
+        print(f'topics:            {topics}')
+        print(f'payload:           {len(fast) / 1024:.0f} KiB (identical bytes)')
+        print(f'serializers:       {slow_time * 1000:.1f} ms')
+        print(f'values() builder:  {fast_time * 1000:.1f} ms')
+        print(f'speedup:           {slow_time / fast_time:.1f}x')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 from datetime import timedelta
 
@@ -90,6 +91,41 @@ DATABASES = {
 }
 
 
+# Cache
+# Public content snapshots, their content versions and import previews live in
+# the default cache. It must be shared by every web and Celery worker process,
+# or version bumps made in one process never reach the others, so it uses the
+# same Redis server as the Celery broker.
+
+REDIS_CACHE_URL = os.environ.get('REDIS_CACHE_URL', 'redis://localhost:6379/1')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_CACHE_URL,
+    },
+    # Text extracted from uploads, keyed by content hash (see services/extraction_cache.py).
+    # Memory budget: MAX_ENTRIES x EXTRACTION_CACHE_MAX_ITEM_BYTES = 64 x 512 KiB = 32 MiB
+    # per process, so keep the two in step when changing either.
+    'extraction': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'guddu-extraction',
+        'OPTIONS': {'MAX_ENTRIES': 64},
+    },
+}
+
+# Single-process local runs (and test runners other than Django's) can keep the
+# default cache in memory instead of Redis with LOCAL_CACHE=1.
+if os.environ.get('LOCAL_CACHE') == '1':
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'guddu-default',
+    }
+
+# Django's test runner switches the caches to memory for the whole run.
+TEST_RUNNER = 'guddu_backend.test_runner.LocalCacheTestRunner'
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -160,6 +196,35 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = 'Asia/Kolkata' 
 
+# Soft-deleting a node whose active descendants exceed this many rows hands the
+# cascade to a Celery task (None keeps every cascade inline).
+CONTENT_CASCADE_ASYNC_THRESHOLD = 5000
+
+# Views decorated with @query_budget check their SQL query count: None (off),
+# "log" (warn and add an X-Query-Count header) or "raise" (used by the tests).
+QUERY_BUDGET_MODE = None
+QUERY_BUDGET_REPEAT_THRESHOLD = 5
+
+# Rows per INSERT when a syllabus import writes its chapters and topics.
+SYLLABUS_IMPORT_BATCH_SIZE = 500
+
+# PDF text extraction: worker processes (None = CPU count), the page limit for
+# uploads (None = no limit) and the page count below which pages are read serially.
+PDF_EXTRACTION_WORKERS = None
+PDF_EXTRACTION_MAX_PAGES = None
+PDF_PARALLEL_MIN_PAGES = 16
+
+# Extracted texts larger than this (UTF-8 bytes) are not kept in the extraction
+# cache; together with its MAX_ENTRIES this bounds the cache at 32 MiB per process.
+EXTRACTION_CACHE_MAX_ITEM_BYTES = 512 * 1024
+
+# Largest syllabus / keyword file accepted. Upload views spool files to disk
+# and stop reading once they pass this size (see authentication/uploads.py).
+UPLOAD_MAX_SIZE_BYTES = 10 * 1024 * 1024
+
+# Seconds an import preview (parsed chapters/topics) can still be committed by its token.
+SYLLABUS_IMPORT_PREVIEW_TTL = 30 * 60
+
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173", # Your frontend
     "http://localhost:3000", # Next.js/React frontend
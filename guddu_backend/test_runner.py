@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+
+class LocalCacheTestRunner(DiscoverRunner):
+    """
+    Django's test runner with the default cache kept in memory, so tests never
+    need a Redis server or touch a shared one. Applies to every way of starting
+    the Django runner (``manage.py test``, ``python -m django test``); other
+    runners should set ``LOCAL_CACHE=1`` instead.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        caches = {
+            **settings.CACHES,
+            'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'guddu-test'},
+        }
+        self._cache_override = override_settings(CACHES=caches)
+        self._cache_override.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._cache_override.disable()
+        super().teardown_test_environment(**kwargs)
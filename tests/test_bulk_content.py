@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services.content_cache import get_course_version
+
+
+class SyllabusBulkContentTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, status="PUBLISHED", is_active=True)
+        self.url = f"/api/auth/admin/syllabi/{self.syllabus.id}/bulk/"
+
+    def test_batch_creates_updates_and_deactivates(self):
+        version = get_course_version(self.course.id)
+        operations = [
+            {"op": "create", "type": "chapter", "ref": "new", "data": {"title": "C2", "chapter_number": 2, "status": "PUBLISHED"}},
+            {"op": "create", "type": "topic", "data": {"chapter_ref": "new", "title": "Waves", "order": 1, "status": "PUBLISHED"}},
+            {"op": "create", "type": "topic", "data": {"chapter": self.chapter.id, "title": "T2", "order": 2}},
+            {"op": "update", "type": "chapter", "id": self.chapter.id, "data": {"title": "Mechanics"}},
+            {"op": "deactivate", "type": "topic", "id": self.topic.id},
+        ]
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([r["status"] for r in results], ["created", "created", "created", "updated", "deactivated"])
+        waves = Topic.objects.get(id=results[1]["id"])
+        self.assertEqual(waves.chapter_id, results[0]["id"])
+        self.assertTrue(waves.slug)
+        self.assertTrue(waves.is_publicly_visible)
+        self.assertEqual(Chapter.objects.get(id=self.chapter.id).title, "Mechanics")
+        self.topic.refresh_from_db()
+        self.assertFalse(self.topic.is_active)
+        self.assertFalse(self.topic.is_publicly_visible)
+        self.assertNotEqual(get_course_version(self.course.id), version)
+
+    def test_update_deactivating_a_chapter_cascades_to_its_topics(self):
+        operations = [{"op": "update", "type": "chapter", "id": self.chapter.id, "data": {"title": "Old", "is_active": False}}]
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["status"], "deactivated")
+        self.chapter.refresh_from_db()
+        self.assertEqual((self.chapter.title, self.chapter.is_active), ("Old", False))
+        self.assertFalse(Topic.objects.filter(chapter=self.chapter, is_active=True).exists())
+
+    def test_invalid_item_rejects_whole_batch(self):
+        other = Syllabus.objects.create(subject=self.subject, title="Other", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        foreign = Chapter.objects.create(syllabus=other, title="X", chapter_number=1, status="PUBLISHED", is_active=True)
+        operations = [
+            {"op": "create", "type": "chapter", "data": {"title": "C2", "chapter_number": 2}},
+            {"op": "update", "type": "chapter", "id": foreign.id, "data": {"title": "Stolen"}},
+            {"op": "create", "type": "topic", "data": {"chapter_ref": "missing", "title": "T", "order": 1}},
+        ]
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        results = response.data["results"]
+        self.assertNotIn("errors", results[0])
+        self.assertIn("id", results[1]["errors"])
+        self.assertIn("chapter_ref", results[2]["errors"])
+        self.assertEqual(Chapter.objects.filter(syllabus=self.syllabus).count(), 1)
+
+    def test_constraint_violation_rolls_back(self):
+        operations = [
+            {"op": "create", "type": "topic", "data": {"chapter": self.chapter.id, "title": "T2", "order": 2}},
+            {"op": "create", "type": "chapter", "data": {"title": "Dup", "chapter_number": 1}},
+        ]
+        response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Topic.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def batch(start, size):
+            return {"operations": [
+                {"op": "create", "type": "topic", "data": {"chapter": self.chapter.id, "title": f"Topic {n}", "order": n}}
+                for n in range(start, start + size)
+            ]}
+
+        with self.assertNumQueries(self._count_queries(batch(10, 2))):
+            self.client.post(self.url, batch(100, 40), format="json")
+        self.assertEqual(Topic.objects.count(), 43)
+
+    def _count_queries(self, payload):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.post(self.url, payload, format="json")
+        return len(ctx.captured_queries)
+
+    def test_requires_admin(self):
+        self.client.force_authenticate(get_user_model().objects.create_user(email="u@test.com", password="pass1234"))
+        response = self.client.post(self.url, {"operations": []}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
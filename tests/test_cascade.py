@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services.cascade import run_deferred_cascade
+
+
+class CascadeSoftDeleteTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        for order in (1, 2, 3):
+            Topic.objects.create(chapter=self.chapter, title=f"T{order}", order=order, status="PUBLISHED", is_active=True)
+
+    def test_deleting_course_deactivates_whole_subtree(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.delete(f"/api/auth/admin/courses/{self.course.id}/")
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        for model in (Subject, Syllabus, Chapter, Topic):
+            self.assertFalse(model.objects.filter(is_active=True).exists())
+            self.assertFalse(model.objects.filter(is_publicly_visible=True).exists())
+
+    def test_cascade_reports_counts_and_skips_inactive_rows(self):
+        Topic.objects.filter(order=3).update(is_active=False)
+        self.syllabus.is_active = False
+        self.syllabus.save()
+        self.assertEqual(self.syllabus.cascade_result.deactivated, {"chapter": 1, "topic": 2})
+
+        self.syllabus.title = "Renamed"
+        self.syllabus.save()
+        self.assertEqual(self.syllabus.cascade_result.deactivated, {})
+
+    @override_settings(CONTENT_CASCADE_ASYNC_THRESHOLD=2)
+    @patch("authentication.tasks.cascade_deactivate_task.apply_async")
+    def test_large_cascade_is_deferred_to_task(self, mock_apply_async):
+        self.client.force_authenticate(self.admin)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(f"/api/auth/admin/chapters/{self.chapter.id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        task_id = response.data["task_id"]
+        mock_apply_async.assert_called_once_with(("authentication.Chapter", self.chapter.id), task_id=task_id)
+        self.assertEqual(response.data["status_url"], f"http://testserver/api/auth/admin/cascades/{task_id}/")
+        # The request only saved the chapter; descendants and counters are left to the task.
+        self.assertEqual(Topic.objects.filter(is_active=True, is_publicly_visible=True).count(), 3)
+        self.chapter.refresh_from_db()
+        self.assertFalse(self.chapter.is_publicly_visible)
+
+        self.assertEqual(run_deferred_cascade(self.chapter), {"topic": 3})
+        self.assertFalse(Topic.objects.filter(is_active=True).exists())
+        self.assertFalse(Topic.objects.filter(is_publicly_visible=True).exists())
+        self.course.refresh_from_db()
+        self.assertEqual((self.course.chapter_count, self.course.topic_count), (0, 0))
+
+    @override_settings(CONTENT_CASCADE_ASYNC_THRESHOLD=2)
+    @patch("authentication.tasks.cascade_deactivate_task.apply_async")
+    def test_rolled_back_deactivation_queues_nothing(self, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    self.chapter.is_active = False
+                    self.chapter.save()
+                    self.assertTrue(self.chapter.cascade_result.deferred)
+                    raise IntegrityError("rolled back")
+            except IntegrityError:
+                pass
+
+        mock_apply_async.assert_not_called()
+        self.assertEqual(Topic.objects.filter(is_active=True).count(), 3)
+
+    @override_settings(CONTENT_CASCADE_ASYNC_THRESHOLD=2)
+    @patch("authentication.tasks.cascade_deactivate_task.apply_async", side_effect=ConnectionError("broker down"))
+    def test_cascade_runs_inline_when_broker_is_unavailable(self, mock_apply_async):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chapter.is_active = False
+            self.chapter.save()
+
+        self.assertFalse(self.chapter.cascade_result.deferred)
+        self.assertEqual(self.chapter.cascade_result.deactivated, {"topic": 3})
+        self.assertFalse(Topic.objects.filter(is_active=True).exists())
+        self.assertFalse(Topic.objects.filter(is_publicly_visible=True).exists())
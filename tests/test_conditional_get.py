@@ -0,0 +1,68 @@
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+
+
+class PublicConditionalGetTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, status="PUBLISHED", is_active=True)
+
+    def _urls(self):
+        return [
+            "/api/auth/courses/",
+            f"/api/auth/courses/{self.course.id}/subjects/",
+            f"/api/auth/subjects/{self.subject.id}/syllabi/",
+            f"/api/auth/syllabi/{self.syllabus.id}/chapters/",
+            f"/api/auth/chapters/{self.chapter.id}/topics/",
+            f"/api/auth/courses/{self.course.id}/full-tree/",
+            f"/api/auth/courses/{self.course.slug}/full-tree/",
+        ]
+
+    def test_if_none_match_returns_not_modified(self):
+        for url in self._urls():
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, status.HTTP_200_OK, url)
+            self.assertIn("ETag", first)
+            self.assertIn("Last-Modified", first)
+
+            second = self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+            self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED, url)
+            self.assertEqual(second["ETag"], first["ETag"])
+            self.assertEqual(second.content, b"")
+
+    def test_if_modified_since_returns_not_modified(self):
+        first = self.client.get(f"/api/auth/chapters/{self.chapter.id}/topics/")
+        second = self.client.get(
+            f"/api/auth/chapters/{self.chapter.id}/topics/",
+            HTTP_IF_MODIFIED_SINCE=first["Last-Modified"],
+        )
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_content_change_yields_new_etag(self):
+        url = f"/api/auth/chapters/{self.chapter.id}/topics/"
+        etag = self.client.get(url)["ETag"]
+
+        self.topic.title = "Changed"
+        self.topic.save()
+
+        resp = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(resp["ETag"], etag)
+        self.assertEqual(resp.data[0]["title"], "Changed")
+
+    def test_not_modified_check_skips_serialization_queries(self):
+        url = f"/api/auth/courses/{self.course.id}/subjects/"
+        etag = self.client.get(url)["ETag"]
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_differs_per_query_string(self):
+        url = f"/api/auth/courses/{self.course.id}/subjects/"
+        self.assertNotEqual(self.client.get(url)["ETag"], self.client.get(url + "?x=1")["ETag"])
@@ -0,0 +1,92 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+
+
+class ContentCountersTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topics = [
+            Topic.objects.create(chapter=self.chapter, title=f"T{n}", order=n, status="PUBLISHED", is_active=True)
+            for n in (1, 2)
+        ]
+        Topic.objects.create(chapter=self.chapter, title="Draft", order=3, status="DRAFT", is_active=True)
+
+    def counts(self, node, *fields):
+        node.refresh_from_db(fields=fields)
+        return tuple(getattr(node, field) for field in fields)
+
+    def video(self, topic, **kwargs):
+        return VideoResult.objects.create(
+            topic=topic, video_id=f"v{VideoResult.objects.count()}", title="V", url="https://example.com/v", **kwargs
+        )
+
+    def test_creates_count_only_visible_nodes(self):
+        self.assertEqual(self.counts(self.course, "subject_count", "chapter_count", "topic_count"), (1, 1, 2))
+        self.assertEqual(self.counts(self.chapter, "topic_count"), (2,))
+
+    def test_topic_flip_and_video_approval_apply_deltas(self):
+        video = self.video(self.topics[0])
+        self.assertEqual(self.counts(self.course, "approved_video_count"), (0,))
+
+        video.approval_status = "APPROVED"
+        video.save()
+        self.assertEqual(self.counts(self.syllabus, "approved_video_count"), (1,))
+
+        topic = self.topics[0]
+        topic.status = "DRAFT"
+        topic.save()
+        self.assertEqual(self.counts(self.course, "topic_count", "approved_video_count"), (1, 0))
+
+        topic.status = "PUBLISHED"
+        topic.save()
+        video.delete()
+        self.assertEqual(self.counts(self.chapter, "topic_count", "approved_video_count"), (2, 0))
+
+    def test_cascade_recounts_course(self):
+        self.video(self.topics[1], approval_status="APPROVED")
+        self.chapter.is_active = False
+        self.chapter.save()
+
+        self.assertEqual(self.counts(self.course, "chapter_count", "topic_count", "approved_video_count"), (0, 0, 0))
+        self.assertEqual(self.counts(self.subject, "chapter_count"), (0,))
+
+    def test_moves_recount_old_and_new_ancestors(self):
+        other_course = Course.objects.create(title="Course B", grade="10", status="PUBLISHED", is_active=True)
+        other_subject = Subject.objects.create(course=other_course, name="Chemistry", order=1, status="PUBLISHED", is_active=True)
+        other_syllabus = Syllabus.objects.create(subject=other_subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        chapter_2 = Chapter.objects.create(syllabus=self.syllabus, title="C2", chapter_number=2, status="PUBLISHED", is_active=True)
+        self.video(self.topics[0], approval_status="APPROVED")
+
+        topic = self.topics[0]
+        topic.chapter = chapter_2
+        topic.save()
+        self.assertEqual(self.counts(self.chapter, "topic_count", "approved_video_count"), (1, 0))
+        self.assertEqual(self.counts(chapter_2, "topic_count", "approved_video_count"), (1, 1))
+        self.assertEqual(self.counts(self.course, "topic_count", "approved_video_count"), (2, 1))
+
+        chapter_2.syllabus = other_syllabus
+        chapter_2.save()
+        self.assertEqual(self.counts(self.course, "chapter_count", "topic_count", "approved_video_count"), (1, 1, 0))
+        self.assertEqual(self.counts(other_subject, "chapter_count", "topic_count", "approved_video_count"), (1, 1, 1))
+        self.assertEqual(self.counts(other_course, "chapter_count", "topic_count", "approved_video_count"), (1, 1, 1))
+
+    def test_public_course_list_reads_counters_without_extra_queries(self):
+        with self.assertNumQueries(1):
+            data = self.client.get("/api/auth/courses/").json()
+        self.assertEqual((data[0]["chapter_count"], data[0]["topic_count"]), (1, 2))
+
+    def test_recount_command_repairs_drift(self):
+        Course.objects.update(topic_count=99)
+        Chapter.objects.update(topic_count=0)
+        call_command("recount_content_counters", stdout=StringIO())
+        self.assertEqual(self.counts(self.course, "topic_count"), (2,))
+        self.assertEqual(self.counts(self.chapter, "topic_count"), (2,))
@@ -0,0 +1,59 @@
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services.search import search_backend
+
+
+class ContentSearchTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="Electricity", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.ohm = Topic.objects.create(chapter=self.chapter, title="Ohm's law", order=1, status="PUBLISHED", is_active=True)
+        self.power = Topic.objects.create(
+            chapter=self.chapter, title="Electric power", order=2, notes="Relates to Ohm's law",
+            status="PUBLISHED", is_active=True,
+        )
+
+    def _search(self, q):
+        response = self.client.get("/api/auth/search/", {"q": q})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data["results"]
+
+    def test_uses_fts5_on_sqlite(self):
+        self.assertEqual(search_backend(), "fts5")
+
+    def test_title_hits_rank_above_notes_hits_and_carry_breadcrumbs(self):
+        results = self._search("ohm law")
+
+        self.assertEqual([(hit["type"], hit["id"]) for hit in results], [("topic", self.ohm.id), ("topic", self.power.id)])
+        self.assertEqual(
+            [crumb["type"] for crumb in results[0]["breadcrumb"]],
+            ["course", "subject", "syllabus", "chapter"],
+        )
+        self.assertEqual(results[0]["breadcrumb"][-1]["title"], "Electricity")
+
+    def test_prefix_matches_chapters_and_subjects(self):
+        types = {hit["type"] for hit in self._search("electr")}
+        self.assertEqual(types, {"chapter", "topic"})
+        self.assertEqual(self._search("phys")[0]["type"], "subject")
+
+    def test_index_follows_saves_and_deletes(self):
+        self.ohm.title = "Resistance"
+        self.ohm.save()
+        self.assertEqual([hit["id"] for hit in self._search("resistance")], [self.ohm.id])
+
+        self.ohm.delete()
+        self.assertEqual(self._search("resistance"), [])
+
+    def test_hidden_content_is_not_returned(self):
+        self.chapter.status = "DRAFT"
+        self.chapter.save()
+        self.assertEqual(self._search("ohm"), [])
+
+    def test_query_is_required(self):
+        self.assertEqual(self.client.get("/api/auth/search/").status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,78 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, override_settings
+
+from api.parsers import get_keywords_from_file
+from authentication.services import file_parser
+from authentication.services.extraction_cache import get_extracted_text, get_parsed_structure, remember_extracted_text
+from authentication.services.file_parser import extract_text_from_uploaded_file, parse_syllabus_text
+from tests.test_pdf_extraction import make_pdf
+
+
+class ExtractionCacheTest(SimpleTestCase):
+    def setUp(self):
+        caches["extraction"].clear()
+        self.pdf = make_pdf(["Chapter 1 Motion", "- Speed", "- Velocity"])
+
+    def upload(self, name="syllabus.pdf"):
+        return SimpleUploadedFile(name, self.pdf, content_type="application/pdf")
+
+    def test_repeat_upload_skips_extraction(self):
+        with patch.object(file_parser, "extract_document_text", wraps=file_parser.extract_document_text) as extract:
+            first = extract_text_from_uploaded_file(self.upload())
+            progress = []
+            second = extract_text_from_uploaded_file(
+                self.upload("again.pdf"), progress=lambda done, total: progress.append((done, total))
+            )
+
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertEqual(progress, [(3, 3)])
+
+    def test_extractor_version_is_part_of_the_key(self):
+        with patch.object(file_parser, "extract_document_text", wraps=file_parser.extract_document_text) as extract:
+            extract_text_from_uploaded_file(self.upload())
+            with patch("authentication.services.extraction_cache.EXTRACTOR_VERSION", -1):
+                extract_text_from_uploaded_file(self.upload())
+
+        self.assertEqual(extract.call_count, 2)
+
+    def test_parsed_structure_is_cached_by_text(self):
+        text = extract_text_from_uploaded_file(self.upload())
+        with patch.object(file_parser, "_parse_syllabus_lines", wraps=file_parser._parse_syllabus_lines) as parse:
+            first = parse_syllabus_text(text)
+            second = parse_syllabus_text(text)
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(first, [{"chapter_number": 1, "title": "Chapter 1 Motion", "topics": ["Speed", "Velocity"]}])
+        self.assertEqual(first, second)
+
+    def test_keyword_extraction_is_cached_by_file_hash(self):
+        handle, path = tempfile.mkstemp(suffix=".pdf")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "wb") as pdf_file:
+            pdf_file.write(self.pdf)
+
+        with patch("api.parsers.extract_document_text", wraps=file_parser.extract_document_text) as extract:
+            first = get_keywords_from_file(path)
+            second = get_keywords_from_file(path)
+
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(first, second)
+
+    @override_settings(EXTRACTION_CACHE_MAX_ITEM_BYTES=100)
+    def test_item_limit_counts_utf8_bytes(self):
+        # 60 characters, 180 bytes in UTF-8.
+        text = "अध्याय" * 10
+        remember_extracted_text("pdf", "multibyte", text)
+        remember_extracted_text("pdf", "ascii", "a" * 100)
+
+        self.assertIsNone(get_extracted_text("pdf", "multibyte"))
+        self.assertEqual(get_extracted_text("pdf", "ascii")["text"], "a" * 100)
+
+        parse_syllabus_text(f"1. {text}")
+        self.assertIsNone(get_parsed_structure(file_parser.content_digest(f"1. {text}")))
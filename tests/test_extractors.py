@@ -0,0 +1,80 @@
+import io
+import os
+import tempfile
+
+import docx
+import openpyxl
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase
+
+from authentication.services import extractors
+from authentication.services.extractors import extract_document_text, iter_document_text, register_extractor
+from authentication.services.file_parser import extract_text_from_uploaded_file, validate_upload
+from tests.test_pdf_extraction import make_pdf
+
+
+def make_docx():
+    document = docx.Document()
+    document.add_paragraph("Chapter 1 Motion")
+    document.add_paragraph("- Speed")
+    table = document.add_table(rows=1, cols=3)
+    table.rows[0].cells[0].text = "Velocity"
+    table.rows[0].cells[2].text = "Acceleration"
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_xlsx():
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["Chapter 1", "Motion"])
+    workbook.create_sheet("Topics").append(["Speed", None, 12])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+class ExtractorRegistryTest(SimpleTestCase):
+    def setUp(self):
+        caches["extraction"].clear()
+
+    def test_each_format_yields_text_in_document_order(self):
+        cases = {
+            "notes.pdf": (make_pdf(["Chapter 1", "Speed"]), ["Chapter 1", "Speed"]),
+            "notes.docx": (make_docx(), ["Chapter 1 Motion", "- Speed", "Velocity Acceleration"]),
+            "notes.xlsx": (make_xlsx(), ["Chapter 1 Motion", "Speed 12"]),
+            "notes.txt": (b"Chapter 1\r\n- Speed\n", ["Chapter 1", "- Speed"]),
+        }
+        for name, (content, expected) in cases.items():
+            with self.subTest(name=name):
+                progress = []
+                chunks = iter_document_text(
+                    SimpleUploadedFile(name, content), progress=lambda done, total: progress.append(total)
+                )
+                self.assertEqual(list(chunks), expected)
+                self.assertTrue(progress)
+
+    def test_paths_and_file_objects_give_the_same_text(self):
+        content = make_xlsx()
+        handle, path = tempfile.mkstemp(suffix=".xlsx")
+        self.addCleanup(os.remove, path)
+        with os.fdopen(handle, "wb") as xlsx_file:
+            xlsx_file.write(content)
+
+        self.assertEqual(extract_document_text(path), extract_document_text(SimpleUploadedFile("a.xlsx", content)))
+
+    def test_unknown_types_are_rejected_and_new_ones_can_be_registered(self):
+        with self.assertRaisesMessage(ValueError, "Unsupported file type: csv"):
+            extract_document_text(SimpleUploadedFile("rows.csv", b"a,b"))
+        with self.assertRaisesMessage(ValueError, "Allowed: DOC, DOCX, PDF, TXT, XLSX"):
+            validate_upload(SimpleUploadedFile("rows.csv", b"a,b"))
+
+        self.addCleanup(extractors.EXTRACTORS.pop, "csv")
+
+        @register_extractor("csv")
+        def extract_csv(source, progress=None):
+            for line in source:
+                yield line.decode().replace(",", " ").strip()
+
+        self.assertEqual(extract_text_from_uploaded_file(SimpleUploadedFile("rows.csv", b"a,b\nc,d")), "a b\nc d")
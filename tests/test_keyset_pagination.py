@@ -0,0 +1,79 @@
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+
+
+class KeysetPaginationTest(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        subject = Subject.objects.create(course=course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        syllabus = Syllabus.objects.create(subject=subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, status="PUBLISHED", is_active=True)
+
+    def _walk(self, url):
+        ids, pages = [], 0
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item["id"] for item in response.data["results"])
+            url = response.data["next"]
+            pages += 1
+        return ids, pages
+
+    def test_unpaginated_listing_is_unchanged(self):
+        response = self.client.get("/api/auth/admin/courses/")
+        self.assertIsInstance(response.data, list)
+
+    def test_walks_every_row_once_with_ties_in_ordering_key(self):
+        for index in range(6):
+            Course.objects.create(title="Same title", grade="10")
+
+        ids, pages = self._walk("/api/auth/admin/courses/?page_size=2")
+
+        expected = list(Course.objects.order_by("grade", "title", "id").values_list("id", flat=True))
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 4)
+
+    def test_descending_datetime_ordering(self):
+        for index in range(5):
+            VideoResult.objects.create(topic=self.topic, video_id=f"v{index}", title=f"V{index}", url="https://example.com")
+
+        ids, _ = self._walk("/api/auth/admin/videos/?page_size=2")
+
+        self.assertEqual(ids, list(VideoResult.objects.order_by("-created_at", "-id").values_list("id", flat=True)))
+
+    def test_approved_videos_paginate_beyond_the_default_limit(self):
+        for index in range(5):
+            VideoResult.objects.create(
+                topic=self.topic, video_id=f"a{index}", title=f"A{index}", url="https://example.com", approval_status="APPROVED"
+            )
+        VideoResult.objects.create(topic=self.topic, video_id="p", title="P", url="https://example.com")
+
+        ids, pages = self._walk("/api/auth/admin/approved-videos/?page_size=2")
+
+        approved = VideoResult.objects.filter(approval_status="APPROVED").order_by("-id")
+        self.assertEqual(ids, list(approved.values_list("id", flat=True)))
+        self.assertEqual(pages, 3)
+        self.assertIsInstance(self.client.get("/api/auth/admin/approved-videos/").data, list)
+
+    def test_filters_are_kept_across_pages(self):
+        for order in range(2, 6):
+            Topic.objects.create(chapter=self.chapter, title=f"T{order}", order=order)
+        other = Chapter.objects.create(syllabus=self.chapter.syllabus, title="C2", chapter_number=2)
+        Topic.objects.create(chapter=other, title="Elsewhere", order=1)
+
+        ids, _ = self._walk(f"/api/auth/admin/topics/?chapter_id={self.chapter.id}&page_size=2")
+
+        self.assertEqual(ids, list(self.chapter.topics.order_by("order").values_list("id", flat=True)))
+
+    def test_invalid_cursor_and_page_size_are_rejected(self):
+        self.assertEqual(self.client.get("/api/auth/admin/courses/?cursor=not-a-cursor").status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get("/api/auth/admin/courses/?page_size=abc").status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,84 @@
+import multiprocessing
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from authentication.services import pdf_extraction
+from authentication.services.pdf_extraction import extract_pdf_pages, extract_pdf_text, page_ranges
+
+
+def make_pdf(page_texts):
+    """Minimal PDF with one line of Helvetica text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in page_texts:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    body, offsets = b"%PDF-1.4\n", []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(body))
+        body += f"{number} 0 obj\n{obj}\nendobj\n".encode()
+    xref = len(body)
+    body += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    body += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    body += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return body
+
+
+class PdfExtractionTest(SimpleTestCase):
+    def setUp(self):
+        self.texts = [f"Chapter {number}" for number in range(1, 21)]
+        self.pdf = make_pdf(self.texts)
+
+    def test_page_ranges_cover_every_page_in_order(self):
+        self.assertEqual(page_ranges(10, 3), [(0, 4), (4, 7), (7, 10)])
+        self.assertEqual(page_ranges(2, 8), [(0, 1), (1, 2)])
+
+    @override_settings(PDF_PARALLEL_MIN_PAGES=1)
+    def test_parallel_extraction_preserves_page_order(self):
+        progress = []
+        pages = extract_pdf_pages(self.pdf, workers=2, progress=lambda done, total: progress.append((done, total)))
+
+        self.assertEqual(pages, self.texts)
+        self.assertEqual(pages, extract_pdf_pages(self.pdf, workers=1))
+        self.assertEqual(progress[-1], (20, 20))
+
+    @override_settings(PDF_PARALLEL_MIN_PAGES=1)
+    def test_workers_receive_a_path_not_the_pdf_bytes(self):
+        apply_async = pdf_extraction.Pool.apply_async
+        with patch.object(pdf_extraction.Pool, "apply_async", autospec=True, side_effect=apply_async) as apply_async:
+            self.assertEqual(extract_pdf_pages(self.pdf, workers=2), self.texts)
+
+        sources = {call.args[2][0] for call in apply_async.call_args_list}
+        self.assertEqual(len(sources), 1)
+        self.assertIsInstance(sources.pop(), str)
+
+    @override_settings(PDF_PARALLEL_MIN_PAGES=1)
+    def test_daemonic_process_extracts_in_parallel(self):
+        # Celery prefork workers are daemonic; they must still fan out rather than fall back to serial.
+        def run(queue):
+            with patch.object(pdf_extraction, "page_ranges", wraps=page_ranges) as ranges:
+                queue.put((extract_pdf_pages(self.pdf, workers=2), ranges.called))
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(target=run, args=(queue,), daemon=True)
+        process.start()
+        pages, fanned_out = queue.get(timeout=60)
+        process.join()
+
+        self.assertEqual(pages, self.texts)
+        self.assertTrue(fanned_out)
+
+    def test_page_limit(self):
+        with self.assertRaisesMessage(ValueError, "PDF has 20 pages. Maximum is 5"):
+            extract_pdf_text(self.pdf, max_pages=5)
+        with override_settings(PDF_EXTRACTION_MAX_PAGES=20):
+            self.assertTrue(extract_pdf_text(self.pdf).startswith("Chapter 1\nChapter 2\n"))
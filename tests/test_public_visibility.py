@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services.visibility import refresh_public_visibility
+
+
+class PublicVisibilityFlagTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, status="PUBLISHED", is_active=True)
+        self.topics_url = f"/api/auth/chapters/{self.chapter.id}/topics/"
+
+    def _flags(self):
+        return [
+            model.objects.get(pk=obj.pk).is_publicly_visible
+            for model, obj in (
+                (Subject, self.subject),
+                (Syllabus, self.syllabus),
+                (Chapter, self.chapter),
+                (Topic, self.topic),
+            )
+        ]
+
+    def test_new_published_nodes_are_visible(self):
+        self.assertEqual(self._flags(), [True, True, True, True])
+        draft = Topic.objects.create(chapter=self.chapter, title="T2", order=2, status="DRAFT", is_active=True)
+        self.assertFalse(draft.is_publicly_visible)
+
+    def test_unpublishing_ancestor_hides_and_republishing_restores_descendants(self):
+        self.subject.status = "DRAFT"
+        self.subject.save()
+        self.assertEqual(self._flags(), [False, False, False, False])
+        self.assertEqual(self.client.get(self.topics_url).data, [])
+
+        self.subject.status = "PUBLISHED"
+        self.subject.save()
+        self.assertEqual(self._flags(), [True, True, True, True])
+        self.assertEqual(len(self.client.get(self.topics_url).data), 1)
+
+    def test_course_changes_propagate(self):
+        self.course.status = "DRAFT"
+        self.course.save()
+        self.assertEqual(self._flags(), [False, False, False, False])
+
+    def test_public_topic_listing_does_not_join_ancestors(self):
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.topics_url)
+        topic_sql = [q["sql"] for q in ctx.captured_queries if "authentication_topic" in q["sql"]]
+        self.assertEqual(len(topic_sql), 1)
+        # Only the chapter is joined, for chapter_title; visibility needs no ancestor tables.
+        for table in ("authentication_syllabus", "authentication_subject", "authentication_course"):
+            self.assertNotIn(table, topic_sql[0])
+
+    def test_refresh_repairs_stale_flags(self):
+        Topic.objects.filter(pk=self.topic.pk).update(is_publicly_visible=False)
+        self.assertEqual(refresh_public_visibility(), 1)
+        self.assertEqual(refresh_public_visibility(), 0)
+        self.assertTrue(Topic.objects.get(pk=self.topic.pk).is_publicly_visible)
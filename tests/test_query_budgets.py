@@ -0,0 +1,100 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, APITestCase
+from rest_framework.views import APIView
+
+from authentication.models import (
+    Chapter, Course, Subject, Syllabus, Task, TaskItem, TaskQuiz, TaskVideo, Topic, VideoResult,
+)
+from authentication.query_budget import QueryBudgetExceeded, query_budget, query_shape, repeated_query_shapes
+
+
+@override_settings(QUERY_BUDGET_MODE="raise")
+class EndpointQueryBudgetTest(APITestCase):
+    """Every budgeted listing stays within budget, and its query count does not grow with rows."""
+
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+        self.seed(3)
+
+    def seed(self, size):
+        base = Course.objects.count()
+        for n in range(base, base + size):
+            course = Course.objects.create(title=f"Course {n}", grade="10", status="PUBLISHED", is_active=True)
+            subject = Subject.objects.create(course=course, name=f"Physics {n}", order=1, status="PUBLISHED", is_active=True)
+            syllabus = Syllabus.objects.create(subject=subject, title=f"S{n}", academic_year="2025-26", status="PUBLISHED", is_active=True)
+            chapter = Chapter.objects.create(syllabus=syllabus, title=f"C{n}", chapter_number=1, status="PUBLISHED", is_active=True)
+            topic = Topic.objects.create(chapter=chapter, title=f"Ohm law {n}", order=1, status="PUBLISHED", is_active=True)
+            video = VideoResult.objects.create(
+                topic=topic, video_id=f"v{n}", title=f"V{n}", url="https://example.com/v", approval_status="APPROVED",
+            )
+            task = Task.objects.create(topic=topic, start_day=1, end_day=5, title=f"Task {n}")
+            item = TaskItem.objects.create(task=task, item_type="VIDEO", title="Watch", day_number=1)
+            TaskVideo.objects.create(task_item=item, video=video)
+            quiz = TaskItem.objects.create(task=task, item_type="QUIZ", title="Quiz", day_number=2)
+            TaskQuiz.objects.create(task_item=quiz, questions=[{"q": "?"}])
+        self.course, self.subject, self.syllabus, self.chapter, self.task = course, subject, syllabus, chapter, task
+
+    def endpoints(self):
+        return [
+            "/api/auth/admin/courses/",
+            "/api/auth/admin/syllabi/",
+            "/api/auth/admin/subjects/",
+            "/api/auth/admin/chapters/",
+            "/api/auth/admin/topics/",
+            "/api/auth/courses/",
+            f"/api/auth/courses/{self.course.id}/subjects/",
+            f"/api/auth/subjects/{self.subject.id}/syllabi/",
+            f"/api/auth/syllabi/{self.syllabus.id}/chapters/",
+            f"/api/auth/chapters/{self.chapter.id}/topics/",
+            f"/api/auth/courses/{self.course.id}/full-tree/",
+            f"/api/auth/courses/{self.course.slug}/full-tree/",
+            f"/api/auth/syllabi/{self.syllabus.id}/tree/",
+            "/api/auth/search/?q=ohm",
+            "/api/auth/admin/tasks/",
+            f"/api/auth/admin/tasks/{self.task.id}/",
+            "/api/auth/admin/approved-videos/",
+            "/api/auth/admin/videos/",
+        ]
+
+    def query_counts(self):
+        counts = []
+        for url in self.endpoints():
+            cache.clear()
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200, url)
+            counts.append(int(response["X-Query-Count"]))
+        return counts
+
+    def test_listings_stay_within_budget_and_constant(self):
+        small = self.query_counts()
+        self.seed(12)
+        self.assertEqual(self.query_counts(), small)
+
+    def test_per_row_queries_exceed_budget(self):
+        self.seed(3)
+
+        class PerRowView(APIView):
+            @query_budget(3)
+            def get(self, request):
+                return Response([topic.chapter.title for topic in Topic.objects.all()])
+
+        request = APIRequestFactory().get("/")
+        with self.assertRaises(QueryBudgetExceeded) as raised:
+            PerRowView.as_view()(request)
+        self.assertIn("N+1 suspect", str(raised.exception))
+
+
+class QueryShapeTest(SimpleTestCase):
+    def test_repeated_shapes_flag_per_row_queries(self):
+        queries = [f'SELECT "title" FROM "topic" WHERE "id" = {pk}' for pk in range(6)]
+        queries.append('SELECT * FROM "topic" WHERE "id" IN (%s, %s, %s)')
+        shapes = repeated_query_shapes(queries, threshold=5)
+        self.assertEqual(shapes, {'SELECT "title" FROM "topic" WHERE "id" = ?': 6})
+        self.assertEqual(query_shape('x IN (%s, %s)'), 'x IN (...)')
@@ -0,0 +1,83 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services.content_cache import get_course_version
+
+
+class ReorderTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topics = [
+            Topic.objects.create(chapter=self.chapter, title=f"T{n}", order=n * 1024, status="PUBLISHED", is_active=True)
+            for n in (1, 2, 3, 4)
+        ]
+
+    def titles(self):
+        return list(Topic.objects.filter(chapter=self.chapter).values_list("title", flat=True))
+
+    def move(self, topic, **position):
+        return self.client.post(f"/api/auth/admin/topics/{topic.id}/move/", position, format="json")
+
+    def test_move_to_top_writes_single_row(self):
+        version = get_course_version(self.course.id)
+        updated_at = {t.id: t.updated_at for t in self.topics}
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.move(self.topics[3], before=self.topics[0].id)
+            # The cached tree is only invalidated once the move has committed.
+            self.assertEqual(get_course_version(self.course.id), version)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["renumbered"])
+        self.assertEqual(self.titles(), ["T4", "T1", "T2", "T3"])
+        untouched = Topic.objects.exclude(id=self.topics[3].id)
+        self.assertTrue(all(t.updated_at == updated_at[t.id] for t in untouched))
+        self.assertNotEqual(get_course_version(self.course.id), version)
+
+    def test_exhausted_gap_renumbers_siblings(self):
+        Topic.objects.filter(id=self.topics[1].id).update(order=1025)
+
+        response = self.move(self.topics[3], after=self.topics[0].id)
+
+        self.assertTrue(response.data["renumbered"])
+        self.assertEqual(self.titles(), ["T1", "T4", "T2", "T3"])
+        orders = list(Topic.objects.filter(chapter=self.chapter).values_list("order", flat=True))
+        self.assertEqual(orders, [1024, 2048, 3072, 4096])
+
+    def test_dense_legacy_orders_are_spread_out(self):
+        for n, topic in enumerate(self.topics, start=1):
+            Topic.objects.filter(id=topic.id).update(order=n)
+
+        self.move(self.topics[0], after=self.topics[3].id)
+        self.move(self.topics[2], before=self.topics[1].id)
+
+        self.assertEqual(self.titles(), ["T3", "T2", "T4", "T1"])
+
+    def test_target_must_be_sibling(self):
+        other = Chapter.objects.create(syllabus=self.syllabus, title="C2", chapter_number=2, status="PUBLISHED", is_active=True)
+        stranger = Topic.objects.create(chapter=other, title="X", order=1, status="PUBLISHED", is_active=True)
+
+        self.assertEqual(self.move(self.topics[0], before=stranger.id).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.move(self.topics[0]).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_move_subject_splits_tied_orders(self):
+        chemistry = Subject.objects.create(course=self.course, name="Chemistry", order=1, status="PUBLISHED", is_active=True)
+        biology = Subject.objects.create(course=self.course, name="Biology", order=1, status="PUBLISHED", is_active=True)
+
+        response = self.client.post(f"/api/auth/admin/subjects/{biology.id}/move/", {"after": chemistry.id}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        names = list(Subject.objects.filter(course=self.course).values_list("name", flat=True))
+        self.assertEqual(names, ["Chemistry", "Biology", "Physics"])
@@ -0,0 +1,53 @@
+from django.test import TestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, allocate_unique_slugs
+
+
+class SlugAllocationTest(TestCase):
+    def setUp(self):
+        course = Course.objects.create(title="Course A", grade="10")
+        subject = Subject.objects.create(course=course, name="Physics", order=1)
+        syllabus = Syllabus.objects.create(subject=subject, title="S", academic_year="2025-26")
+        self.chapter = Chapter.objects.create(syllabus=syllabus, title="C1", chapter_number=1)
+
+    def test_colliding_batch_uses_one_prefix_query(self):
+        for _ in range(5):
+            Course.objects.create(title="Introduction", grade="10")
+
+        courses = [Course(title="Introduction", grade="10") for _ in range(20)]
+        courses.append(Course(title="Other", grade="10"))
+        with self.assertNumQueries(1):
+            slugs = allocate_unique_slugs(Course, [(course, course.title) for course in courses])
+
+        self.assertEqual(slugs[:3], ["introduction-6", "introduction-7", "introduction-8"])
+        self.assertEqual(slugs[-1], "other")
+        self.assertEqual(len(set(slugs)), len(slugs))
+        self.assertEqual([course.slug for course in courses], slugs)
+
+    def test_single_save_does_not_probe_each_collision(self):
+        for order in range(1, 6):
+            Topic.objects.create(chapter=self.chapter, title="Intro", order=order, slug=f"c1-1-intro{'' if order == 1 else f'-{order}'}")
+
+        topic = Topic(chapter=self.chapter, title="Intro", order=1)
+        with self.assertNumQueries(1):
+            allocate_unique_slugs(Topic, [(topic, topic.slug_source())])
+        self.assertEqual(topic.slug, "c1-1-intro-6")
+
+    def test_suffix_of_one_base_never_equals_another_base(self):
+        Course.objects.create(title="Intro", grade="10")
+        courses = [Course(title="Intro", grade="10"), Course(title="Intro 2", grade="10")]
+        self.assertEqual(allocate_unique_slugs(Course, [(c, c.title) for c in courses]), ["intro-2", "intro-2-2"])
+
+    def test_batch_mixing_bases_and_suffixed_titles_bulk_creates(self):
+        titles = ["Intro", "Intro", "Intro 2", "Intro 2", "Intro", "Intro 3"]
+        for ordered in (titles, titles[::-1]):
+            with self.subTest(titles=ordered):
+                courses = [Course(title=title, grade="10") for title in ordered]
+                slugs = allocate_unique_slugs(Course, [(course, course.title) for course in courses])
+
+                self.assertEqual(len(set(slugs)), len(slugs))
+                Course.objects.bulk_create(courses)
+
+    def test_existing_instance_keeps_its_own_slug(self):
+        course = Course.objects.create(title="Biology", grade="10")
+        self.assertEqual(allocate_unique_slugs(Course, [(course, course.title)]), ["biology"])
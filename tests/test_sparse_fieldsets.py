@@ -0,0 +1,69 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+
+
+class SparseFieldsetTest(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        subject = Subject.objects.create(course=course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        syllabus = Syllabus.objects.create(subject=subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(
+            chapter=self.chapter, title="T1", order=1, notes="long notes", attachments=[{"a": 1}],
+            status="PUBLISHED", is_active=True,
+        )
+
+    def _topic_select(self, url):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+        sql = [q["sql"] for q in ctx.captured_queries if 'FROM "authentication_topic"' in q["sql"]]
+        return response, sql[0]
+
+    def test_fields_trims_payload_and_columns(self):
+        response, sql = self._topic_select(f"/api/auth/chapters/{self.chapter.id}/topics/?fields=id,title,order")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, [{"id": self.topic.id, "title": "T1", "order": 1}])
+        self.assertNotIn('"notes"', sql)
+        self.assertNotIn('"attachments"', sql)
+        self.assertNotIn('"description"', sql)
+
+    def test_exclude_keeps_related_columns_needed_by_other_fields(self):
+        response, sql = self._topic_select(f"/api/auth/admin/topics/?exclude=notes,attachments,chapter")
+
+        item = response.data[0]
+        self.assertNotIn("notes", item)
+        self.assertNotIn("chapter", item)
+        self.assertEqual(item["chapter_title"], "C1")
+        self.assertIn('"chapter_id"', sql)
+        self.assertNotIn('"notes"', sql)
+
+    def test_video_list_can_drop_large_text_columns(self):
+        VideoResult.objects.create(topic=self.topic, video_id="v1", title="V1", url="https://example.com", description="x" * 1000)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/auth/admin/videos/?exclude=description,tags_from_video,context")
+        video_sql = [q["sql"] for q in ctx.captured_queries if 'FROM "authentication_videoresult"' in q["sql"]][0]
+
+        self.assertNotIn("description", response.data[0])
+        self.assertNotIn('"description"', video_sql)
+        self.assertNotIn('"tags_from_video"', video_sql)
+
+    def test_works_with_keyset_pagination(self):
+        response = self.client.get("/api/auth/admin/courses/?page_size=1&fields=id,grade_display")
+        self.assertEqual(response.data["results"], [{"id": Course.objects.get().id, "grade_display": "Class 10"}])
+
+    def test_unknown_field_is_rejected(self):
+        response = self.client.get("/api/auth/admin/topics/?fields=id,secret")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("secret", str(response.data["fields"]))
@@ -0,0 +1,58 @@
+import json
+
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+
+
+class StreamingVideoListTest(APITestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        course = Course.objects.create(title="Course A", grade="10")
+        subject = Subject.objects.create(course=course, name="Physics", order=1)
+        syllabus = Syllabus.objects.create(subject=subject, title="S", academic_year="2025-26")
+        chapter = Chapter.objects.create(syllabus=syllabus, title="C1", chapter_number=1)
+        topic = Topic.objects.create(chapter=chapter, title="T1", order=1)
+        for index in range(7):
+            VideoResult.objects.create(topic=topic, video_id=f"v{index}", title=f"Video “{index}”", url="https://example.com")
+
+    def _body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_json_stream_matches_regular_response(self):
+        regular = self.client.get("/api/auth/admin/videos/")
+        streamed = self.client.get("/api/auth/admin/videos/?stream=json")
+
+        self.assertTrue(streamed.streaming)
+        self.assertEqual(streamed["Content-Type"], "application/json")
+        self.assertEqual(json.loads(self._body(streamed)), regular.json())
+
+    def test_ndjson_stream_emits_one_row_per_line(self):
+        response = self.client.get("/api/auth/admin/videos/?stream=ndjson&fields=id,title,context")
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = self._body(response).decode().splitlines()
+        self.assertEqual(len(lines), 7)
+        first = json.loads(lines[0])
+        self.assertEqual(set(first), {"id", "title", "context"})
+        self.assertEqual(first["context"]["course_title"], "Course A")
+
+    def test_stream_reads_hierarchy_without_per_row_queries(self):
+        response = self.client.get("/api/auth/admin/videos/?stream=ndjson")
+        with self.assertNumQueries(1):
+            self._body(response)
+
+    def test_empty_stream_is_valid_json(self):
+        VideoResult.objects.all().delete()
+        response = self.client.get("/api/auth/admin/videos/?stream=json")
+        self.assertEqual(self._body(response), b"[]")
+
+    def test_unknown_stream_format_is_rejected(self):
+        response = self.client.get("/api/auth/admin/videos/?stream=xml")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
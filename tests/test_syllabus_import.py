@@ -5,7 +5,10 @@ from django.core.files.uploadedfile import SimpleUploadedFile
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from authentication.models import Course, Subject, Syllabus
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.query_budget import record_queries
+from authentication.services.content_cache import get_course_version
+from authentication.services.syllabus_service import import_syllabus_structure
 
 
 class SyllabusImportEndpointTest(APITestCase):
@@ -76,3 +79,65 @@ class SyllabusImportEndpointTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(before_count, after_count)
 
+
+
+class ImportSyllabusStructureTest(APITestCase):
+    def setUp(self):
+        self.course = Course.objects.create(title="Course B", grade="9", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(
+            course=self.course, name="Maths", order=1, status="PUBLISHED", is_active=True
+        )
+
+    def payload(self, chapters, topics):
+        return [
+            {"chapter_number": number, "title": f"Chapter {number}", "topics": [f"Topic {n}" for n in range(topics)]}
+            for number in range(1, chapters + 1)
+        ]
+
+    def run_import(self, title, payload, **kwargs):
+        with record_queries() as log:
+            result = import_syllabus_structure(
+                subject_id=self.subject.id, title=title, status="PUBLISHED", chapters_payload=payload, **kwargs
+            )
+        return result, len(log)
+
+    def test_query_count_is_batched(self):
+        _, small = self.run_import("Small", self.payload(2, 2))
+        result, large = self.run_import("Large", self.payload(40, 15), batch_size=1000)
+
+        # 640 rows: slug lookups and INSERTs are batched (SQLite also caps
+        # parameters per INSERT), instead of several queries per row.
+        self.assertLess(small, 25)
+        self.assertLess(large, 2 * small + 10)
+        self.assertEqual((result["chapters_created"], result["topics_created"]), (40, 600))
+        syllabus = result["syllabus"]
+        syllabus.refresh_from_db()
+        self.assertEqual((syllabus.chapter_count, syllabus.topic_count), (40, 600))
+        self.assertEqual(Topic.objects.filter(chapter__syllabus=syllabus, is_publicly_visible=True).count(), 600)
+
+    def test_course_version_is_bumped_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.run_import("Committed", self.payload(2, 2))
+        version = get_course_version(self.course.id)
+
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_course_version(self.course.id), version)
+
+    def test_dedupe_rules_and_slugs(self):
+        payload = [
+            {"chapter_number": 1, "title": "Motion", "topics": ["Speed", "speed ", "", "Velocity"]},
+            {"chapter_number": 1, "title": "Duplicate number", "topics": ["Ignored"]},
+            {"chapter_number": 0, "title": "No number", "topics": ["Ignored"]},
+            {"chapter_number": 2, "title": "Motion", "topics": ["Speed"]},
+        ]
+        result, _ = self.run_import("Physics Basics", payload)
+
+        self.assertEqual((result["chapters_created"], result["topics_created"]), (2, 3))
+        chapters = Chapter.objects.filter(syllabus=result["syllabus"]).order_by("chapter_number")
+        self.assertEqual([c.title for c in chapters], ["Motion", "Motion"])
+        self.assertEqual(len({c.slug for c in chapters}), 2)
+        self.assertEqual(
+            list(Topic.objects.filter(chapter=chapters[0]).order_by("order").values_list("title", "order")),
+            [("Speed", 1), ("Velocity", 2)],
+        )
@@ -0,0 +1,165 @@
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Course, Subject, Syllabus, SyllabusImportJob
+from authentication.services.syllabus_import import run_import_job
+
+
+PARSED = [
+    {"chapter_number": 1, "title": "Chapter 1", "topics": ["Topic 1", "Topic 2"]},
+    {"chapter_number": 2, "title": "Chapter 2", "topics": ["Topic 3"]},
+]
+
+
+def fake_extract(file_obj, progress=None):
+    for page in range(1, 26):
+        progress(page, 25)
+    return "mocked text"
+
+
+class SyllabusImportJobTest(APITestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+
+        user_model = get_user_model()
+        self.admin = user_model.objects.create_user(email="import-jobs@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(
+            course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True
+        )
+
+    def upload(self, name="syllabus.pdf", **fields):
+        data = {"file": SimpleUploadedFile(name, b"pdf-bytes"), "subject_id": self.subject.id, **fields}
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post("/api/auth/admin/syllabi/import-jobs/", data)
+
+    @patch("authentication.tasks.import_syllabus_task.delay")
+    def test_job_is_queued_only_after_commit(self, mock_delay):
+        mock_delay.return_value.id = "task-123"
+        data = {"file": SimpleUploadedFile("syllabus.pdf", b"pdf-bytes"), "subject_id": self.subject.id}
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post("/api/auth/admin/syllabi/import-jobs/", data)
+        mock_delay.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+        mock_delay.assert_called_once_with(response.data["job_id"])
+
+    @patch("authentication.services.syllabus_import.extract_text_from_uploaded_file")
+    @patch("authentication.tasks.import_syllabus_task.delay")
+    def test_a_claimed_job_is_not_run_again(self, mock_delay, mock_extract):
+        mock_delay.return_value.id = "task-123"
+        job_id = self.upload().data["job_id"]
+        SyllabusImportJob.objects.filter(pk=job_id).update(status="RUNNING")
+
+        self.assertIsNone(run_import_job(job_id))
+        mock_extract.assert_not_called()
+
+    @patch("authentication.tasks.import_syllabus_task.delay")
+    def test_upload_returns_202_and_queues_job(self, mock_delay):
+        mock_delay.return_value.id = "task-123"
+
+        response = self.upload(title="Queued Syllabus")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = SyllabusImportJob.objects.get(pk=response.data["job_id"])
+        mock_delay.assert_called_once_with(job.pk)
+        self.assertEqual(job.status, "QUEUED")
+        self.assertEqual(job.task_id, "task-123")
+        with job.upload.open("rb") as stored:
+            self.assertEqual(stored.read(), b"pdf-bytes")
+        self.assertEqual(job.options["title"], "Queued Syllabus")
+        self.assertTrue(response.data["status_url"].endswith(f"/admin/syllabi/import-jobs/{job.pk}/"))
+        self.assertFalse(Syllabus.objects.exists())
+
+    @patch("authentication.services.syllabus_import.parse_syllabus_text", return_value=PARSED)
+    @patch("authentication.services.syllabus_import.extract_text_from_uploaded_file", side_effect=fake_extract)
+    @patch("authentication.tasks.import_syllabus_task.delay")
+    def test_worker_records_progress_and_result(self, mock_delay, mock_extract, mock_parse):
+        mock_delay.return_value.id = "task-123"
+        job_id = self.upload(status="PUBLISHED").data["job_id"]
+
+        run_import_job(job_id)
+
+        response = self.client.get(f"/api/auth/admin/syllabi/import-jobs/{job_id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "SUCCEEDED")
+        self.assertEqual(response.data["phase"], "DONE")
+        self.assertEqual((response.data["pages_processed"], response.data["pages_total"]), (25, 25))
+        self.assertEqual((response.data["chapters_created"], response.data["topics_created"]), (2, 3))
+        syllabus = Syllabus.objects.get(pk=response.data["syllabus"])
+        self.assertEqual(syllabus.title, "syllabus")
+        self.assertFalse(SyllabusImportJob.objects.get(pk=job_id).upload)
+
+        # A job only runs once.
+        self.assertIsNone(run_import_job(job_id))
+
+    @patch("authentication.services.syllabus_import.extract_text_from_uploaded_file")
+    @patch("authentication.tasks.import_syllabus_task.delay", side_effect=ConnectionError("broker down"))
+    def test_failed_import_is_recorded_when_run_inline(self, mock_delay, mock_extract):
+        mock_extract.side_effect = ValueError("Could not extract readable text from the file")
+
+        response = self.upload()
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        job = SyllabusImportJob.objects.get(pk=response.data["job_id"])
+        self.assertEqual(job.status, "FAILED")
+        self.assertEqual(job.phase, "EXTRACTING")
+        self.assertEqual(job.error, "Could not extract readable text from the file")
+        self.assertFalse(Syllabus.objects.exists())
+
+    @patch("authentication.tasks.import_syllabus_task.delay")
+    def test_invalid_upload_is_rejected_before_queueing(self, mock_delay):
+        response = self.upload(name="syllabus.exe")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        mock_delay.assert_not_called()
+        self.assertFalse(SyllabusImportJob.objects.exists())
+
+
+@override_settings(UPLOAD_MAX_SIZE_BYTES=2048)
+class SpooledUploadTest(APITestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.admin = user_model.objects.create_user(email="spooled@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+
+    def import_file(self, content):
+        data = {"file": SimpleUploadedFile("syllabus.txt", content), "subject_id": self.subject.id}
+        return self.client.post("/api/auth/admin/syllabi/import/", data)
+
+    @patch("authentication.views.parse_syllabus_text", return_value=PARSED)
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_accepted_uploads_are_spooled_to_disk(self, mock_extract, mock_parse):
+        response = self.import_file(b"x" * 1024)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        uploaded_file = mock_extract.call_args.args[0]
+        self.assertTrue(hasattr(uploaded_file, "temporary_file_path"))
+
+    @patch("authentication.views.extract_text_from_uploaded_file")
+    def test_oversized_upload_is_refused_while_streaming(self, mock_extract):
+        response = self.import_file(b"x" * 4096)
+
+        self.assertEqual(response.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertTrue(response.data["error"].startswith("File too large"))
+        mock_extract.assert_not_called()
+        self.assertFalse(Syllabus.objects.exists())
@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.services import syllabus_preview
+from authentication.services.syllabus_preview import get_import_preview
+
+
+PARSED = [
+    {"chapter_number": 1, "title": "Motion", "topics": ["Speed", "Velocity", "speed"]},
+    {"chapter_number": 2, "title": "Force", "topics": ["Newton's Laws"]},
+]
+
+
+class SyllabusImportPreviewTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        user_model = get_user_model()
+        self.admin = user_model.objects.create_user(email="preview-admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+        self.client.force_authenticate(self.admin)
+
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(
+            course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True
+        )
+
+    def preview(self, **fields):
+        data = {"file": SimpleUploadedFile("syllabus.pdf", b"pdf-bytes"), "subject_id": self.subject.id, **fields}
+        return self.client.post("/api/auth/admin/syllabi/import/preview/", data)
+
+    def commit(self, token):
+        return self.client.post("/api/auth/admin/syllabi/import/commit/", {"token": token})
+
+    @patch("authentication.views.parse_syllabus_text", return_value=PARSED)
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_preview_writes_nothing_and_commit_imports_without_reextracting(self, mock_extract, mock_parse):
+        response = self.preview(title="Physics 2026", status="PUBLISHED")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data["chapter_count"], response.data["topic_count"]), (2, 3))
+        self.assertEqual(
+            response.data["chapters"][0], {"chapter_number": 1, "title": "Motion", "topics": ["Speed", "Velocity"]}
+        )
+        self.assertFalse(Syllabus.objects.exists())
+
+        committed = self.commit(response.data["token"])
+
+        self.assertEqual(committed.status_code, status.HTTP_201_CREATED)
+        self.assertEqual((committed.data["chapters_created"], committed.data["topics_created"]), (2, 3))
+        syllabus = Syllabus.objects.get(pk=committed.data["syllabus_id"])
+        self.assertEqual((syllabus.title, syllabus.status), ("Physics 2026", "PUBLISHED"))
+        self.assertEqual(Chapter.objects.filter(syllabus=syllabus).count(), 2)
+        self.assertEqual(Topic.objects.filter(chapter__syllabus=syllabus).count(), 3)
+        mock_extract.assert_called_once()
+
+        # A token is used once.
+        self.assertEqual(self.commit(response.data["token"]).status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("authentication.views.parse_syllabus_text", return_value=PARSED)
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_tokens_belong_to_the_admin_who_previewed(self, mock_extract, mock_parse):
+        token = self.preview().data["token"]
+        other_admin = get_user_model().objects.create_user(email="other-admin@test.com", password="pass1234")
+        other_admin.is_staff = True
+        other_admin.save()
+
+        self.client.force_authenticate(other_admin)
+        self.assertEqual(self.commit(token).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(self.commit("").status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(self.admin)
+        self.assertEqual(self.commit(token).status_code, status.HTTP_201_CREATED)
+
+    @patch("authentication.views.parse_syllabus_text", return_value=PARSED)
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_concurrent_commits_of_one_token_import_once(self, mock_extract, mock_parse):
+        token = self.preview().data["token"]
+        # Both requests of a double click read the preview before either claims the token.
+        preview = get_import_preview(token, self.admin)
+
+        with patch("authentication.views.get_import_preview", return_value=preview):
+            first = self.commit(token)
+            second = self.commit(token)
+
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(second.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Syllabus.objects.count(), 1)
+
+    @patch("authentication.views.parse_syllabus_text", return_value=PARSED)
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_failed_commit_keeps_the_token(self, mock_extract, mock_parse):
+        token = self.preview().data["token"]
+
+        with patch.object(syllabus_preview, "import_syllabus_structure", side_effect=ValueError("Subject not found")):
+            self.assertEqual(self.commit(token).status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.commit(token).status_code, status.HTTP_201_CREATED)
+
+    @patch("authentication.views.parse_syllabus_text", return_value=[])
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_preview_without_chapters_is_rejected(self, mock_extract, mock_parse):
+        response = self.preview()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "No valid chapters found to create")
@@ -0,0 +1,117 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, SyllabusArtifact, Topic
+from authentication.services.content_cache import get_course_version
+from authentication.services.publishing import publish_syllabus
+from authentication.views import CourseFullTreeView
+
+
+class SyllabusPublishTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = get_user_model().objects.create_user(email="admin@test.com", password="pass1234")
+        self.admin.is_staff = True
+        self.admin.save()
+
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="DRAFT", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, status="PUBLISHED", is_active=True)
+
+    def publish(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.post(f"/api/auth/admin/syllabi/{self.syllabus.id}/publish/")
+        self.client.force_authenticate(None)
+        return response
+
+    def test_publish_creates_versioned_artifact(self):
+        response = self.publish()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["version"], 1)
+        self.assertEqual((response.data["chapters"], response.data["topics"]), (1, 1))
+        self.syllabus.refresh_from_db()
+        self.assertEqual(self.syllabus.status, "PUBLISHED")
+
+        self.assertEqual(self.publish().data["version"], 2)
+        artifact = SyllabusArtifact.objects.get(syllabus=self.syllabus, version=1)
+        artifact.chapter_count = 5
+        with self.assertRaises(ValueError):
+            artifact.save()
+
+    def test_course_version_is_bumped_after_the_publish_commits(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_syllabus(self.syllabus, self.admin)
+
+        # A republish writes only the artifact; the bump waits for the commit.
+        version = get_course_version(self.course.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            publish_syllabus(self.syllabus, self.admin)
+            self.assertEqual(get_course_version(self.course.id), version)
+        self.assertNotEqual(get_course_version(self.course.id), version)
+
+    def test_public_endpoints_serve_artifact_until_republished(self):
+        self.assertEqual(self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/chapters/").json(), [])
+        self.publish()
+        live = self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/chapters/?page_size=10").json()["results"]
+        self.assertEqual(self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/chapters/").json(), live)
+
+        Topic.objects.filter(pk=self.topic.pk).update(title="Edited live")
+        Chapter.objects.create(syllabus=self.syllabus, title="C2", chapter_number=2, status="PUBLISHED", is_active=True)
+        cache.clear()
+
+        tree = self.client.get(f"/api/auth/courses/{self.course.id}/full-tree/").json()
+        chapters = tree["subjects"][0]["syllabi"][0]["chapters"]
+        self.assertEqual([c["title"] for c in chapters], ["C1"])
+        self.assertEqual(chapters[0]["topics"][0]["title"], "T1")
+        topics = self.client.get(f"/api/auth/chapters/{self.chapter.id}/topics/?fields=id,title").json()
+        self.assertEqual(topics, [{"id": self.topic.id, "title": "T1"}])
+        shallow = self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/tree/?depth=1").json()
+        self.assertNotIn("topics", shallow["chapters"][0])
+
+        self.publish()
+        syllabus_tree = self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/tree/").json()
+        self.assertEqual([c["title"] for c in syllabus_tree["chapters"]], ["C1", "C2"])
+        self.assertEqual(syllabus_tree["chapters"][0]["topics"][0]["title"], "Edited live")
+
+    def test_paginated_listings_and_serializer_builder_read_the_artifact(self):
+        Chapter.objects.create(syllabus=self.syllabus, title="C2", chapter_number=2, status="PUBLISHED", is_active=True)
+        self.publish()
+        full_tree = self.client.get(f"/api/auth/courses/{self.course.id}/full-tree/").content
+
+        Chapter.objects.filter(chapter_number=2).update(is_active=False, is_publicly_visible=False)
+        Topic.objects.filter(pk=self.topic.pk).update(title="Edited live")
+        cache.clear()
+
+        first = self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/chapters/?page_size=1").json()
+        second = self.client.get(first["next"]).json()
+        self.assertEqual([c["title"] for c in first["results"] + second["results"]], ["C1", "C2"])
+        self.assertIsNone(second["next"])
+        topics = self.client.get(f"/api/auth/chapters/{self.chapter.id}/topics/?page_size=5&fields=title").json()
+        self.assertEqual(topics["results"], [{"title": "T1"}])
+
+        CourseFullTreeView.tree_builder = "serializer"
+        try:
+            self.assertEqual(self.client.get(f"/api/auth/courses/{self.course.id}/full-tree/").content, full_tree)
+        finally:
+            CourseFullTreeView.tree_builder = "values"
+
+    def test_unpublished_syllabus_hides_artifact(self):
+        self.publish()
+        self.syllabus.refresh_from_db()
+        self.syllabus.status = "DRAFT"
+        self.syllabus.save()
+
+        self.assertEqual(self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/chapters/").json(), [])
+        response = self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/tree/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cannot_publish_under_unpublished_course(self):
+        self.course.status = "DRAFT"
+        self.course.save()
+        response = self.publish()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(SyllabusArtifact.objects.exists())
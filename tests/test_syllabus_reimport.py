@@ -0,0 +1,171 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic, VideoResult
+from authentication.services.content_cache import get_course_version
+from authentication.services.syllabus_service import import_syllabus_structure
+
+
+ORIGINAL = [
+    {"chapter_number": 1, "title": "Motion", "topics": ["Speed", "Velocity", "Acceleration"]},
+    {"chapter_number": 2, "title": "Force", "topics": ["Newton's laws", "Friction"]},
+    {"chapter_number": 3, "title": "Light", "topics": ["Reflection"]},
+]
+
+
+class SyllabusReimportTest(APITestCase):
+    def setUp(self):
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(
+            course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True
+        )
+        self.syllabus = self.run_import(ORIGINAL)["syllabus"]
+
+    def run_import(self, payload, mode="create"):
+        return import_syllabus_structure(
+            subject_id=self.subject.id, title="Physics 10", academic_year="2026-27",
+            status="PUBLISHED", chapters_payload=payload, mode=mode,
+        )
+
+    def topic(self, title):
+        return Topic.objects.get(chapter__syllabus=self.syllabus, title=title)
+
+    def test_merge_keeps_ids_of_matched_rows_and_applies_only_differences(self):
+        speed = self.topic("Speed")
+        Topic.objects.filter(pk=speed.pk).update(search_status="COMPLETED")
+        VideoResult.objects.create(topic=speed, video_id="v1", title="Speed video", url="https://example.com")
+        friction, reflection = self.topic("Friction"), self.topic("Reflection")
+        motion = Chapter.objects.get(syllabus=self.syllabus, title="Motion")
+
+        corrected = [
+            {"chapter_number": 1, "title": "Motion", "topics": ["Speed", "Acceleration", "Velocity"]},
+            {"chapter_number": 2, "title": "Gravitation", "topics": ["Free fall", "Friction"]},
+            {"chapter_number": 3, "title": "Optics", "topics": ["Reflection"]},
+            {"chapter_number": 4, "title": "Force", "topics": ["newton's  laws"]},
+        ]
+        result = self.run_import(corrected, mode="merge")
+
+        self.assertTrue(result["merged"])
+        self.assertEqual(result["syllabus"].pk, self.syllabus.pk)
+        self.assertEqual(
+            {key: value for key, value in result.items() if key.startswith("chapters_")},
+            {"chapters_created": 1, "chapters_updated": 2, "chapters_deactivated": 0, "chapters_unchanged": 1},
+        )
+        self.assertEqual(
+            {key: value for key, value in result.items() if key.startswith("topics_")},
+            {"topics_created": 1, "topics_updated": 4, "topics_deactivated": 0, "topics_unchanged": 2},
+        )
+
+        speed.refresh_from_db()
+        self.assertEqual((speed.order, speed.search_status, speed.videos.count()), (1, "COMPLETED", 1))
+        self.assertEqual(self.topic("Acceleration").order, 2)
+        self.assertEqual(Chapter.objects.get(pk=motion.pk).chapter_number, 1)
+        # "Light" matched by number and was renamed; "Force" matched by title and moved to 4.
+        reflection.refresh_from_db()
+        self.assertEqual((reflection.chapter.title, reflection.chapter.chapter_number), ("Optics", 3))
+        self.assertEqual(self.topic("newton's  laws").chapter.chapter_number, 4)
+        # A topic moved to another chapter keeps its id.
+        friction.refresh_from_db()
+        self.assertEqual((friction.chapter.title, friction.order), ("Gravitation", 2))
+
+        self.syllabus.refresh_from_db()
+        self.assertEqual((self.syllabus.chapter_count, self.syllabus.topic_count), (4, 7))
+        self.assertTrue(Topic.objects.get(title="Free fall").is_publicly_visible)
+
+    def test_merge_deactivates_missing_rows_and_reactivates_returning_ones(self):
+        velocity = self.topic("Velocity")
+        shortened = [
+            {"chapter_number": 1, "title": "Motion", "topics": ["Speed", "Acceleration"]},
+            {"chapter_number": 2, "title": "Force", "topics": ["Newton's laws", "Friction"]},
+        ]
+        result = self.run_import(shortened, mode="merge")
+
+        self.assertEqual((result["chapters_deactivated"], result["topics_deactivated"]), (1, 2))
+        velocity.refresh_from_db()
+        self.assertFalse(velocity.is_active)
+        self.assertFalse(Chapter.objects.get(syllabus=self.syllabus, title="Light").is_active)
+
+        restored = self.run_import(ORIGINAL, mode="merge")
+
+        self.assertEqual((restored["chapters_created"], restored["topics_created"]), (0, 0))
+        velocity.refresh_from_db()
+        self.assertEqual((velocity.is_active, velocity.order), (True, 2))
+        self.assertEqual(Topic.objects.filter(chapter__syllabus=self.syllabus, is_active=True).count(), 6)
+
+    def test_merge_into_inactive_syllabus_reactivates_it_with_its_children(self):
+        self.syllabus.is_active = False
+        self.syllabus.save()
+        self.assertFalse(self.topic("Speed").is_active)
+
+        self.run_import(ORIGINAL, mode="merge")
+
+        self.syllabus.refresh_from_db()
+        self.assertEqual((self.syllabus.is_active, self.syllabus.is_publicly_visible), (True, True))
+        self.assertTrue(self.topic("Speed").is_publicly_visible)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.topic_count, 6)
+
+    def test_merge_applies_uploaded_syllabus_fields(self):
+        import_syllabus_structure(
+            subject_id=self.subject.id, title="Physics 10", academic_year="2026-27", description="Revised",
+            status="DRAFT", is_active=False, chapters_payload=ORIGINAL, mode="merge",
+        )
+
+        self.syllabus.refresh_from_db()
+        self.assertEqual(
+            (self.syllabus.description, self.syllabus.status, self.syllabus.is_active), ("Revised", "DRAFT", False)
+        )
+        self.assertFalse(Topic.objects.filter(chapter__syllabus=self.syllabus, is_active=True).exists())
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.topic_count, 0)
+
+    def test_unchanged_file_writes_nothing(self):
+        before = dict(Topic.objects.filter(chapter__syllabus=self.syllabus).values_list("id", "updated_at"))
+        result = self.run_import(ORIGINAL, mode="merge")
+
+        self.assertEqual((result["chapters_unchanged"], result["topics_unchanged"]), (3, 6))
+        self.assertEqual(before, dict(Topic.objects.filter(chapter__syllabus=self.syllabus).values_list("id", "updated_at")))
+
+    def test_course_version_is_bumped_after_the_merge_commits(self):
+        version = get_course_version(self.course.id)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.run_import(ORIGINAL[:2], mode="merge")
+            self.assertEqual(get_course_version(self.course.id), version)
+
+        self.assertNotEqual(get_course_version(self.course.id), version)
+
+    def test_create_mode_still_rejects_duplicates(self):
+        with self.assertRaisesMessage(ValueError, "Could not create syllabus"):
+            self.run_import(ORIGINAL)
+
+
+class SyllabusReimportEndpointTest(APITestCase):
+    def setUp(self):
+        admin = get_user_model().objects.create_user(email="reimport-admin@test.com", password="pass1234")
+        admin.is_staff = True
+        admin.save()
+        self.client.force_authenticate(admin)
+        course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+
+    def post(self, **fields):
+        upload = SimpleUploadedFile("physics.pdf", b"pdf-bytes", content_type="application/pdf")
+        return self.client.post(
+            "/api/auth/admin/syllabi/import/", {"file": upload, "subject_id": self.subject.id, **fields}
+        )
+
+    @patch("authentication.views.parse_syllabus_text", return_value=ORIGINAL)
+    @patch("authentication.views.extract_text_from_uploaded_file", return_value="mocked text")
+    def test_merge_mode_returns_200_with_summary(self, mock_extract, mock_parse):
+        self.assertEqual(self.post().status_code, status.HTTP_201_CREATED)
+
+        response = self.post(mode="merge")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["topics_unchanged"], 6)
+        self.assertEqual(Syllabus.objects.count(), 1)
+        self.assertEqual(self.post(mode="replace").status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+from authentication.serializers import CourseFullTreeSerializer, SyllabusTreeSerializer
+from authentication.services.tree_builder import build_course_tree, build_syllabus_tree
+from authentication.views import CourseFullTreeView, _course_full_tree_queryset
+
+
+class ValuesTreeBuilderTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        published = {"status": "PUBLISHED", "is_active": True}
+        self.course = Course.objects.create(title="Course Ä", grade="10", board=None, **published)
+        Subject.objects.create(course=self.course, name="Empty", order=2, **published)
+        Subject.objects.create(course=self.course, name="Hidden", order=3, status="DRAFT")
+        subject = Subject.objects.create(course=self.course, name="Physics", order=1, icon="⚡", **published)
+        self.syllabus = Syllabus.objects.create(subject=subject, title="S", academic_year="2025-26", **published)
+        Syllabus.objects.create(subject=subject, title="Old", academic_year="2024-25", **published)
+        for number in (2, 1):
+            chapter = Chapter.objects.create(syllabus=self.syllabus, title=f"C{number}", chapter_number=number, **published)
+            for order in (3, 1, 2):
+                Topic.objects.create(
+                    chapter=chapter, title=f"T{order} “quoted”", order=order, notes="line\nbreak",
+                    attachments=[{"url": "https://example.com/a.pdf", "size": 12}], **published,
+                )
+        Topic.objects.create(chapter=chapter, title="Draft", order=9, status="DRAFT")
+
+    def _serializer_bytes(self, depth=None):
+        course = _course_full_tree_queryset(depth).get(id=self.course.id)
+        return JSONRenderer().render(CourseFullTreeSerializer(course, depth=depth).data)
+
+    def test_course_tree_bytes_match_serializers_at_every_depth(self):
+        for depth in (None, 0, 1, 2, 3):
+            with self.subTest(depth=depth):
+                self.assertEqual(JSONRenderer().render(build_course_tree(self.course.id, depth)), self._serializer_bytes(depth))
+
+    def test_syllabus_tree_bytes_match_serializer(self):
+        syllabus = Syllabus.objects.prefetch_related("chapters__topics").get(id=self.syllabus.id)
+        self.assertEqual(
+            JSONRenderer().render(build_syllabus_tree(self.syllabus.id, 1)),
+            JSONRenderer().render(SyllabusTreeSerializer(syllabus, depth=1).data),
+        )
+
+    def test_one_query_per_level(self):
+        with self.assertNumQueries(5):
+            build_course_tree(self.course.id)
+
+    def test_unpublished_course_returns_none(self):
+        self.course.status = "DRAFT"
+        self.course.save()
+        self.assertIsNone(build_course_tree(self.course.id))
+
+    def test_view_builders_render_identical_responses(self):
+        url = f"/api/auth/courses/{self.course.id}/full-tree/"
+        fast = self.client.get(url).content
+        cache.clear()
+        CourseFullTreeView.tree_builder = "serializer"
+        try:
+            slow = self.client.get(url).content
+        finally:
+            CourseFullTreeView.tree_builder = "values"
+        self.assertEqual(fast, slow)
@@ -0,0 +1,64 @@
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+
+
+class CourseTreeSnapshotCacheTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, status="PUBLISHED", is_active=True)
+        self.url = f"/api/auth/courses/{self.course.id}/full-tree/"
+
+    def test_repeat_reads_do_not_touch_the_database(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second["Content-Type"], "application/json")
+
+    def test_slug_reads_are_served_from_cache(self):
+        self.client.get(f"/api/auth/courses/{self.course.slug}/full-tree/")
+        with self.assertNumQueries(0):
+            resp = self.client.get(f"/api/auth/courses/{self.course.slug}/full-tree/")
+        self.assertEqual(resp.data["id"], self.course.id)
+
+    def test_saving_any_level_invalidates_snapshot(self):
+        self.client.get(self.url)
+
+        self.topic.title = "Renamed topic"
+        self.topic.save()
+        topic_titles = self.client.get(self.url).data["subjects"][0]["syllabi"][0]["chapters"][0]["topics"]
+        self.assertEqual(topic_titles[0]["title"], "Renamed topic")
+
+        self.subject.name = "Renamed subject"
+        self.subject.save()
+        self.assertEqual(self.client.get(self.url).data["subjects"][0]["name"], "Renamed subject")
+
+    def test_moving_node_invalidates_previous_course(self):
+        other = Course.objects.create(title="Course B", grade="10", status="PUBLISHED", is_active=True)
+        self.client.get(self.url)
+
+        self.subject.course = other
+        self.subject.save()
+
+        self.assertEqual(self.client.get(self.url).data["subjects"], [])
+
+    def test_unpublished_course_is_not_served_from_stale_snapshot(self):
+        self.client.get(self.url)
+
+        self.course.status = "DRAFT"
+        self.course.save()
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(
+            self.client.get(f"/api/auth/courses/{self.course.slug}/full-tree/").status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
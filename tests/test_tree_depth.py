@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from authentication.models import Chapter, Course, Subject, Syllabus, Topic
+
+
+class TreeDepthTest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.course = Course.objects.create(title="Course A", grade="10", status="PUBLISHED", is_active=True)
+        self.subject = Subject.objects.create(course=self.course, name="Physics", order=1, status="PUBLISHED", is_active=True)
+        self.syllabus = Syllabus.objects.create(subject=self.subject, title="S", academic_year="2025-26", status="PUBLISHED", is_active=True)
+        self.chapter = Chapter.objects.create(syllabus=self.syllabus, title="C1", chapter_number=1, status="PUBLISHED", is_active=True)
+        self.topic = Topic.objects.create(chapter=self.chapter, title="T1", order=1, notes="n", status="PUBLISHED", is_active=True)
+        self.url = f"/api/auth/courses/{self.course.id}/full-tree/"
+
+    def test_depth_cuts_tree_and_prefetch_chain(self):
+        # course + subjects only
+        with self.assertNumQueries(2):
+            data = self.client.get(f"{self.url}?depth=1").data
+        self.assertEqual(data["subjects"][0]["name"], "Physics")
+        self.assertNotIn("syllabi", data["subjects"][0])
+
+        self.assertNotIn("subjects", self.client.get(f"{self.url}?depth=0").data)
+
+    def test_expand_matches_equivalent_depth(self):
+        by_expand = self.client.get(f"{self.url}?expand=subjects.syllabi")
+        by_depth = self.client.get(f"{self.url}?depth=2")
+        self.assertEqual(by_expand.content, by_depth.content)
+        self.assertNotIn("chapters", by_expand.data["subjects"][0]["syllabi"][0])
+
+    def test_full_depth_is_the_default_tree(self):
+        self.assertEqual(self.client.get(f"{self.url}?depth=4").content, self.client.get(self.url).content)
+
+    def test_invalid_depth_and_expand_are_rejected(self):
+        for query in ("depth=9", "depth=x", "expand=syllabi", "depth=1&expand=subjects"):
+            self.assertEqual(self.client.get(f"{self.url}?{query}").status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    def test_syllabus_subtree_is_cached_and_invalidated(self):
+        url = f"/api/auth/syllabi/{self.syllabus.id}/tree/"
+        data = self.client.get(url).data
+        self.assertEqual(data["chapters"][0]["topics"][0]["title"], "T1")
+        self.assertNotIn("topics", self.client.get(f"{url}?depth=1").data["chapters"][0])
+
+        with self.assertNumQueries(2):
+            self.client.get(url)
+
+        self.topic.title = "Renamed"
+        self.topic.save()
+        self.assertEqual(self.client.get(url).data["chapters"][0]["topics"][0]["title"], "Renamed")
+
+    def test_hidden_syllabus_subtree_is_not_found(self):
+        self.subject.status = "DRAFT"
+        self.subject.save()
+        response = self.client.get(f"/api/auth/syllabi/{self.syllabus.id}/tree/")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)